@@ -87,6 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.registry import LazyRegistryEntries
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -453,7 +454,10 @@ async def async_from_config_dict(
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
-    await loader.async_get_custom_components(hass)
+    await asyncio.gather(
+        create_eager_task(loader.async_get_custom_components(hass)),
+        create_eager_task(loader.async_load_manifest_cache(hass)),
+    )
     await async_load_base_functionality(hass)
 
     # Set up core.
@@ -923,9 +927,18 @@ async def _async_resolve_domains_to_setup(
 
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
+    # and start importing the integrations which can be imported.
     # We do not wait for this since its an optimization only
     hass.async_create_background_task(
-        requirements.async_load_installed_versions(hass, needed_requirements),
+        _async_import_installed_integrations(
+            hass,
+            needed_requirements,
+            {
+                domain: integration_cache[domain]
+                for domain in domains_to_setup
+                if domain in integration_cache
+            },
+        ),
         "check installed requirements",
         eager_start=True,
     )
@@ -965,6 +978,35 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_import_installed_integrations(
+    hass: core.HomeAssistant,
+    needed_requirements: set[str],
+    integrations: dict[str, loader.Integration],
+) -> None:
+    """Check the installed requirements and import the integrations.
+
+    The integrations are imported in the order of their dependencies instead
+    of stage by stage when they are set up. Integrations which depend on
+    requirements which are not installed yet are imported when they are set
+    up, after their requirements are processed.
+    """
+    await requirements.async_load_installed_versions(hass, needed_requirements)
+    installed = {
+        domain
+        for domain, itg in integrations.items()
+        if requirements.async_requirements_installed(hass, itg.requirements)
+    }
+    to_import: dict[str, loader.Integration] = {}
+    for domain in installed:
+        try:
+            all_deps = integrations[domain].all_dependencies
+        except RuntimeError:
+            continue
+        if installed.issuperset(all_deps & integrations.keys()):
+            to_import[domain] = integrations[domain]
+    await loader.async_import_integrations(hass, to_import)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -1074,3 +1116,33 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        if manifest_cache := hass.data.get(loader.DATA_MANIFEST_CACHE):
+            _LOGGER.debug(
+                "Manifests resolved from the cache: %s, from disk: %s",
+                manifest_cache.hits,
+                manifest_cache.misses,
+            )
+        _async_log_lazy_registry_entries(hass)
+
+
+@core.callback
+def _async_log_lazy_registry_entries(hass: core.HomeAssistant) -> None:
+    """Log the time saved by creating registry entries on first access."""
+    if DATA_REGISTRIES_LOADED not in hass.data:
+        return
+    for name, entries in (
+        ("Entity", entity_registry.async_get(hass).entities.data),
+        ("Device", device_registry.async_get(hass).devices.data),
+    ):
+        if not isinstance(entries, LazyRegistryEntries) or not entries.created:
+            continue
+        per_entry = entries.create_time / entries.created
+        _LOGGER.debug(
+            "%s registry entries created on first access: %s in %.3fs, "
+            "%s not used yet, estimated %.3fs saved while loading the registry",
+            name,
+            entries.created,
+            entries.create_time,
+            entries.pending,
+            per_entry * (entries.created + entries.pending),
+        )
@@ -1,5 +1,7 @@
 """The Backup integration."""
 
+import voluptuous as vol
+
 from homeassistant.components.hassio import is_hassio
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
@@ -12,6 +14,10 @@ from .websocket import async_register_websocket_handlers
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+SERVICE_CREATE_SCHEMA = vol.Schema(
+    {vol.Optional("incremental", default=False): cv.boolean}
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Backup integration."""
@@ -32,9 +38,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def async_handle_create_service(call: ServiceCall) -> None:
         """Service handler for creating backups."""
-        await backup_manager.generate_backup()
+        await backup_manager.generate_backup(incremental=call.data["incremental"])
 
-    hass.services.async_register(DOMAIN, "create", async_handle_create_service)
+    hass.services.async_register(
+        DOMAIN, "create", async_handle_create_service, schema=SERVICE_CREATE_SCHEMA
+    )
 
     async_register_http_views(hass)
 
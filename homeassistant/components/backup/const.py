@@ -14,6 +14,9 @@ DOMAIN = "backup"
 DATA_MANAGER: HassKey[BackupManager] = HassKey(DOMAIN)
 LOGGER = getLogger(__package__)
 
+# The manifests of the incremental backups and their chunk store
+INCREMENTAL_DIR = "incremental"
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
@@ -21,6 +24,7 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    f"backups/{INCREMENTAL_DIR}/*",
     "OZW_Log.txt",
     "tts/*",
 ]
@@ -42,8 +42,9 @@ class DownloadBackupView(HomeAssistantView):
         if backup is None or not backup.path.exists():
             return Response(status=HTTPStatus.NOT_FOUND)
 
+        path = await manager.async_export_backup(backup)
         return FileResponse(
-            path=backup.path.as_posix(),
+            path=path.as_posix(),
             headers={
                 CONTENT_DISPOSITION: f"attachment; filename={slugify(backup.name)}.tar"
             },
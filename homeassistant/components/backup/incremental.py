@@ -0,0 +1,272 @@
+"""Incremental backups stored in a content-addressed chunk store."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import partial
+import hashlib
+import io
+import os
+from pathlib import Path, PurePath
+import tarfile
+import time
+from typing import Any, cast
+import zlib
+
+from securetar import SecureTarFile
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads_object
+
+from .const import LOGGER
+
+# Files are split in chunks of this size. SQLite databases are written in
+# place one page at a time, so the unchanged chunks of a database keep
+# their offset and are shared between backups.
+CHUNK_SIZE = 2**20  # 1MB
+# New chunks are compressed with a fast level, most of the data of
+# later backups is already in the store
+CHUNK_COMPRESS_LEVEL = 1
+BUF_SIZE = 2**20 * 4  # 4MB
+
+
+class ChunkStore:
+    """Store chunks of files on disk by the SHA-256 hash of their content."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the chunk store."""
+        self.path = path
+        self._digests: set[str] | None = None
+
+    def _chunk_path(self, digest: str) -> Path:
+        """Return the path of a chunk."""
+        return self.path / digest[:2] / digest
+
+    def _load_digests(self) -> set[str]:
+        """Return the digests of the stored chunks."""
+        if self._digests is None:
+            self._digests = (
+                {chunk.name for chunk in self.path.glob("*/*") if chunk.is_file()}
+                if self.path.exists()
+                else set()
+            )
+        return self._digests
+
+    def add(self, data: bytes) -> tuple[str, int]:
+        """Add a chunk if it is not stored yet.
+
+        Return the digest of the chunk and the number of bytes written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        digests = self._load_digests()
+        if digest in digests:
+            return digest, 0
+        chunk_path = self._chunk_path(digest)
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(data, CHUNK_COMPRESS_LEVEL)
+        # A chunk is only known by its digest once it was completely written
+        temp_path = chunk_path.with_suffix(".tmp")
+        temp_path.write_bytes(compressed)
+        os.replace(temp_path, chunk_path)
+        digests.add(digest)
+        return digest, len(compressed)
+
+    def has(self, digest: str) -> bool:
+        """Return if a chunk is stored."""
+        return digest in self._load_digests()
+
+    def size(self, digest: str) -> int:
+        """Return the number of bytes used by a stored chunk."""
+        return self._chunk_path(digest).stat().st_size
+
+    def read(self, digest: str) -> bytes:
+        """Read a chunk."""
+        return zlib.decompress(self._chunk_path(digest).read_bytes())
+
+    def remove_unreferenced(self, referenced: set[str]) -> int:
+        """Remove the chunks which are not referenced and return their number."""
+        digests = self._load_digests()
+        removed = digests - referenced
+        for digest in removed:
+            self._chunk_path(digest).unlink(missing_ok=True)
+        digests.difference_update(removed)
+        return len(removed)
+
+
+class _ChunkReader:
+    """Read the content of a file from its chunks."""
+
+    def __init__(self, store: ChunkStore, chunks: list[str]) -> None:
+        """Initialize the reader."""
+        self._store = store
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read size bytes, or less at the end of the file."""
+        parts: list[bytes] = []
+        while size:
+            if self._pos == len(self._buffer):
+                if (digest := next(self._chunks, None)) is None:
+                    break
+                self._buffer = self._store.read(digest)
+                self._pos = 0
+            end = len(self._buffer)
+            if size > 0:
+                end = min(end, self._pos + size)
+                size -= end - self._pos
+            parts.append(self._buffer[self._pos : end])
+            self._pos = end
+        return b"".join(parts)
+
+
+def _is_excluded(path: PurePath, excludes: list[str]) -> bool:
+    """Return if a path matches one of the excludes of the backup."""
+    return any(path.match(exclude) for exclude in excludes)
+
+
+def _walk(
+    origin: Path, excludes: list[str], arcname: str
+) -> Iterator[tuple[Path, str]]:
+    """Yield the paths to back up like securetar.atomic_contents_add does."""
+    yield origin, arcname
+    for item in sorted(origin.iterdir()):
+        if _is_excluded(item, excludes):
+            continue
+        item_arcname = PurePath(arcname, item.name).as_posix()
+        if item.is_dir() and not item.is_symlink():
+            yield from _walk(item, excludes, item_arcname)
+        else:
+            yield item, item_arcname
+
+
+def read_manifest(manifest_path: Path) -> dict[str, Any]:
+    """Read the manifest of an incremental backup."""
+    return json_loads_object(manifest_path.read_bytes())
+
+
+def manifest_chunks(manifest: dict[str, Any]) -> set[str]:
+    """Return the digests of the chunks referenced by a manifest."""
+    return {
+        digest
+        for entry in cast(list[dict[str, Any]], manifest["entries"])
+        for digest in entry.get("chunks", ())
+    }
+
+
+def generate_incremental_backup(
+    origin: Path,
+    excludes: list[str],
+    store: ChunkStore,
+    manifest_path: Path,
+    backup_data: dict[str, Any],
+    previous_manifest: dict[str, Any] | None,
+) -> int:
+    """Add the changed chunks of the files to the store and write a manifest.
+
+    Files with the same size and modification time as in the previous
+    backup reuse its chunks without being read. Return the number of
+    bytes of the chunks the backup references.
+    """
+    previous_files: dict[str, dict[str, Any]] = {}
+    if previous_manifest:
+        previous_files = {
+            entry["name"]: entry
+            for entry in previous_manifest["entries"]
+            if "chunks" in entry
+        }
+    entries: list[dict[str, Any]] = []
+    written = reused = 0
+    for path, arcname in _walk(origin, excludes, "data"):
+        stat = path.lstat()
+        entry: dict[str, Any] = {
+            "name": arcname,
+            "mode": stat.st_mode,
+            "mtime": stat.st_mtime,
+        }
+        if path.is_symlink():
+            entry["link"] = os.readlink(path)
+        elif path.is_file():
+            entry["mtime_ns"] = stat.st_mtime_ns
+            if (
+                (previous := previous_files.get(arcname))
+                and previous["size"] == stat.st_size
+                and previous["mtime_ns"] == stat.st_mtime_ns
+                and all(store.has(digest) for digest in previous["chunks"])
+            ):
+                entry["size"] = stat.st_size
+                entry["chunks"] = previous["chunks"]
+                reused += stat.st_size
+            else:
+                # The size is the one read, the file may change while it is read
+                chunks: list[str] = []
+                size = 0
+                with path.open("rb") as file:
+                    for data in iter(partial(file.read, CHUNK_SIZE), b""):
+                        digest, chunk_written = store.add(data)
+                        chunks.append(digest)
+                        size += len(data)
+                        written += chunk_written
+                entry["size"] = size
+                entry["chunks"] = chunks
+        elif not path.is_dir():
+            continue
+        entries.append(entry)
+
+    # The size is stored to list the backup without adding up its chunks
+    size = sum(
+        store.size(digest)
+        for digest in {
+            digest for entry in entries for digest in entry.get("chunks", ())
+        }
+    )
+    manifest = {**backup_data, "size": size, "entries": entries}
+    temp_path = manifest_path.with_suffix(".tmp")
+    temp_path.write_bytes(json_bytes(manifest))
+    os.replace(temp_path, manifest_path)
+    LOGGER.debug(
+        "Wrote %s bytes of new chunks, reused %s bytes of unchanged files",
+        written,
+        reused,
+    )
+    return size
+
+
+def export_backup(
+    manifest_path: Path,
+    store: ChunkStore,
+    tar_file_path: Path,
+) -> None:
+    """Write an incremental backup as a standard backup tar file."""
+    manifest = read_manifest(manifest_path)
+    entries: list[dict[str, Any]] = manifest.pop("entries")
+    del manifest["size"]
+    temp_path = tar_file_path.with_suffix(".tmp")
+    outer_secure_tarfile = SecureTarFile(temp_path, "w", gzip=False, bufsize=BUF_SIZE)
+    with outer_secure_tarfile as outer_secure_tarfile_tarfile:
+        raw_bytes = json_bytes(manifest)
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = len(raw_bytes)
+        tar_info.mtime = int(time.time())
+        outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=io.BytesIO(raw_bytes))
+        with outer_secure_tarfile.create_inner_tar(
+            "./homeassistant.tar.gz", gzip=True
+        ) as core_tar:
+            for entry in entries:
+                tar_info = tarfile.TarInfo(name=entry["name"])
+                tar_info.mode = entry["mode"] & 0o7777
+                tar_info.mtime = int(entry["mtime"])
+                if "link" in entry:
+                    tar_info.type = tarfile.SYMTYPE
+                    tar_info.linkname = entry["link"]
+                    core_tar.addfile(tar_info)
+                elif "chunks" in entry:
+                    tar_info.size = entry["size"]
+                    core_tar.addfile(
+                        tar_info, fileobj=_ChunkReader(store, entry["chunks"])
+                    )
+                else:
+                    tar_info.type = tarfile.DIRTYPE
+                    core_tar.addfile(tar_info)
+    os.replace(temp_path, tar_file_path)
@@ -6,7 +6,7 @@ import asyncio
 from dataclasses import asdict, dataclass
 import hashlib
 import io
-import json
+import os
 from pathlib import Path
 import tarfile
 from tarfile import TarError
@@ -20,13 +20,24 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
 from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .const import DOMAIN, EXCLUDE_FROM_BACKUP, INCREMENTAL_DIR, LOGGER
+from .incremental import (
+    ChunkStore,
+    export_backup,
+    generate_incremental_backup,
+    manifest_chunks,
+    read_manifest,
+)
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
+STORAGE_KEY = f"{DOMAIN}.index"
+STORAGE_VERSION = 1
+
 
 @dataclass(slots=True)
 class Backup:
@@ -42,6 +53,11 @@ class Backup:
         """Return a dict representation of this backup."""
         return {**asdict(self), "path": self.path.as_posix()}
 
+    @property
+    def incremental(self) -> bool:
+        """Return if the backup is stored in the chunk store."""
+        return self.path.suffix == ".json"
+
 
 class BackupPlatformProtocol(Protocol):
     """Define the format that backup platforms can have."""
@@ -60,8 +76,19 @@ class BackupManager:
         """Initialize the backup manager."""
         self.hass = hass
         self.backup_dir = Path(hass.config.path("backups"))
+        self.incremental_dir = self.backup_dir / INCREMENTAL_DIR
+        self.chunk_store = ChunkStore(self.incremental_dir / "chunks")
+        # Chunks added by an incremental backup in progress are not
+        # referenced by its manifest yet, so they must not be removed
+        # by the removal of another backup at the same time
+        self._chunk_store_lock = asyncio.Lock()
         self.backing_up = False
         self.backups: dict[str, Backup] = {}
+        # The backup data of the backup files by file name, with the size and
+        # modification time of the file to detect when it has to be read again
+        self._index_store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
         self.platforms: dict[str, BackupPlatformProtocol] = {}
         self.loaded_backups = False
         self.loaded_platforms = False
@@ -118,10 +145,15 @@ class BackupManager:
 
     async def load_backups(self) -> None:
         """Load data of stored backup files."""
-        backups = await self.hass.async_add_executor_job(self._read_backups)
+        index = await self._index_store.async_load() or {}
+        backups, new_index = await self.hass.async_add_executor_job(
+            self._read_backups, index
+        )
         LOGGER.debug("Loaded %s backups", len(backups))
         self.backups = backups
         self.loaded_backups = True
+        if new_index != index:
+            await self._index_store.async_save(new_index)
 
     async def load_platforms(self) -> None:
         """Load backup platforms."""
@@ -131,25 +163,58 @@ class BackupManager:
         LOGGER.debug("Loaded %s platforms", len(self.platforms))
         self.loaded_platforms = True
 
-    def _read_backups(self) -> dict[str, Backup]:
-        """Read backups from disk."""
+    def _read_backups(
+        self, index: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, Backup], dict[str, dict[str, Any]]]:
+        """Read backups from disk.
+
+        Backup files which did not change since they were added to the
+        index are not opened. Return the backups and the updated index.
+        """
         backups: dict[str, Backup] = {}
-        for backup_path in self.backup_dir.glob("*.tar"):
+        new_index: dict[str, dict[str, Any]] = {}
+        for backup_path in (
+            *self.backup_dir.glob("*.tar"),
+            *self.incremental_dir.glob("*.json"),
+        ):
             try:
-                with tarfile.open(backup_path, "r:", bufsize=BUF_SIZE) as backup_file:
-                    if data_file := backup_file.extractfile("./backup.json"):
-                        data = json_loads_object(data_file.read())
-                        backup = Backup(
-                            slug=cast(str, data["slug"]),
-                            name=cast(str, data["name"]),
-                            date=cast(str, data["date"]),
-                            path=backup_path,
-                            size=round(backup_path.stat().st_size / 1_048_576, 2),
-                        )
-                        backups[backup.slug] = backup
-            except (OSError, TarError, json.JSONDecodeError, KeyError) as err:
+                if (
+                    entry := index.get(backup_path.name)
+                ) is None or entry != _index_entry(backup_path.stat(), entry):
+                    if (data := self._read_backup_data(backup_path)) is None:
+                        continue
+                    stat = backup_path.stat()
+                    entry = _index_entry(
+                        stat,
+                        {
+                            "slug": cast(str, data["slug"]),
+                            "name": cast(str, data["name"]),
+                            "date": cast(str, data["date"]),
+                            "size": cast(int, data.get("size", stat.st_size)),
+                        },
+                    )
+            except (OSError, TarError, ValueError, KeyError) as err:
                 LOGGER.warning("Unable to read backup %s: %s", backup_path, err)
-        return backups
+                continue
+            new_index[backup_path.name] = entry
+            backup = Backup(
+                slug=entry["slug"],
+                name=entry["name"],
+                date=entry["date"],
+                path=backup_path,
+                size=round(entry["size"] / 1_048_576, 2),
+            )
+            backups[backup.slug] = backup
+        return backups, new_index
+
+    def _read_backup_data(self, backup_path: Path) -> dict[str, Any] | None:
+        """Read the backup data of a backup file."""
+        if backup_path.suffix == ".json":
+            return read_manifest(backup_path)
+        with tarfile.open(backup_path, "r:", bufsize=BUF_SIZE) as backup_file:
+            if data_file := backup_file.extractfile("./backup.json"):
+                return json_loads_object(data_file.read())
+        return None
 
     async def get_backups(self) -> dict[str, Backup]:
         """Return backups."""
@@ -185,12 +250,51 @@ class BackupManager:
         if (backup := await self.get_backup(slug)) is None:
             return
 
-        await self.hass.async_add_executor_job(backup.path.unlink, True)
+        if backup.incremental:
+            async with self._chunk_store_lock:
+                await self.hass.async_add_executor_job(
+                    self._remove_incremental_backup, backup
+                )
+        else:
+            await self.hass.async_add_executor_job(backup.path.unlink, True)
         LOGGER.debug("Removed backup located at %s", backup.path)
         self.backups.pop(slug)
 
-    async def generate_backup(self) -> Backup:
-        """Generate a backup."""
+    def _remove_incremental_backup(self, backup: Backup) -> None:
+        """Remove an incremental backup and the chunks only it referenced."""
+        backup.path.unlink(missing_ok=True)
+        backup.path.with_suffix(".tar").unlink(missing_ok=True)
+        referenced: set[str] = set()
+        for manifest_path in self.incremental_dir.glob("*.json"):
+            try:
+                referenced |= manifest_chunks(read_manifest(manifest_path))
+            except (OSError, ValueError, KeyError) as err:
+                # Keep all chunks, they may be referenced by the manifest
+                LOGGER.warning("Unable to read backup %s: %s", manifest_path, err)
+                return
+        removed = self.chunk_store.remove_unreferenced(referenced)
+        LOGGER.debug("Removed %s unreferenced chunks", removed)
+
+    async def async_export_backup(self, backup: Backup) -> Path:
+        """Return the path of a standard backup tar file of a backup.
+
+        The tar file of an incremental backup is written on first use.
+        """
+        if not backup.incremental:
+            return backup.path
+        tar_file_path = backup.path.with_suffix(".tar")
+        if not await self.hass.async_add_executor_job(tar_file_path.exists):
+            await self.hass.async_add_executor_job(
+                export_backup, backup.path, self.chunk_store, tar_file_path
+            )
+        return tar_file_path
+
+    async def generate_backup(self, incremental: bool = False) -> Backup:
+        """Generate a backup.
+
+        An incremental backup only stores the chunks of the files which
+        are not in the chunk store yet.
+        """
         if self.backing_up:
             raise HomeAssistantError("Backup already in progress")
 
@@ -210,17 +314,26 @@ class BackupManager:
                 "homeassistant": {"version": HAVERSION},
                 "compressed": True,
             }
-            tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
-            size_in_bytes = await self.hass.async_add_executor_job(
-                self._mkdir_and_generate_backup_contents,
-                tar_file_path,
-                backup_data,
-            )
+            if incremental:
+                backup_path = Path(self.incremental_dir, f"{slug}.json")
+                async with self._chunk_store_lock:
+                    size_in_bytes = await self.hass.async_add_executor_job(
+                        self._mkdir_and_generate_incremental_backup,
+                        backup_path,
+                        backup_data,
+                    )
+            else:
+                backup_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
+                size_in_bytes = await self.hass.async_add_executor_job(
+                    self._mkdir_and_generate_backup_contents,
+                    backup_path,
+                    backup_data,
+                )
             backup = Backup(
                 slug=slug,
                 name=backup_name,
                 date=date_str,
-                path=tar_file_path,
+                path=backup_path,
                 size=round(size_in_bytes / 1_048_576, 2),
             )
             if self.loaded_backups:
@@ -263,6 +376,35 @@ class BackupManager:
 
         return tar_file_path.stat().st_size
 
+    def _mkdir_and_generate_incremental_backup(
+        self,
+        manifest_path: Path,
+        backup_data: dict[str, Any],
+    ) -> int:
+        """Generate an incremental backup and return the size of its chunks."""
+        self.incremental_dir.mkdir(parents=True, exist_ok=True)
+        previous_manifest: dict[str, Any] | None = None
+        if manifest_paths := sorted(
+            self.incremental_dir.glob("*.json"), key=lambda path: path.stat().st_mtime
+        ):
+            try:
+                previous_manifest = read_manifest(manifest_paths[-1])
+            except (OSError, ValueError) as err:
+                LOGGER.warning("Unable to read backup %s: %s", manifest_paths[-1], err)
+        return generate_incremental_backup(
+            Path(self.hass.config.path()),
+            EXCLUDE_FROM_BACKUP,
+            self.chunk_store,
+            manifest_path,
+            backup_data,
+            previous_manifest,
+        )
+
+
+def _index_entry(stat: os.stat_result, entry: dict[str, Any]) -> dict[str, Any]:
+    """Return the index entry of a backup file with its size and modification time."""
+    return {**entry, "file_size": int(stat.st_size), "mtime_ns": int(stat.st_mtime_ns)}
+
 
 def _generate_slug(date: str, name: str) -> str:
     """Generate a backup slug."""
@@ -62,7 +62,12 @@ async def handle_remove(
 
 
 @websocket_api.require_admin
-@websocket_api.websocket_command({vol.Required("type"): "backup/generate"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "backup/generate",
+        vol.Optional("incremental", default=False): bool,
+    }
+)
 @websocket_api.async_response
 async def handle_create(
     hass: HomeAssistant,
@@ -70,7 +75,9 @@ async def handle_create(
     msg: dict[str, Any],
 ) -> None:
     """Generate a backup."""
-    backup = await hass.data[DATA_MANAGER].generate_backup()
+    backup = await hass.data[DATA_MANAGER].generate_backup(
+        incremental=msg["incremental"]
+    )
     connection.send_result(msg["id"], backup)
 
 
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.history.recent import RecentState
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -62,9 +63,50 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_significant_states(
+    hass: HomeAssistant,
+    recent_states: dict[str, list[RecentState]] | None,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch history significant_states from the recent history or the database."""
+    if recent_states is not None:
+        return history.get_recent_significant_states(
+            hass,
+            recent_states,
+            start_time,
+            end_time,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    return cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
+    recent_states: dict[str, list[RecentState]] | None,
     start_time: dt,
     end_time: dt | None,
     entity_ids: list[str] | None,
@@ -77,17 +119,16 @@ def _ws_get_significant_states(
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_significant_states(
                 hass,
+                recent_states,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
             ),
         )
     )
@@ -154,12 +195,14 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    instance = get_instance(hass)
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await instance.async_add_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
+            instance.recent_history.async_get_states(entity_ids, start_time),
             start_time,
             end_time,
             entity_ids,
@@ -213,6 +256,7 @@ def _generate_websocket_response(
 def _generate_historical_response(
     hass: HomeAssistant,
     msg_id: int,
+    recent_states: dict[str, list[RecentState]] | None,
     start_time: dt,
     end_time: dt,
     entity_ids: list[str] | None,
@@ -223,20 +267,16 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = _get_significant_states(
+        hass,
+        recent_states,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
     last_time_ts = 0.0
     for state_list in states.values():
@@ -279,10 +319,16 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
+    recent_states = (
+        instance.recent_history.async_get_states(entity_ids, start_time)
+        if entity_ids
+        else None
+    )
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
+        recent_states,
         start_time,
         end_time,
         entity_ids,
@@ -73,6 +73,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
+        self._history_stats.async_stop_timeline()
 
     @callback
     def _async_add_listener(self) -> None:
@@ -85,6 +86,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
     def _async_add_events_listener(self, *_: Any) -> None:
         """Handle hass starting and start tracking events."""
         self._at_start_listener = None
+        self._history_stats.async_start_timeline()
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
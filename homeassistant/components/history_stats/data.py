@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 import datetime
+import math
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_TIMELINES: HassKey[dict[str, EntityTimeline]] = HassKey(f"{DOMAIN}_timelines")
+
+_last_changed = attrgetter("last_changed")
+
 
 @dataclass
 class HistoryStatsState:
@@ -32,6 +50,133 @@ class HistoryState:
     last_changed: float
 
 
+def _state_changes_during_period(
+    hass: HomeAssistant, entity_id: str, start_ts: float, end_ts: float | None
+) -> list[State]:
+    """Return state changes during a period."""
+    start = dt_util.utc_from_timestamp(start_ts)
+    end = dt_util.utc_from_timestamp(end_ts) if end_ts is not None else None
+    return history.state_changes_during_period(
+        hass,
+        start,
+        end,
+        entity_id,
+        include_start_time_state=True,
+        no_attributes=True,
+    ).get(entity_id, [])
+
+
+class EntityTimeline:
+    """The state changes of an entity, shared by the history stats tracking it.
+
+    The state changes are loaded from the database from the earliest start
+    of the periods of the history stats, and later state changes are added
+    from the state_changed events. When the periods move forward, the
+    state changes before the earliest start are dropped, so the database
+    is only queried again when a period starts before the loaded history.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the timeline."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self._states: list[HistoryState] = []
+        # The first state is the one in effect at since_ts
+        self._since_ts = math.inf
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._history_stats: set[HistoryStats] = set()
+        self._period_starts: dict[HistoryStats, float] = {}
+        self._unsub: CALLBACK_TYPE | None = async_track_state_change_event(
+            hass, [entity_id], self._async_state_changed
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change of the entity."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        last_changed = new_state.last_changed_timestamp
+        # Changes of the attributes only keep the last changed time
+        if not self._states or last_changed > self._states[-1].last_changed:
+            self._states.append(HistoryState(new_state.state, last_changed))
+
+    async def _async_load(self, start_ts: float) -> None:
+        """Load the state changes since start from the database."""
+        states = await get_instance(self.hass).async_add_executor_job(
+            _state_changes_during_period, self.hass, self.entity_id, start_ts, None
+        )
+        loaded = [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in states
+        ]
+        # Keep the state changes added while the database was queried,
+        # which were not committed yet
+        last_loaded = loaded[-1].last_changed if loaded else -math.inf
+        live = self._states[1:] if self._loaded else self._states
+        loaded.extend(state for state in live if state.last_changed > last_loaded)
+        self._states = loaded
+        self._since_ts = start_ts
+        self._loaded = True
+
+    async def async_get_history(
+        self, history_stats: HistoryStats, start_ts: float, end_ts: float
+    ) -> list[HistoryState]:
+        """Return the state changes of a period of a history stats.
+
+        Like the database query, the first state is the one in effect at
+        the start of the period.
+        """
+        # The state changes are kept from the earliest start of the periods,
+        # including the ones of the history stats waiting for the load
+        self._period_starts[history_stats] = start_ts
+        if not self._loaded or start_ts < self._since_ts:
+            async with self._load_lock:
+                if not self._loaded or start_ts < self._since_ts:
+                    await self._async_load(min(self._period_starts.values()))
+        states = self._states
+        start_idx = bisect_right(states, start_ts, key=_last_changed)
+        if end_ts < floored_timestamp(dt_util.utcnow()):
+            end_idx = bisect_left(states, end_ts, start_idx, key=_last_changed)
+            period = states[start_idx:end_idx]
+        else:
+            # All state changes are before the end of a period which did not end
+            period = states[start_idx:]
+        if start_idx:
+            period.insert(0, HistoryState(states[start_idx - 1].state, start_ts))
+        self._async_drop_before(min(self._period_starts.values()))
+        return period
+
+    @callback
+    def _async_drop_before(self, since_ts: float) -> None:
+        """Drop the state changes before the state in effect at since_ts."""
+        if since_ts <= self._since_ts:
+            return
+        self._since_ts = since_ts
+        if (idx := bisect_right(self._states, since_ts, key=_last_changed) - 1) > 0:
+            del self._states[:idx]
+
+    @callback
+    def async_add_history_stats(self, history_stats: HistoryStats) -> None:
+        """Share the timeline with a history stats."""
+        self._history_stats.add(history_stats)
+
+    @callback
+    def async_remove_history_stats(self, history_stats: HistoryStats) -> bool:
+        """Stop sharing the timeline with a history stats.
+
+        Return if the timeline is still used.
+        """
+        self._history_stats.discard(history_stats)
+        self._period_starts.pop(history_stats, None)
+        if self._history_stats:
+            return True
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        return False
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -55,6 +200,32 @@ class HistoryStats:
         self._duration = duration
         self._start = start
         self._end = end
+        self._timeline: EntityTimeline | None = None
+
+    @callback
+    def async_start_timeline(self) -> None:
+        """Use the timeline of the entity shared with the other history stats.
+
+        The timeline tracks the state changes of the entity, so it must be
+        started before the state changes of the entity are tracked to
+        update the history stats.
+        """
+        timelines = self.hass.data.setdefault(DATA_TIMELINES, {})
+        if (timeline := timelines.get(self.entity_id)) is None:
+            timeline = timelines[self.entity_id] = EntityTimeline(
+                self.hass, self.entity_id
+            )
+        timeline.async_add_history_stats(self)
+        self._timeline = timeline
+
+    @callback
+    def async_stop_timeline(self) -> None:
+        """Stop using the timeline of the entity."""
+        if (timeline := self._timeline) is None:
+            return
+        self._timeline = None
+        if not timeline.async_remove_history_stats(self):
+            del self.hass.data[DATA_TIMELINES][self.entity_id]
 
     async def async_update(
         self, event: Event[EventStateChangedData] | None
@@ -95,7 +266,12 @@ class HistoryStats:
         # - The period shrank in size
         # - The previous period ended before now
         #
-        if (
+        if self._timeline is not None:
+            self._history_current_period = await self._timeline.async_get_history(
+                self, current_period_start_timestamp, current_period_end_timestamp
+            )
+            self._previous_run_before_start = False
+        elif (
             not self._previous_run_before_start
             and current_period_start_timestamp == previous_period_start_timestamp
             and (
@@ -145,7 +321,9 @@ class HistoryStats:
         """Update history data for the current period from the database."""
         instance = get_instance(self.hass)
         states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
+            _state_changes_during_period,
+            self.hass,
+            self.entity_id,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
@@ -154,21 +332,6 @@ class HistoryStats:
             for state in states
         ]
 
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
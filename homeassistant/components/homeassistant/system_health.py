@@ -7,6 +7,8 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.event import async_get_timer_wheel
+from homeassistant.helpers.polling import async_get_polling_scheduler
 
 
 @callback
@@ -21,18 +23,47 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
+    return (
+        {
+            "version": f"core-{info.get('version')}",
+            "installation_type": info.get("installation_type"),
+            "dev": info.get("dev"),
+            "hassio": info.get("hassio"),
+            "docker": info.get("docker"),
+            "user": info.get("user"),
+            "virtualenv": info.get("virtualenv"),
+            "python_version": info.get("python_version"),
+            "os_name": info.get("os_name"),
+            "os_version": info.get("os_version"),
+            "arch": info.get("arch"),
+            "timezone": info.get("timezone"),
+            "config_dir": hass.config.config_dir,
+        }
+        | _async_get_timer_wheel_info(hass)
+        | _async_get_polling_info(hass)
+    )
+
+
+@callback
+def _async_get_timer_wheel_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get the wakeups of the timer wheel which coalesces timers."""
+    wheel = async_get_timer_wheel(hass)
+    if not wheel.wakeups:
+        return {}
+    return {
+        "timer_wakeups_per_second": f"{wheel.wakeups_per_second:.2f}",
+        "timers_per_wakeup": f"{wheel.timers_fired / wheel.wakeups:.1f}",
+    }
+
+
+@callback
+def _async_get_polling_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get the statistics of the polls of the entity platforms."""
+    if not (stats := async_get_polling_scheduler(hass).stats):
+        return {}
+    key, slowest = max(stats.items(), key=lambda item: item[1].average_duration)
     return {
-        "version": f"core-{info.get('version')}",
-        "installation_type": info.get("installation_type"),
-        "dev": info.get("dev"),
-        "hassio": info.get("hassio"),
-        "docker": info.get("docker"),
-        "user": info.get("user"),
-        "virtualenv": info.get("virtualenv"),
-        "python_version": info.get("python_version"),
-        "os_name": info.get("os_name"),
-        "os_version": info.get("os_version"),
-        "arch": info.get("arch"),
-        "timezone": info.get("timezone"),
-        "config_dir": hass.config.config_dir,
+        "polled_platforms": len(stats),
+        "poll_overruns": sum(platform.overruns for platform in stats.values()),
+        "slowest_poll": f"{key} ({slowest.average_duration * 1000:.0f} ms)",
     }
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -267,12 +267,99 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicTrieNode:
+    """A node in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Trie of wildcard subscriptions keyed on topic levels.
+
+    Each topic level of a subscription is a node in the trie, the `+` and `#`
+    wildcards are stored as regular children. Matching a topic walks the trie
+    once for all subscriptions instead of testing every subscription, and
+    subscriptions can be added or removed without rebuilding the trie.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the branch if it is no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def iter_match(self, topic: str) -> Iterator[Subscription]:
+        """Return an iterator of the subscriptions matching a topic.
+
+        Topics starting with `$` are not matched by wildcards on the first
+        level, see section 4.7.2 of the MQTT specification.
+        """
+        levels = topic.split("/")
+        return self._iter_match(self._root, levels, 0, not topic.startswith("$"))
+
+    def _iter_match(
+        self, node: _TopicTrieNode, levels: list[str], index: int, normal: bool
+    ) -> Iterator[Subscription]:
+        """Walk the trie from a node for the remaining topic levels."""
+        children = node.children
+        wildcard_allowed = normal or index > 0
+        if index == len(levels):
+            yield from node.subscriptions
+        else:
+            level = levels[index]
+            if (child := children.get(level)) is not None:
+                yield from self._iter_match(child, levels, index + 1, normal)
+            if (
+                level != "+"
+                and wildcard_allowed
+                and (child := children.get("+")) is not None
+            ):
+                yield from self._iter_match(child, levels, index + 1, normal)
+        if (
+            wildcard_allowed
+            and (child := children.get("#")) is not None
+            and (index + 1 != len(levels) or levels[index] != "#")
+        ):
+            yield from child.subscriptions
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -377,6 +464,8 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscription_trie = SubscriptionTrie()
+        self._matching_subscriptions_cache: dict[str, list[Subscription]] = {}
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -741,28 +830,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscription_trie.add(subscription)
+        self._async_invalidate_matching_subscriptions(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -773,8 +859,23 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
+        self._async_invalidate_matching_subscriptions(subscription)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(
+        self, subscription: Subscription
+    ) -> None:
+        """Evict the cached matches for topics affected by a subscription."""
+        cache = self._matching_subscriptions_cache
+        if subscription.is_simple_match:
+            cache.pop(subscription.topic, None)
+            return
+        topic_filter = subscription.topic
+        for topic in [topic for topic in cache if _topic_matches(topic_filter, topic)]:
+            del cache[topic]
 
     @callback
     def _async_queue_subscriptions(
@@ -835,11 +936,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -851,7 +950,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1044,18 +1142,19 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        """Return the subscriptions matching a topic.
+
+        Results are cached per topic, the cache is invalidated
+        per topic when subscriptions are added or removed.
+        """
+        if (subscriptions := self._matching_subscriptions_cache.get(topic)) is None:
+            subscriptions = []
+            if topic in self._simple_subscriptions:
+                subscriptions.extend(self._simple_subscriptions[topic])
+            if self._wildcard_subscriptions:
+                subscriptions.extend(self._wildcard_subscription_trie.iter_match(topic))
+            self._matching_subscriptions_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -1249,11 +1348,17 @@ class MQTT:
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
 
 
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
+def _topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return True if a topic matches a (wildcard) topic filter."""
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    if topic.startswith("$") and filter_levels[0] in ("+", "#"):
+        return False
+    for index, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index == len(topic_levels):
+            return False
+        if level not in ("+", topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
@@ -9,6 +9,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
+import re
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, Platform
@@ -24,6 +25,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -254,6 +256,55 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+# Value templates which only read a key of the JSON payload
+# are evaluated without rendering them with Jinja
+_JSON_KEY_TEMPLATE = re.compile(
+    r"\s*\{\{\s*value_json\.([A-Za-z_]\w*)\s*\}\}\s*", re.ASCII
+)
+
+_NOT_JSON = object()
+
+
+def _json_key(value_template: template.Template | None) -> str | None:
+    """Return the key read by a value template like {{ value_json.key }}."""
+    if value_template is None or not (
+        match := _JSON_KEY_TEMPLATE.fullmatch(value_template.template)
+    ):
+        return None
+    key = match.group(1)
+    # Jinja prefers the attributes of a dict over its items
+    return None if hasattr(dict, key) else key
+
+
+class _JsonPayloadCache:
+    """Keep the JSON value of the last payload rendered by a value template.
+
+    The subscriptions to a topic are called one after another with the
+    same payload, which is parsed once for all their value templates.
+    Templates can't modify the JSON value, so it is safe to share it.
+    """
+
+    __slots__ = ("payload", "value")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.payload: ReceivePayloadType | None = None
+        self.value: Any = _NOT_JSON
+
+    def json_loads(self, payload: ReceivePayloadType) -> Any:
+        """Return the JSON value of a payload, or _NOT_JSON if it is invalid."""
+        if payload is not self.payload and payload != self.payload:
+            try:
+                self.value = json_loads(payload)
+            except JSON_DECODE_EXCEPTIONS:
+                self.value = _NOT_JSON
+            self.payload = payload
+        return self.value
+
+
+_JSON_PAYLOAD_CACHE = _JsonPayloadCache()
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -269,6 +320,7 @@ class MqttValueTemplate:
         self._value_template = value_template
         self._config_attributes = config_attributes
         self._entity = entity
+        self._json_key = _json_key(value_template)
 
     @callback
     def async_render_with_possible_json_value(
@@ -283,6 +335,20 @@ class MqttValueTemplate:
         if self._value_template is None:
             return payload
 
+        value_json = _JSON_PAYLOAD_CACHE.json_loads(payload)
+        if (
+            (json_key := self._json_key) is not None
+            and type(value_json) is dict
+            and json_key in value_json
+        ):
+            # Same result as rendering the template, a missing key
+            # is rendered by Jinja to log the undefined variable
+            return str(value_json[json_key]).strip()
+
+        render_kwargs: dict[str, Any] = {}
+        if value_json is not _NOT_JSON:
+            render_kwargs["value_json"] = value_json
+
         values: dict[str, Any] = {}
 
         if variables is not None:
@@ -310,7 +376,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, **render_kwargs
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -336,7 +402,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, **render_kwargs
                 )
             )
         except TEMPLATE_ERRORS as exc:
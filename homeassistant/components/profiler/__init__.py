@@ -17,16 +17,17 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +41,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_LOOP_MONITOR = "start_loop_monitor"
+SERVICE_STOP_LOOP_MONITOR = "stop_loop_monitor"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +66,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -75,6 +80,8 @@ CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = [Platform.SENSOR]
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +92,8 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    loop_monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    websocket_api.async_register_command(hass, websocket_loop_stats)
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -273,6 +282,20 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_start_loop_monitor(call: ServiceCall) -> None:
+        """Start monitoring the event loop."""
+        if loop_monitor.running:
+            raise HomeAssistantError("Loop monitor already started")
+        loop_monitor.async_start()
+
+    @callback
+    def _async_stop_loop_monitor(call: ServiceCall) -> None:
+        """Stop monitoring the event loop."""
+        if not loop_monitor.running:
+            raise HomeAssistantError("Loop monitor not running")
+        loop_monitor.async_stop()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,19 +405,61 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_MONITOR,
+        _async_start_loop_monitor,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_MONITOR,
+        _async_stop_loop_monitor,
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.data[DOMAIN][LOOP_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/loop_stats",
+        vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_loop_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the event loop lag and the slowest jobs on the event loop."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    loop_monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    connection.send_result(msg["id"], loop_monitor.async_as_dict(msg["limit"]))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,233 @@
+"""Monitor the event loop lag and the duration of the jobs run on the loop."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import functools
+import math
+import time
+from typing import Any
+
+from lru import LRU
+
+from homeassistant.core import HassJob, HassJobType, HomeAssistant, callback
+
+# The lag of the event loop is sampled every interval, the samples
+# of the last LAG_SAMPLES intervals are kept in a ring buffer
+LAG_SAMPLE_INTERVAL = 1.0
+LAG_SAMPLES = 600
+# Durations are kept for the most recently run callables only
+MAX_CALLABLES = 1000
+# Upper bounds in seconds of the buckets of the duration histograms
+DURATION_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+# Jobs which block the loop for longer are kept in a ring buffer
+SLOW_JOB_THRESHOLD = 0.01
+SLOW_JOBS = 100
+
+
+@dataclass(slots=True)
+class CallableStats:
+    """Statistics of the durations of a callable run on the event loop."""
+
+    count: int = 0
+    total_duration: float = 0
+    max_duration: float = 0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(DURATION_BUCKETS) + 1)
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            "count": self.count,
+            "total_duration": self.total_duration,
+            "max_duration": self.max_duration,
+            "histogram": self.histogram,
+        }
+
+
+def _callable_name(target: Callable[..., Any]) -> str:
+    """Return the qualified name of a callable."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+class LoopMonitor:
+    """Sample the event loop lag and time the jobs run on the event loop.
+
+    The monitor only runs when it is started with the start_loop_monitor
+    service. The job methods of the HomeAssistant instance are replaced
+    while the monitor is running, which covers the listeners run when an
+    event is fired as well. The time of a job does not include the time of the
+    jobs it runs itself. Coroutine functions are timed until they first
+    yield to the event loop.
+
+    The memory used is bounded: the lag samples and slow jobs are kept
+    in ring buffers and the histograms of the least recently run
+    callables are dropped.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_lag_handle",
+        "_nested_duration",
+        "_original_add_hass_job",
+        "_original_run_hass_job",
+        "callables",
+        "lag_samples",
+        "slow_jobs",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop monitor."""
+        self._hass = hass
+        self._lag_handle: Any = None
+        self._nested_duration = 0.0
+        self._original_add_hass_job = hass._async_add_hass_job  # noqa: SLF001
+        self._original_run_hass_job = hass.async_run_hass_job
+        self.callables: LRU[str, CallableStats] = LRU(MAX_CALLABLES)
+        self.lag_samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self.slow_jobs: deque[tuple[float, str, float]] = deque(maxlen=SLOW_JOBS)
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._lag_handle is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring the event loop."""
+        hass = self._hass
+        hass._async_add_hass_job = self._async_add_hass_job  # type: ignore[method-assign] # noqa: SLF001
+        hass.async_run_hass_job = self._async_run_hass_job  # type: ignore[method-assign]
+        self._async_schedule_lag_sample()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring the event loop."""
+        hass_vars = vars(self._hass)
+        hass_vars.pop("_async_add_hass_job", None)
+        hass_vars.pop("async_run_hass_job", None)
+        if self._lag_handle is not None:
+            self._lag_handle.cancel()
+            self._lag_handle = None
+
+    @callback
+    def _async_schedule_lag_sample(self) -> None:
+        """Schedule the next sample of the event loop lag."""
+        loop = self._hass.loop
+        when = loop.time() + LAG_SAMPLE_INTERVAL
+        self._lag_handle = loop.call_at(when, self._async_sample_lag, when)
+
+    @callback
+    def _async_sample_lag(self, when: float) -> None:
+        """Record how late the sample was run."""
+        # Timers may run up to the clock resolution early
+        self.lag_samples.append(max(0.0, self._hass.loop.time() - when))
+        self._async_schedule_lag_sample()
+
+    @callback
+    def _async_run_hass_job(
+        self,
+        hassjob: HassJob[..., Any],
+        *args: Any,
+        background: bool = False,
+    ) -> Any:
+        """Run a HassJob and time it if it is a callback."""
+        if hassjob.job_type is HassJobType.Callback:
+            return self._async_run_timed(
+                self._original_run_hass_job, hassjob, args, background
+            )
+        return self._original_run_hass_job(hassjob, *args, background=background)
+
+    @callback
+    def _async_add_hass_job(
+        self,
+        hassjob: HassJob[..., Any],
+        *args: Any,
+        background: bool = False,
+    ) -> Any:
+        """Add a HassJob and time it if it runs on the event loop."""
+        job_type = hassjob.job_type
+        if job_type is HassJobType.Coroutinefunction:
+            return self._async_run_timed(
+                self._original_add_hass_job, hassjob, args, background
+            )
+        if job_type is HassJobType.Callback:
+            self._hass.loop.call_soon(
+                self._async_run_timed,
+                self._original_run_hass_job,
+                hassjob,
+                args,
+                background,
+            )
+            return None
+        return self._original_add_hass_job(hassjob, *args, background=background)
+
+    def _async_run_timed(
+        self,
+        method: Callable[..., Any],
+        hassjob: HassJob[..., Any],
+        args: tuple[Any, ...],
+        background: bool,
+    ) -> Any:
+        """Run a job and record its duration without the nested jobs."""
+        outer_nested_duration = self._nested_duration
+        self._nested_duration = 0.0
+        start = time.perf_counter()
+        try:
+            return method(hassjob, *args, background=background)
+        finally:
+            duration = time.perf_counter() - start
+            self._async_record(hassjob.target, duration - self._nested_duration)
+            self._nested_duration = outer_nested_duration + duration
+
+    def _async_record(self, target: Callable[..., Any], duration: float) -> None:
+        """Record the duration of a callable."""
+        name = _callable_name(target)
+        if (stats := self.callables.get(name)) is None:
+            stats = self.callables[name] = CallableStats()
+        stats.count += 1
+        stats.total_duration += duration
+        stats.max_duration = max(stats.max_duration, duration)
+        stats.histogram[bisect_left(DURATION_BUCKETS, duration)] += 1
+        if duration >= SLOW_JOB_THRESHOLD:
+            self.slow_jobs.append((time.time(), name, duration))
+
+    @callback
+    def async_lag_percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the event loop lag in seconds."""
+        if not (samples := sorted(self.lag_samples)):
+            return None
+        return samples[max(0, math.ceil(percentile / 100 * len(samples)) - 1)]
+
+    @callback
+    def async_as_dict(self, limit: int) -> dict[str, Any]:
+        """Return the lag and the callables with the longest total duration."""
+        callables = sorted(
+            self.callables.items(),
+            key=lambda item: item[1].total_duration,
+            reverse=True,
+        )
+        return {
+            "running": self.running,
+            "lag": {
+                "samples": len(self.lag_samples),
+                "p50": self.async_lag_percentile(50),
+                "p99": self.async_lag_percentile(99),
+                "max": max(self.lag_samples, default=None),
+            },
+            "duration_buckets": DURATION_BUCKETS,
+            "callables": [
+                {"name": name, **stats.as_dict()} for name, stats in callables[:limit]
+            ],
+            "slow_jobs": [
+                {"time": timestamp, "name": name, "duration": duration}
+                for timestamp, name, duration in self.slow_jobs
+            ],
+        }
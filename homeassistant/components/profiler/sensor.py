@@ -0,0 +1,84 @@
+"""Sensors for the event loop lag measured by the profiler."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopLagSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of a percentile of the event loop lag."""
+
+    percentile: int
+
+
+SENSORS: tuple[LoopLagSensorEntityDescription, ...] = (
+    LoopLagSensorEntityDescription(
+        key="loop_lag_p50",
+        translation_key="loop_lag_p50",
+        percentile=50,
+    ),
+    LoopLagSensorEntityDescription(
+        key="loop_lag_p99",
+        translation_key="loop_lag_p99",
+        percentile=99,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event loop lag sensors."""
+    loop_monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        LoopLagSensor(loop_monitor, entry, description) for description in SENSORS
+    )
+
+
+class LoopLagSensor(SensorEntity):
+    """Representation of a percentile of the event loop lag."""
+
+    entity_description: LoopLagSensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(
+        self,
+        loop_monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: LoopLagSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._loop_monitor = loop_monitor
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the lag of the percentile in milliseconds."""
+        lag = self._loop_monitor.async_lag_percentile(
+            self.entity_description.percentile
+        )
+        return None if lag is None else lag * 1000
@@ -157,7 +157,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         metrics.handle_entity_registry_updated,
     )
 
-    for state in hass.states.all():
+    for state in hass.states.snapshot().all():
         if entity_filter(state.entity_id):
             metrics.handle_state(state)
 
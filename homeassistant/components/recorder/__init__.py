@@ -51,6 +51,8 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_BATCH_WRITES = False
+DEFAULT_SPILL_MAX_SIZE = 0
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -61,6 +63,8 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BATCH_WRITES = "batch_writes"
+CONF_SPILL_MAX_SIZE = "spill_max_size"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -104,6 +108,14 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BATCH_WRITES, default=DEFAULT_BATCH_WRITES
+                    ): cv.boolean,
+                    # The maximum size in MiB of the file events are written
+                    # to while the backlog is too large, 0 disables it
+                    vol.Optional(
+                        CONF_SPILL_MAX_SIZE, default=DEFAULT_SPILL_MAX_SIZE
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -140,6 +152,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    batch_writes = conf[CONF_BATCH_WRITES]
+    spill_max_size = conf[CONF_SPILL_MAX_SIZE]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -163,6 +177,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        batch_writes=batch_writes,
+        spill_max_bytes=spill_max_size * 1024**2,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -0,0 +1,244 @@
+"""Batched multi-row inserts of states and events for the recorder."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# The window used to calculate the write rate
+WRITE_RATE_WINDOW = 60
+
+
+class PendingStates:
+    """A states row waiting for the next batched insert.
+
+    It has the same attributes as States that are set by the recorder
+    when processing a state_changed event, so it can be used in its place.
+    The relationships are resolved to ids when the row is written.
+    """
+
+    __slots__ = (
+        "_columns",
+        "attributes",
+        "attributes_id",
+        "entity_id",
+        "generation",
+        "last_reported_ts",
+        "linked",
+        "metadata_id",
+        "old_state",
+        "old_state_id",
+        "state",
+        "state_attributes",
+        "state_id",
+        "states_meta_rel",
+    )
+
+    def __init__(self, event: Event[EventStateChangedData]) -> None:
+        """Initialize the pending states row from a state_changed event."""
+        columns = States.columns_from_event(event)
+        self._columns = columns
+        self.state: str | None = columns["state"]
+        self.entity_id: str | None = columns["entity_id"]
+        self.attributes: str | None = None
+        self.last_reported_ts: float | None = columns["last_reported_ts"]
+        self.old_state: States | PendingStates | None = None
+        self.old_state_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.attributes_id: int | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        self.metadata_id: int | None = None
+        self.state_id: int | None = None
+        self.generation = 0
+        # If the row is linked as the old state of the next state of the
+        # entity, its state_id must be known after it is written
+        self.linked = False
+
+    def to_row(self) -> dict[str, Any]:
+        """Return the row to insert."""
+        old_state = self.old_state
+        state_attributes = self.state_attributes
+        states_meta = self.states_meta_rel
+        return self._columns | {
+            "state": self.state,
+            "entity_id": self.entity_id,
+            "attributes": self.attributes,
+            "last_reported_ts": self.last_reported_ts,
+            "old_state_id": old_state.state_id if old_state else self.old_state_id,
+            "attributes_id": (
+                state_attributes.attributes_id
+                if state_attributes
+                else self.attributes_id
+            ),
+            "metadata_id": states_meta.metadata_id if states_meta else self.metadata_id,
+        }
+
+
+class PendingEvents:
+    """An events row waiting for the next batched insert.
+
+    It has the same attributes as Events that are set by the recorder
+    when processing an event, so it can be used in its place.
+    """
+
+    __slots__ = (
+        "_columns",
+        "data_id",
+        "event_data_rel",
+        "event_type_id",
+        "event_type_rel",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Initialize the pending events row from an event."""
+        self._columns = Events.columns_from_event(event)
+        self.event_type_rel: EventTypes | None = None
+        self.event_type_id: int | None = None
+        self.event_data_rel: EventData | None = None
+        self.data_id: int | None = None
+
+    def to_row(self) -> dict[str, Any]:
+        """Return the row to insert."""
+        event_type = self.event_type_rel
+        event_data = self.event_data_rel
+        return self._columns | {
+            "event_type_id": (
+                event_type.event_type_id if event_type else self.event_type_id
+            ),
+            "data_id": event_data.data_id if event_data else self.data_id,
+        }
+
+
+class BatchWriter:
+    """Accumulate states and events rows between commits.
+
+    The rows are written with multi-row INSERT statements instead of
+    being tracked by the ORM unit of work. New rows for the lookup tables
+    (state_attributes, states_meta, event_data, event_types) are still
+    added to the session so their deduplication is unchanged, they are
+    flushed before the batched rows are inserted so their ids are known.
+
+    This class is not thread-safe and must be used from the recorder thread,
+    except for the statistics properties.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the batch writer."""
+        self._events: list[PendingEvents] = []
+        # States grouped by the length of their old_state chain in the batch
+        # so a row is always inserted after the row it references.
+        self._states: list[list[PendingStates]] = []
+        self._commits: deque[tuple[float, int, float]] = deque()
+        # If the states rows are inserted with one statement per generation,
+        # None until the first write
+        self.batched_states: bool | None = None
+
+    @property
+    def has_pending(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._events or self._states)
+
+    def add_event(self, pending: PendingEvents) -> None:
+        """Add an events row to the batch."""
+        self._events.append(pending)
+
+    def add_state(self, pending: PendingStates) -> None:
+        """Add a states row to the batch."""
+        if (
+            isinstance(old_state := pending.old_state, PendingStates)
+            and old_state.state_id is None
+        ):
+            pending.generation = old_state.generation + 1
+        while len(self._states) <= pending.generation:
+            self._states.append([])
+        self._states[pending.generation].append(pending)
+
+    def write(self, session: Session) -> int:
+        """Write the pending rows in the session transaction.
+
+        The batch is kept until clear is called after a successful
+        commit so the write can be retried.
+        """
+        session.flush()
+        connection = session.connection()
+        rows_written = 0
+        if self._events:
+            connection.execute(
+                insert(Events), [event.to_row() for event in self._events]
+            )
+            rows_written += len(self._events)
+        dialect = connection.dialect
+        use_returning = dialect.insert_executemany_returning_sort_by_parameter_order
+        self.batched_states = use_returning
+        for generation in self._states:
+            rows = [state.to_row() for state in generation]
+            rows_written += len(rows)
+            if use_returning:
+                state_ids = connection.scalars(
+                    insert(States).returning(
+                        States.state_id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                ).all()
+                for state, state_id in zip(generation, state_ids, strict=True):
+                    state.state_id = state_id
+                continue
+            # Dialects without RETURNING for executemany need a statement
+            # per row to get the state_id, which is only needed for the
+            # rows which are linked as an old state
+            unlinked_rows: list[dict[str, Any]] = []
+            for state, row in zip(generation, rows, strict=True):
+                if not state.linked:
+                    unlinked_rows.append(row)
+                    continue
+                result = connection.execute(insert(States).values(row))
+                state.state_id = result.inserted_primary_key[0]
+            if unlinked_rows:
+                connection.execute(insert(States), unlinked_rows)
+        return rows_written
+
+    def clear(self) -> None:
+        """Clear the batch."""
+        self._events.clear()
+        self._states.clear()
+
+    def record_commit(self, rows_written: int, latency: float) -> None:
+        """Record the number of rows and the latency of a commit."""
+        now = time.monotonic()
+        commits = self._commits
+        commits.append((now, rows_written, latency))
+        while commits[0][0] < now - WRITE_RATE_WINDOW:
+            commits.popleft()
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows written per second."""
+        cutoff = time.monotonic() - WRITE_RATE_WINDOW
+        return (
+            sum(
+                rows for timestamp, rows, _ in list(self._commits) if timestamp > cutoff
+            )
+            / WRITE_RATE_WINDOW
+        )
+
+    @property
+    def commit_latency(self) -> float | None:
+        """Return the mean commit latency in seconds."""
+        if not (commits := list(self._commits)):
+            return None
+        return sum(latency for _, _, latency in commits) / len(commits)
@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .batch import BatchWriter, PendingEvents, PendingStates
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -78,6 +79,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.recent import RecentHistory
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -88,6 +90,7 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .spill import SPILL_FILE, SpillBuffer
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -108,6 +111,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpillTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -149,6 +153,12 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# Spilled events are replayed once the backlog is below this fraction
+# of the maximum backlog, which means the database caught up again
+SPILL_REPLAY_BACKLOG_FRACTION = 0.1
+# The session is committed after this many replayed events
+SPILL_REPLAY_COMMIT_EVENTS = 1000
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -173,6 +183,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        batch_writes: bool = False,
+        spill_max_bytes: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -212,6 +224,13 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self.batch_writer = BatchWriter() if batch_writes else None
+        self.spill_buffer = (
+            SpillBuffer(hass.config.path(SPILL_FILE), spill_max_bytes)
+            if spill_max_bytes
+            else None
+        )
+        self.recent_history = RecentHistory()
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -231,6 +250,7 @@ class Recorder(threading.Thread):
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
+        self._recent_history_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
@@ -281,6 +301,8 @@ class Recorder(threading.Thread):
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
+        # The recent history must not cover a gap in the database
+        self.recent_history.async_clear()
 
     @callback
     def async_start_executor(self) -> None:
@@ -302,7 +324,33 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        self._event_listener = self._async_listen_events(self._queue.put_nowait)
+        if EVENT_STATE_CHANGED not in exclude_event_types:
+            recent_history_add = self.recent_history.async_add
+
+            @callback
+            def _recent_history_listener(event: Event[EventStateChangedData]) -> None:
+                """Keep the recorded state changes in the recent history."""
+                if self.enabled and (
+                    entity_filter is None or entity_filter(event.data["entity_id"])
+                ):
+                    recent_history_add(event)
+
+            self._recent_history_listener = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, _recent_history_listener
+            )
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> CALLBACK_TYPE:
+        """Listen for the events to record and put them in a queue."""
+        entity_filter = self.entity_filter
+        exclude_event_types = self.exclude_event_types
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -331,16 +379,7 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-        )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
-        )
+        return self.hass.bus.async_listen(MATCH_ALL, _event_listener)
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -372,8 +411,28 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
+        if (spill_buffer := self.spill_buffer) is not None:
+            if spill_buffer.spilling:
+                if (
+                    self.backlog
+                    < MAX_QUEUE_BACKLOG_MIN_VALUE * SPILL_REPLAY_BACKLOG_FRACTION
+                ):
+                    self._async_stop_spilling(spill_buffer)
+                return
+            if spill_buffer.replaying:
+                # The spilled events are not replayed yet
+                return
         if not self._reached_max_backlog():
             return
+        if spill_buffer is not None:
+            _LOGGER.warning(
+                "The recorder backlog queue reached the maximum size of %s events; "
+                "new events will be written to disk until the database "
+                "catches up",
+                self.backlog,
+            )
+            self._async_start_spilling(spill_buffer)
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -385,6 +444,29 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_start_spilling(self, spill_buffer: SpillBuffer) -> None:
+        """Write new events to the spill buffer instead of the queue."""
+        assert self._event_listener is not None
+        spill_buffer.spilling = True
+        spill_buffer.start_writer()
+        self._event_listener()
+        self._event_listener = self._async_listen_events(spill_buffer.put)
+
+    @callback
+    def _async_stop_spilling(self, spill_buffer: SpillBuffer) -> None:
+        """Put new events in the queue again and replay the spilled events.
+
+        The events put in the queue from now on are processed after the
+        spilled events were replayed.
+        """
+        assert self._event_listener is not None
+        spill_buffer.spilling = False
+        spill_buffer.replaying = True
+        self._event_listener()
+        self._event_listener = self._async_listen_events(self._queue.put_nowait)
+        self.queue_task(ReplaySpillTask())
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -410,6 +492,9 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._recent_history_listener:
+            self._recent_history_listener()
+            self._recent_history_listener = None
 
     @callback
     def _async_stop_listeners(self) -> None:
@@ -600,6 +685,9 @@ class Recorder(threading.Thread):
     ) -> None:
         """Update states metadata for an entity_id."""
         self.queue_task(UpdateStatesMetadataTask(entity_id, new_entity_id))
+        # The history of the old entity_id is moved to the new entity_id
+        self.recent_history.async_remove(entity_id)
+        self.recent_history.async_remove(new_entity_id)
 
     @callback
     def async_change_statistics_unit(
@@ -829,6 +917,16 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        # Events spilled before the last shutdown are older than the
+        # events in the queue, they are written even if spilling was
+        # disabled since then
+        spill_buffer = self.spill_buffer or SpillBuffer(
+            self.hass.config.path(SPILL_FILE), 0
+        )
+        if spill_buffer.exists():
+            self._replay_spill(spill_buffer)
+        else:
+            spill_buffer.replaying = False
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -844,6 +942,31 @@ class Recorder(threading.Thread):
         while not self.stop_requested:
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
+    def _replay_spill(self, spill_buffer: SpillBuffer) -> None:
+        """Write the events which were spilled to disk to the database."""
+        spill_buffer.stop_writer()
+        stats = spill_buffer.stats
+        start = time.monotonic()
+        replayed = 0
+        try:
+            while spill_buffer.begin_replay():
+                for event in spill_buffer.read_events():
+                    self._guarded_process_one_task_or_event_or_recover(event)
+                    replayed += 1
+                    if not replayed % SPILL_REPLAY_COMMIT_EVENTS:
+                        self._commit_event_session_or_retry()
+                        spill_buffer.mark_replayed()
+                self._commit_event_session_or_retry()
+                spill_buffer.finish_replay()
+        finally:
+            spill_buffer.replaying = False
+        duration = time.monotonic() - start
+        stats.replayed_events += replayed
+        stats.replay_duration += duration
+        _LOGGER.info(
+            "Replayed %s events spilled to disk in %.1f seconds", replayed, duration
+        )
+
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
@@ -1037,10 +1160,15 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        event_type_manager = self.event_type_manager
+        dbevent: Events | PendingEvents
+        if (batch_writer := self.batch_writer) and event_type_manager.active:
+            dbevent = PendingEvents(event)
+        else:
+            batch_writer = None
+            dbevent = Events.from_event(event)
 
         # Map the event_type to the EventTypes table
-        event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
             dbevent.event_type_rel = pending_event_types
         elif event_type_id := event_type_manager.get(event.event_type, session, True):
@@ -1052,7 +1180,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent, batch_writer)
             return
 
         event_data_manager = self.event_data_manager
@@ -1077,7 +1205,20 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent, batch_writer)
+
+    def _add_event_to_session(
+        self,
+        session: Session,
+        dbevent: Events | PendingEvents,
+        batch_writer: BatchWriter | None,
+    ) -> None:
+        """Add an events row to the session or the batch writer."""
+        if batch_writer is None:
+            self._add_to_session(session, dbevent)
+            return
+        self._event_session_has_pending_writes = True
+        batch_writer.add_event(cast(PendingEvents, dbevent))
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1088,7 +1229,12 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingStates
+        if (batch_writer := self.batch_writer) and states_meta_manager.active:
+            dbstate = PendingStates(event)
+        else:
+            batch_writer = None
+            dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
@@ -1107,7 +1253,7 @@ class Recorder(threading.Thread):
                 )
         if entity_removed:
             dbstate.state = None
-        else:
+        elif batch_writer is None:
             states_manager.add_pending(entity_id, dbstate)
 
         if states_meta_manager.active:
@@ -1160,7 +1306,17 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if batch_writer is None:
+            self._add_to_session(session, dbstate)
+            return
+        # Only states which are in the batch are linked as the old state
+        # of the next state of the entity, a state which was not written
+        # would be linked with a state_id of None after the commit
+        if not entity_removed:
+            states_manager.add_pending(entity_id, dbstate)
+            cast(PendingStates, dbstate).linked = True
+        self._event_session_has_pending_writes = True
+        batch_writer.add_state(cast(PendingStates, dbstate))
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1207,6 +1363,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
+        rows_written = 0
+        if (batch_writer := self.batch_writer) and batch_writer.has_pending:
+            rows_written = batch_writer.write(session)
 
         if (
             pending_last_reported
@@ -1226,6 +1386,9 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if batch_writer:
+            batch_writer.clear()
+            batch_writer.record_commit(rows_written, time.monotonic() - start)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1257,6 +1420,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self.batch_writer:
+            self.batch_writer.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1476,6 +1641,10 @@ class Recorder(threading.Thread):
         )
         self.hass.add_job(self._async_startup_done, startup_failed)
 
+        if self.spill_buffer is not None:
+            # The events which are not replayed yet are replayed at the next start
+            self.spill_buffer.stop_writer()
+
         try:
             self._end_session()
         finally:
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 import logging
 import time
-from typing import Any, Self, cast
+from typing import TYPE_CHECKING, Any, Self, cast
 
 import ciso8601
 from fnv_hash_fast import fnv1a_32
@@ -67,6 +67,9 @@ from .models import (
     uuid_hex_to_bytes_or_none,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
 
 # SQLAlchemy Schema
 class Base(DeclarativeBase):
@@ -312,20 +315,25 @@ class Events(Base):
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
+        return Events(**Events.columns_from_event(event))
+
+    @staticmethod
+    def columns_from_event(event: Event) -> dict[str, Any]:
+        """Return the column values of the events row for a native event."""
         context = event.context
-        return Events(
-            event_type=None,
-            event_data=None,
-            origin_idx=event.origin.idx,
-            time_fired=None,
-            time_fired_ts=event.time_fired_timestamp,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
-        )
+        return {
+            "event_type": None,
+            "event_data": None,
+            "origin_idx": event.origin.idx,
+            "time_fired": None,
+            "time_fired_ts": event.time_fired_timestamp,
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
@@ -499,6 +507,11 @@ class States(Base):
     @staticmethod
     def from_event(event: Event[EventStateChangedData]) -> States:
         """Create object from a state_changed event."""
+        return States(**States.columns_from_event(event))
+
+    @staticmethod
+    def columns_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+        """Return the column values of the states row for a state_changed event."""
         state = event.data["new_state"]
         # None state means the state was removed from the state machine
         if state is None:
@@ -518,23 +531,23 @@ class States(Base):
             else:
                 last_reported_ts = state.last_reported_timestamp
         context = event.context
-        return States(
-            state=state_value,
-            entity_id=event.data["entity_id"],
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
-            origin_idx=event.origin.idx,
-            last_updated=None,
-            last_changed=None,
-            last_updated_ts=last_updated_ts,
-            last_changed_ts=last_changed_ts,
-            last_reported_ts=last_reported_ts,
-        )
+        return {
+            "state": state_value,
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+            "origin_idx": event.origin.idx,
+            "last_updated": None,
+            "last_changed": None,
+            "last_updated_ts": last_updated_ts,
+            "last_changed_ts": last_changed_ts,
+            "last_reported_ts": last_reported_ts,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -595,15 +608,11 @@ class StateAttributes(Base):
         )
 
     @staticmethod
-    def shared_attrs_bytes_from_event(
-        event: Event[EventStateChangedData],
-        dialect: SupportedDialect | None,
-    ) -> bytes:
-        """Create shared_attrs from a state_changed event."""
-        # None state means the state was removed from the state machine
-        if (state := event.data["new_state"]) is None:
-            return b"{}"
-        if state_info := state.state_info:
+    def recorded_attributes(
+        attributes: Mapping[str, Any], state_info: StateInfo | None
+    ) -> dict[str, Any]:
+        """Return the attributes of a state which are recorded."""
+        if state_info:
             unrecorded_attributes = state_info["unrecorded_attributes"]
             exclude_attrs = {
                 *ALL_DOMAIN_EXCLUDE_ATTRS,
@@ -612,13 +621,24 @@ class StateAttributes(Base):
             if MATCH_ALL in unrecorded_attributes:
                 # Don't exclude device class, state class, unit of measurement
                 # or friendly name when using the MATCH_ALL exclude constant
-                exclude_attrs.update(state.attributes)
+                exclude_attrs.update(attributes)
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+        return {k: v for k, v in attributes.items() if k not in exclude_attrs}
+
+    @staticmethod
+    def shared_attrs_bytes_from_event(
+        event: Event[EventStateChangedData],
+        dialect: SupportedDialect | None,
+    ) -> bytes:
+        """Create shared_attrs from a state_changed event."""
+        # None state means the state was removed from the state machine
+        if (state := event.data["new_state"]) is None:
+            return b"{}"
         encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
         bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+            StateAttributes.recorded_attributes(state.attributes, state.state_info)
         )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
@@ -19,6 +19,7 @@ from .modern import (
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
+from .recent import get_recent_significant_states
 
 # These are the APIs of this package
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_recent_significant_states",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
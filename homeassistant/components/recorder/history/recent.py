@@ -0,0 +1,316 @@
+"""Keep the recent history of the recorded entities in memory."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.json import json_bytes, json_bytes_strip_null, json_fragment
+from homeassistant.helpers.recorder import get_instance
+
+from ..const import SupportedDialect
+from ..db_schema import MAX_STATE_ATTRS_BYTES, StateAttributes
+from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .modern import _get_run_start_ts_for_utc_point_in_time
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
+# The age of the state changes that are kept. The last state change
+# before that is always kept so the state at the start of any
+# window inside the retention is known.
+RECENT_HISTORY_MAX_AGE = timedelta(hours=24)
+# The maximum number of state changes that are kept for all entities
+MAX_RECENT_HISTORY_STATES = 20000
+
+_last_updated_ts = attrgetter("last_updated_ts")
+
+
+class RecentState(NamedTuple):
+    """A recorded state change.
+
+    The columns match what is written to the states table,
+    state and attributes are None when the state was removed.
+    """
+
+    last_updated_ts: float
+    state: str | None
+    last_changed_ts: float | None
+    attributes: Mapping[str, Any] | None
+    state_info: StateInfo | None
+
+
+class RecentHistory:
+    """Keep the recent state changes of the recorded entities in memory.
+
+    The state changes are fed from the same events the recorder writes to
+    the database, so a window which starts after the oldest state change
+    kept for every requested entity can be answered without a query.
+
+    This class is not thread-safe and must be used from the event loop,
+    except for the hits and misses counters.
+    """
+
+    def __init__(
+        self,
+        max_age: timedelta = RECENT_HISTORY_MAX_AGE,
+        max_states: int = MAX_RECENT_HISTORY_STATES,
+    ) -> None:
+        """Initialize the recent history."""
+        self._max_age = max_age.total_seconds()
+        self._max_states = max_states
+        self._states: dict[str, deque[RecentState]] = {}
+        # The last_updated_ts and entity_id of every state change in the
+        # order they were added, used to find the oldest ones to evict
+        self._order: deque[tuple[float, str]] = deque()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of state changes kept."""
+        return self._size
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change from a state_changed event."""
+        entity_id = event.data["entity_id"]
+        # None state means the state was removed from the state machine
+        if (state := event.data["new_state"]) is None:
+            recent = RecentState(event.time_fired_timestamp, None, None, None, None)
+        else:
+            recent = RecentState(
+                state.last_updated_timestamp,
+                state.state,
+                None
+                if state.last_changed == state.last_updated
+                else state.last_changed_timestamp,
+                state.attributes,
+                state.state_info,
+            )
+        if (states := self._states.get(entity_id)) is None:
+            states = self._states[entity_id] = deque()
+        states.append(recent)
+        self._order.append((recent.last_updated_ts, entity_id))
+        self._size += 1
+        self._async_evict(recent.last_updated_ts - self._max_age)
+
+    @callback
+    def _async_evict(self, cutoff_ts: float) -> None:
+        """Evict state changes older than the cutoff or over the size limit."""
+        order = self._order
+        states_by_entity_id = self._states
+        while order:
+            last_updated_ts, entity_id = order[0]
+            if self._size > self._max_states:
+                order.popleft()
+                if not (states := states_by_entity_id.get(entity_id)):
+                    continue
+                if len(states) > 1:
+                    states.popleft()
+                    self._size -= 1
+                elif states[0].attributes is None:
+                    # The entity was removed, its removal is not kept as
+                    # the last state change once its entry is evicted
+                    del states_by_entity_id[entity_id]
+                    self._size -= 1
+                continue
+            if last_updated_ts >= cutoff_ts:
+                return
+            order.popleft()
+            if not (states := states_by_entity_id.get(entity_id)):
+                continue
+            # Keep the last state change before the cutoff
+            while len(states) > 1 and states[1].last_updated_ts < cutoff_ts:
+                states.popleft()
+                self._size -= 1
+            if (
+                len(states) == 1
+                and states[0].attributes is None
+                and states[0].last_updated_ts < cutoff_ts
+            ):
+                # The entity was removed before the cutoff
+                del states_by_entity_id[entity_id]
+                self._size -= 1
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the state changes of an entity."""
+        if states := self._states.pop(entity_id, None):
+            self._size -= len(states)
+            self._order = deque(entry for entry in self._order if entry[1] != entity_id)
+
+    @callback
+    def async_clear(self) -> None:
+        """Remove all state changes."""
+        self._states.clear()
+        self._order.clear()
+        self._size = 0
+
+    @callback
+    def async_get_states(
+        self, entity_ids: list[str], start_time: datetime
+    ) -> dict[str, list[RecentState]] | None:
+        """Return a copy of the state changes of the entities.
+
+        None is returned if the state at start_time is not known
+        for any of the entities.
+        """
+        start_time_ts = start_time.timestamp()
+        states_by_entity_id = self._states
+        result: dict[str, list[RecentState]] = {}
+        for entity_id in entity_ids:
+            if (
+                not (states := states_by_entity_id.get(entity_id))
+                or states[0].last_updated_ts >= start_time_ts
+            ):
+                self.misses += 1
+                return None
+            result[entity_id] = list(states)
+        if not result:
+            return None
+        self.hits += 1
+        return result
+
+
+def get_recent_significant_states(
+    hass: HomeAssistant,
+    states_by_entity_id: dict[str, list[RecentState]],
+    start_time: datetime,
+    end_time: datetime | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return significant states in the compressed state format.
+
+    This returns the same states as get_significant_states does from the
+    database for the state changes returned by RecentHistory.async_get_states.
+    The attributes are returned as json fragments, so the result can only
+    be used to create a json response.
+    """
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp() if end_time else None
+    # The database only looks at the current run for the start
+    # time state when the history of more than one entity is requested
+    if len(states_by_entity_id) == 1:
+        run_start_ts = None
+    encoder = (
+        json_bytes_strip_null
+        if get_instance(hass).dialect_name == SupportedDialect.POSTGRESQL
+        else json_bytes
+    )
+    attr_cache: dict[int, Any] = {}
+
+    def _attributes(recent: RecentState) -> Any:
+        """Return the recorded attributes as a json fragment."""
+        if (attributes := recent.attributes) is None:
+            return {}
+        if (fragment := attr_cache.get(id(attributes))) is None:
+            recorded = encoder(
+                StateAttributes.recorded_attributes(attributes, recent.state_info)
+            )
+            if len(recorded) > MAX_STATE_ATTRS_BYTES:
+                recorded = b"{}"
+            attr_cache[id(attributes)] = fragment = json_fragment(recorded)
+        return fragment
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    for entity_id, recent_states in states_by_entity_id.items():
+        domain = split_entity_id(entity_id)[0]
+        rows: list[tuple[RecentState, float, float | None]] = []
+        if include_start_time_state and (
+            start_state_idx := bisect_left(
+                recent_states, start_time_ts, key=_last_updated_ts
+            )
+        ):
+            start_state = recent_states[start_state_idx - 1]
+            if run_start_ts is None or start_state.last_updated_ts >= run_start_ts:
+                rows.append((start_state, start_time_ts, None))
+        first_idx = bisect_right(recent_states, start_time_ts, key=_last_updated_ts)
+        last_idx = (
+            bisect_left(recent_states, end_time_ts, first_idx, key=_last_updated_ts)
+            if end_time_ts
+            else len(recent_states)
+        )
+        significant_domain = domain in SIGNIFICANT_DOMAINS
+        rows.extend(
+            (recent, recent.last_updated_ts, recent.last_changed_ts)
+            for recent in recent_states[first_idx:last_idx]
+            if not significant_changes_only
+            or significant_domain
+            or recent.last_changed_ts is None
+        )
+        if not rows:
+            continue
+
+        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+            ent_results: list[dict[str, Any]] = []
+            for recent, last_updated_ts, last_changed_ts in rows:
+                comp_state: dict[str, Any] = {
+                    COMPRESSED_STATE_STATE: recent.state,
+                    COMPRESSED_STATE_ATTRIBUTES: (
+                        {} if no_attributes else _attributes(recent)
+                    ),
+                    COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                }
+                if (
+                    not significant_changes_only
+                    and last_changed_ts
+                    and last_changed_ts != last_updated_ts
+                ):
+                    comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+                ent_results.append(comp_state)
+            result[entity_id] = ent_results
+            continue
+
+        # With minimal response only the first state has the attributes,
+        # the other states are only included when the state changed
+        first_state, last_updated_ts, last_changed_ts = rows[0]
+        comp_state = {COMPRESSED_STATE_STATE: first_state.state}
+        if not no_attributes:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = _attributes(first_state)
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated_ts
+        if (
+            not significant_changes_only
+            and last_changed_ts
+            and last_changed_ts != last_updated_ts
+        ):
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+        ent_results = [comp_state]
+        prev_state = first_state.state
+        for recent, last_updated_ts, _ in rows[1:]:
+            if (state := recent.state) != prev_state:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: (prev_state := state),
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                )
+        result[entity_id] = ent_results
+
+    return result
@@ -0,0 +1,328 @@
+"""Spill events to disk while the recorder backlog is too large."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+from typing import Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventStateChangedData, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_array
+
+from .db_schema import EVENT_ORIGIN_ORDER, StateAttributes
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every record is prefixed with its length as an unsigned 32 bit integer
+_HEADER = struct.Struct("<I")
+# The file starts with the offset of the first record which was not replayed
+_OFFSET = struct.Struct("<Q")
+
+SPILL_FILE = "recorder.spill"
+REPLAY_SUFFIX = ".replay"
+SPILL_WRITER_THREAD_NAME = "RecorderSpill"
+
+
+@dataclass(slots=True)
+class SpillStats:
+    """Statistics of the events spilled to disk and replayed."""
+
+    spilled_events: int = 0
+    spilled_bytes: int = 0
+    dropped_events: int = 0
+    replayed_events: int = 0
+    replay_duration: float = 0
+
+    @property
+    def replay_events_per_second(self) -> float:
+        """Return the number of events replayed per second."""
+        if not self.replay_duration:
+            return 0
+        return self.replayed_events / self.replay_duration
+
+    def as_dict(self) -> dict[str, float]:
+        """Return a dict representation of the statistics."""
+        return {
+            "spilled_events": self.spilled_events,
+            "spilled_bytes": self.spilled_bytes,
+            "dropped_events": self.dropped_events,
+            "replayed_events": self.replayed_events,
+            "replay_events_per_second": self.replay_events_per_second,
+        }
+
+
+def _context_row(context: Context) -> list[str | None]:
+    """Return the ids of a context."""
+    return [context.id, context.user_id, context.parent_id]
+
+
+def serialize_event(event: Event) -> bytes:
+    """Serialize the parts of an event the recorder writes to the database.
+
+    Only the recorded attributes of the new state and the timestamps of
+    the old state of a state_changed event are kept.
+    """
+    header = [
+        event.event_type,
+        event.origin.idx,
+        event.time_fired_timestamp,
+        *_context_row(event.context),
+    ]
+    if event.event_type != EVENT_STATE_CHANGED:
+        return json_bytes([*header, event.data])
+    data = cast(EventStateChangedData, event.data)
+    new_state_row: list[Any] | None = None
+    old_state_row: list[Any] | None = None
+    if (new_state := data["new_state"]) is not None:
+        last_updated = new_state.last_updated
+        new_state_row = [
+            new_state.state,
+            StateAttributes.recorded_attributes(
+                new_state.attributes, new_state.state_info
+            ),
+            new_state.last_updated_timestamp,
+            None
+            if new_state.last_changed == last_updated
+            else new_state.last_changed_timestamp,
+            None
+            if new_state.last_reported == last_updated
+            else new_state.last_reported_timestamp,
+            *_context_row(new_state.context),
+        ]
+    if (old_state := data["old_state"]) is not None:
+        old_state_row = [
+            old_state.state,
+            old_state.last_updated_timestamp,
+            old_state.last_reported_timestamp,
+        ]
+    return json_bytes([*header, data["entity_id"], new_state_row, old_state_row])
+
+
+def _state_from_row(entity_id: str, row: list[Any]) -> State:
+    """Create the new state of a state_changed event from a record."""
+    (
+        state,
+        attributes,
+        last_updated_ts,
+        last_changed_ts,
+        last_reported_ts,
+        context_id,
+        user_id,
+        parent_id,
+    ) = row
+    last_updated = dt_util.utc_from_timestamp(last_updated_ts)
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts)
+        if last_changed_ts is not None
+        else last_updated,
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts)
+        if last_reported_ts is not None
+        else last_updated,
+        last_updated=last_updated,
+        context=Context(user_id, parent_id, context_id),
+        validate_entity_id=False,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def deserialize_event(record: bytes) -> Event:
+    """Create an event from a serialized record."""
+    row: list[Any] = json_loads_array(record)
+    event_type, origin_idx, time_fired_ts, context_id, user_id, parent_id = row[:6]
+    context = Context(user_id, parent_id, context_id)
+    origin = EVENT_ORIGIN_ORDER[origin_idx]
+    if event_type != EVENT_STATE_CHANGED:
+        return Event(event_type, row[6], origin, time_fired_ts, context)
+    entity_id, new_state_row, old_state_row = row[6:]
+    old_state: State | None = None
+    if old_state_row is not None:
+        state, last_updated_ts, last_reported_ts = old_state_row
+        old_state = State(
+            entity_id,
+            state,
+            last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+            last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+            validate_entity_id=False,
+            last_updated_timestamp=last_updated_ts,
+        )
+    return Event(
+        event_type,
+        {
+            "entity_id": entity_id,
+            "old_state": old_state,
+            "new_state": _state_from_row(entity_id, new_state_row)
+            if new_state_row is not None
+            else None,
+        },
+        origin,
+        time_fired_ts,
+        context,
+    )
+
+
+class SpillBuffer:
+    """Append-only buffer on disk of the events the recorder could not keep up with.
+
+    Events are put in the buffer from the event loop and written to the end
+    of the file by a writer thread, as records prefixed with their length.
+    Once the recorder caught up with its backlog, the writer is stopped, the
+    file is moved to the replay file and the recorder thread replays the
+    events from a memory map of it. The offset of the events which were
+    committed to the database is stored in the replay file, so a replay
+    which failed is resumed after them, before new spilled events.
+
+    When the file reaches max_bytes, events are dropped.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the spill buffer."""
+        self.path = path
+        self.replay_path = f"{path}{REPLAY_SUFFIX}"
+        self.max_bytes = max_bytes
+        self.spilling = False
+        # Events are not spilled again until the spilled events were
+        # replayed, as the replay removes the file when it is done.
+        # A file left over from before the start is replayed first.
+        self.replaying = True
+        self.stats = SpillStats()
+        self._queue: queue.SimpleQueue[Event | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._replay_offset = 0
+
+    @property
+    def writing(self) -> bool:
+        """Return if the writer thread is running."""
+        return self._writer is not None
+
+    def put(self, event: Event) -> None:
+        """Add an event to the buffer."""
+        self._queue.put_nowait(event)
+
+    def start_writer(self) -> None:
+        """Start writing the events put in the buffer to disk."""
+        self._writer = threading.Thread(
+            target=self._write_events, name=SPILL_WRITER_THREAD_NAME, daemon=True
+        )
+        self._writer.start()
+
+    def stop_writer(self) -> None:
+        """Write the remaining events to disk and stop the writer thread."""
+        if self._writer is None:
+            return
+        self._queue.put_nowait(None)
+        self._writer.join()
+        self._writer = None
+
+    def _write_events(self) -> None:
+        """Append the events put in the buffer to the file."""
+        queue_ = self._queue
+        stats = self.stats
+        full = False
+        with open(self.path, "ab") as file:
+            if not (size := file.tell()):
+                file.write(_OFFSET.pack(_OFFSET.size))
+                size = _OFFSET.size
+            while (event := queue_.get()) is not None:
+                try:
+                    record = serialize_event(event)
+                except (TypeError, ValueError):
+                    _LOGGER.exception("Error serializing event %s", event)
+                    stats.dropped_events += 1
+                    continue
+                if size + _HEADER.size + len(record) > self.max_bytes:
+                    if not full:
+                        full = True
+                        _LOGGER.error(
+                            "The recorder spill file reached its maximum size "
+                            "of %s bytes; events will be dropped until the "
+                            "database catches up",
+                            self.max_bytes,
+                        )
+                    stats.dropped_events += 1
+                    continue
+                file.write(_HEADER.pack(len(record)))
+                file.write(record)
+                size += _HEADER.size + len(record)
+                stats.spilled_events += 1
+                stats.spilled_bytes = size
+                if queue_.empty():
+                    file.flush()
+
+    def begin_replay(self) -> bool:
+        """Move the spilled events to the replay file.
+
+        A replay file left over by a replay which failed holds older events
+        and is replayed first. Returns if there are events to replay.
+        """
+        if os.path.exists(self.replay_path):
+            return True
+        try:
+            os.replace(self.path, self.replay_path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def read_events(self) -> Generator[Event]:
+        """Read the events which were not replayed yet from the replay file.
+
+        A record which was only partially written is ignored.
+        """
+        path = self.replay_path
+        try:
+            file = open(path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            return
+        with file:
+            if (size := os.fstat(file.fileno()).st_size) < _OFFSET.size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                (offset,) = _OFFSET.unpack_from(buffer, 0)
+                self._replay_offset = offset
+                while offset + _HEADER.size <= size:
+                    (length,) = _HEADER.unpack_from(buffer, offset)
+                    offset += _HEADER.size
+                    if offset + length > size:
+                        _LOGGER.warning(
+                            "Ignoring truncated record at the end of %s", path
+                        )
+                        return
+                    record = buffer[offset : offset + length]
+                    offset += length
+                    self._replay_offset = offset
+                    try:
+                        event = deserialize_event(record)
+                    except (ValueError, TypeError, KeyError, IndexError):
+                        _LOGGER.exception("Error reading event from %s", path)
+                    else:
+                        yield event
+
+    def mark_replayed(self) -> None:
+        """Store that the events read so far were committed to the database."""
+        fd = os.open(self.replay_path, os.O_WRONLY)
+        try:
+            os.pwrite(fd, _OFFSET.pack(self._replay_offset), 0)
+        finally:
+            os.close(fd)
+
+    def finish_replay(self) -> None:
+        """Remove the replay file after its events were committed."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.replay_path)
+        self.stats.spilled_bytes = 0
+
+    def exists(self) -> bool:
+        """Return if there are spilled events to replay."""
+        return os.path.exists(self.path) or os.path.exists(self.replay_path)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
@@ -900,61 +901,84 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
-def _reduce_statistics(
+def _statistics_column(stat_list: list[StatisticsRow], key: str) -> list[float | None]:
+    """Return the values of a key of the statistics rows as a column."""
+    try:
+        return list(map(itemgetter(key), stat_list))
+    except KeyError:
+        return [statistic.get(key) for statistic in stat_list]  # type: ignore[misc]
+
+
+def _period_buckets(
+    starts: list[float], period_start_end: Callable[[float], tuple[float, float]]
+) -> list[tuple[float, float, int, int]]:
+    """Return start, end, first and last index + 1 of each period in starts."""
+    buckets: list[tuple[float, float, int, int]] = []
+    first = 0
+    count = len(starts)
+    while first < count:
+        start, end = period_start_end(starts[first])
+        next_first = bisect_left(starts, end, first + 1)
+        buckets.append((start, end, first, next_first))
+        first = next_first
+    return buckets
+
+
+def _reduce_statistics_columnar(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    Each wanted type is extracted into a column once and the slice of each
+    period is aggregated with builtins instead of looping over the rows one
+    by one. The period boundaries are reused for statistics with the same
+    start times. The rows must be sorted by start, which is how they are
+    returned by the database.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
+    reducers: tuple[tuple[str, Callable[[list[Any]], Any]], ...] = tuple(
+        (key, reduce_values)
+        for key, reduce_values in (("mean", mean), ("min", min), ("max", max))
+        if key in types
+    )
     _want_last_reset = "last_reset" in types
     _want_state = "state" in types
     _want_sum = "sum" in types
+    previous_starts: list[float] = []
+    buckets: list[tuple[float, float, int, int]] = []
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
+        starts = cast(list[float], _statistics_column(stat_list, "start"))
+        if starts != previous_starts:
+            buckets = _period_buckets(starts, period_start_end)
+            previous_starts = starts
+        rows: list[StatisticsRow] = [
+            {"start": start, "end": end} for start, end, _, _ in buckets
+        ]
+        for key, reduce_values in reducers:
+            values = _statistics_column(stat_list, key)
+            # Only filter out missing values in periods which have any
+            filter_none = None in values
+            for row, (_, _, first, next_first) in zip(rows, buckets, strict=True):
+                period_values = values[first:next_first]
+                if filter_none and None in period_values:
+                    period_values = [
+                        value for value in period_values if value is not None
+                    ]
+                row[key] = (  # type: ignore[literal-required]
+                    reduce_values(period_values) if period_values else None
+                )
+        if _want_last_reset or _want_state or _want_sum:
+            for row, (_, _, _, next_first) in zip(rows, buckets, strict=True):
+                last_stat = stat_list[next_first - 1]
                 if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
+                    row["last_reset"] = last_stat.get("last_reset")
                 if _want_state:
-                    row["state"] = prev_stat.get("state")
+                    row["state"] = last_stat.get("state")
                 if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+                    row["sum"] = last_stat["sum"]
+        result[statistic_id] = rows
 
     return result
 
@@ -1002,10 +1026,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics_columnar(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1052,10 +1074,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics_columnar(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1107,10 +1127,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics_columnar(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -72,4 +72,54 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_batch_writer_info(instance)
+        | _async_get_recent_history_info(instance)
+        | _async_get_spill_info(instance)
+    )
+
+
+@callback
+def _async_get_batch_writer_info(instance: Recorder) -> dict[str, Any]:
+    """Get the write rate and commit latency of the batch writer."""
+    if not (batch_writer := instance.batch_writer):
+        return {}
+    batch_writer_info: dict[str, Any] = {
+        "rows_per_second": f"{batch_writer.rows_per_second:.1f}"
+    }
+    if (commit_latency := batch_writer.commit_latency) is not None:
+        batch_writer_info["commit_latency"] = f"{commit_latency * 1000:.1f} ms"
+    if (batched_states := batch_writer.batched_states) is not None:
+        # Without RETURNING for multi-row inserts, the states rows linked
+        # as an old state are inserted one by one
+        batch_writer_info["batched_state_inserts"] = batched_states
+    return batch_writer_info
+
+
+@callback
+def _async_get_recent_history_info(instance: Recorder) -> dict[str, Any]:
+    """Get the hit rate of the recent history."""
+    recent_history = instance.recent_history
+    if not (lookups := recent_history.hits + recent_history.misses):
+        return {}
+    return {
+        "recent_history_hit_rate": f"{recent_history.hits / lookups * 100:.1f} %",
+        "recent_history_states": recent_history.size,
+    }
+
+
+@callback
+def _async_get_spill_info(instance: Recorder) -> dict[str, Any]:
+    """Get the size of the spill file and the replay rate of the spilled events."""
+    if not (spill_buffer := instance.spill_buffer) or not (
+        (stats := spill_buffer.stats).spilled_events
+    ):
+        return {}
+    return {
+        "spilled_events": stats.spilled_events,
+        "spill_size": f"{stats.spilled_bytes / 1024 / 1024:.2f} MiB",
+        "spill_replay_rate": f"{stats.replay_events_per_second:.1f} events/s",
+    }
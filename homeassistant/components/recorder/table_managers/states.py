@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, cast
+
 from ..db_schema import States
 
+if TYPE_CHECKING:
+    from ..batch import PendingStates
+
 
 class StatesManager:
     """Manage the states table."""
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStates] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStates | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -35,7 +40,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingStates) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -62,7 +67,7 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            self._last_committed_id[entity_id] = cast(int, db_states.state_id)
         self._pending.clear()
         self._last_reported.clear()
 
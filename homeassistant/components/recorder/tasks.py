@@ -251,6 +251,16 @@ class WaitTask(RecorderTask):
         instance._queue_watch.set()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpillTask(RecorderTask):
+    """An object to insert into the recorder queue to replay the spilled events."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        assert instance.spill_buffer is not None
+        instance._replay_spill(instance.spill_buffer)  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class DatabaseLockTask(RecorderTask):
     """An object to insert into the recorder queue to prevent writes to the database."""
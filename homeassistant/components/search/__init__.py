@@ -12,7 +12,14 @@ import voluptuous as vol
 
 from homeassistant.components import automation, group, person, script, websocket_api
 from homeassistant.components.homeassistant import scene
-from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers import (
     area_registry as ar,
     config_validation as cv,
@@ -23,13 +30,19 @@ from homeassistant.helpers.entity import (
     EntityInfo,
     entity_sources as get_entity_sources,
 )
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+DATA_RELATIONSHIP_INDEX: HassKey[RelationshipIndex] = HassKey(
+    f"{DOMAIN}_relationship_index"
+)
+
 
 # enum of item types
 class ItemType(StrEnum):
@@ -53,10 +66,132 @@ class ItemType(StrEnum):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
+    async_get_relationship_index(hass)
     websocket_api.async_register_command(hass, websocket_search_related)
     return True
 
 
+# The domains of the entities referencing other items
+INDEXED_DOMAINS = ("automation", "group", "person", "scene", "script")
+
+
+@callback
+def _async_domain_key(event_data: EventStateChangedData) -> str:
+    """Return the domain of the entity of a state changed event."""
+    return event_data["entity_id"].partition(".")[0]
+
+
+@callback
+def _async_references(hass: HomeAssistant, entity_id: str) -> set[tuple[ItemType, str]]:
+    """Return the items referenced by an automation, script, group, person or scene."""
+    domain = split_entity_id(entity_id)[0]
+    references: set[tuple[ItemType, str]] = set()
+    if domain == "automation":
+        for item_type, item_ids in (
+            (ItemType.AREA, automation.areas_in_automation(hass, entity_id)),
+            (ItemType.DEVICE, automation.devices_in_automation(hass, entity_id)),
+            (ItemType.ENTITY, automation.entities_in_automation(hass, entity_id)),
+            (ItemType.FLOOR, automation.floors_in_automation(hass, entity_id)),
+            (ItemType.LABEL, automation.labels_in_automation(hass, entity_id)),
+        ):
+            references.update((item_type, item_id) for item_id in item_ids)
+        if blueprint := automation.blueprint_in_automation(hass, entity_id):
+            references.add((ItemType.AUTOMATION_BLUEPRINT, blueprint))
+    elif domain == "script":
+        for item_type, item_ids in (
+            (ItemType.AREA, script.areas_in_script(hass, entity_id)),
+            (ItemType.DEVICE, script.devices_in_script(hass, entity_id)),
+            (ItemType.ENTITY, script.entities_in_script(hass, entity_id)),
+            (ItemType.FLOOR, script.floors_in_script(hass, entity_id)),
+            (ItemType.LABEL, script.labels_in_script(hass, entity_id)),
+        ):
+            references.update((item_type, item_id) for item_id in item_ids)
+        if blueprint := script.blueprint_in_script(hass, entity_id):
+            references.add((ItemType.SCRIPT_BLUEPRINT, blueprint))
+    elif domain == "group":
+        for member_id in group.get_entity_ids(hass, entity_id):
+            references.add((ItemType.ENTITY, member_id))
+    elif domain == "person":
+        for member_id in person.entities_in_person(hass, entity_id):
+            references.add((ItemType.ENTITY, member_id))
+    elif domain == "scene":
+        for member_id in scene.entities_in_scene(hass, entity_id):
+            references.add((ItemType.ENTITY, member_id))
+    return references
+
+
+class RelationshipIndex:
+    """Index of the automations, scripts, groups, persons and scenes referencing items.
+
+    Finding the ones referencing an item would otherwise walk all of them.
+    The items referenced by an entity are indexed again after its state
+    changed, which happens when it is added, removed or reloaded. The
+    changed entities are indexed before the index is used.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index with the existing entities."""
+        self.hass = hass
+        self._references: dict[str, set[tuple[ItemType, str]]] = {}
+        self._referenced_by: defaultdict[tuple[ItemType, ItemType, str], set[str]] = (
+            defaultdict(set)
+        )
+        self._pending = set(hass.states.async_entity_ids(INDEXED_DOMAINS))
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED,
+            _async_domain_key,
+            INDEXED_DOMAINS,
+            self._async_state_changed,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark an entity to be indexed again."""
+        self._pending.add(event.data["entity_id"])
+
+    @callback
+    def async_update(self) -> None:
+        """Index the entities which changed."""
+        for entity_id in self._pending:
+            self._async_index(entity_id)
+        self._pending.clear()
+
+    @callback
+    def _async_index(self, entity_id: str) -> None:
+        """Index the items referenced by an entity."""
+        item_type = ItemType(split_entity_id(entity_id)[0])
+        old_references = self._references.pop(entity_id, set())
+        if self.hass.states.get(entity_id) is None:
+            references = set()
+        else:
+            references = _async_references(self.hass, entity_id)
+        for reference in old_references - references:
+            key = (item_type, *reference)
+            self._referenced_by[key].discard(entity_id)
+            if not self._referenced_by[key]:
+                del self._referenced_by[key]
+        for reference in references - old_references:
+            self._referenced_by[(item_type, *reference)].add(entity_id)
+        if references:
+            self._references[entity_id] = references
+
+    @callback
+    def async_referencing(
+        self, item_type: ItemType, referenced_type: ItemType, referenced_id: str
+    ) -> set[str]:
+        """Return the items of a type referencing an item."""
+        return self._referenced_by.get(
+            (item_type, referenced_type, referenced_id), set()
+        )
+
+
+@callback
+@singleton(DATA_RELATIONSHIP_INDEX)
+def async_get_relationship_index(hass: HomeAssistant) -> RelationshipIndex:
+    """Return the relationship index, start it on first use."""
+    return RelationshipIndex(hass)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "search/related",
@@ -93,6 +228,8 @@ class Searcher:
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
         self._entity_sources = entity_sources
+        self._index = async_get_relationship_index(hass)
+        self._index.async_update()
         self.results: defaultdict[ItemType, set[str]] = defaultdict(set)
 
     @callback
@@ -131,11 +268,15 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._index.async_referencing(ItemType.AUTOMATION, ItemType.AREA, area_id),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.AREA, area_id),
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -151,11 +292,18 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._index.async_referencing(
+                    ItemType.AUTOMATION, ItemType.DEVICE, device.id
+                ),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._index.async_referencing(
+                    ItemType.SCRIPT, ItemType.DEVICE, device.id
+                ),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -177,31 +325,41 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.AUTOMATION, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.SCRIPT, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Groups that have this entity as a member
             self._add(
                 ItemType.GROUP,
-                group.groups_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.GROUP, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Persons that use this entity
             self._add(
                 ItemType.PERSON,
-                person.persons_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.PERSON, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scenes that reference this entity
             self._add(
                 ItemType.SCENE,
-                scene.scenes_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.SCENE, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Config entries for entities in this area
@@ -273,7 +431,9 @@ class Searcher:
         """Find results for an automation blueprint."""
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_blueprint(self.hass, blueprint_path),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.AUTOMATION_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
@@ -304,11 +464,16 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.DEVICE, device_id
+            ),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.DEVICE, device_id),
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -331,20 +496,34 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, entity_id
+            ),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.ENTITY, entity_id),
+        )
 
         # Groups that have this entity as a member
-        self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.GROUP,
+            self._index.async_referencing(ItemType.GROUP, ItemType.ENTITY, entity_id),
+        )
 
         # Persons referencing this entity
-        self._add(ItemType.PERSON, person.persons_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.PERSON,
+            self._index.async_referencing(ItemType.PERSON, ItemType.ENTITY, entity_id),
+        )
 
         # Scenes referencing this entity
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._index.async_referencing(ItemType.SCENE, ItemType.ENTITY, entity_id),
+        )
 
     @callback
     def _async_search_floor(self, floor_id: str) -> None:
@@ -352,11 +531,16 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.FLOOR, floor_id
+            ),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.FLOOR, floor_id),
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -372,16 +556,26 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scenes that reference this group
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, group_entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._index.async_referencing(
+                ItemType.SCENE, ItemType.ENTITY, group_entity_id
+            ),
+        )
 
         # Entities in this group
         for entity_id in group.get_entity_ids(self.hass, group_entity_id):
@@ -412,11 +606,16 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.LABEL, label_id
+            ),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.LABEL, label_id),
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -429,12 +628,17 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Add all member entities of this person
@@ -453,12 +657,17 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Add all entities in this scene
@@ -530,7 +739,10 @@ class Searcher:
     def _async_search_script_blueprint(self, blueprint_path: str) -> None:
         """Find results for a script blueprint."""
         self._add(
-            ItemType.SCRIPT, script.scripts_with_blueprint(self.hass, blueprint_path)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.SCRIPT_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
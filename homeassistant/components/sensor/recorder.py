@@ -49,6 +49,7 @@ from .const import (
     SensorStateClass,
     UnitOfVolumeFlowRate,
 )
+from .statistics_accumulator import async_get_statistics_accumulator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -402,6 +403,44 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_accumulated_history(
+    hass: HomeAssistant,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Return the history kept by the statistics accumulator.
+
+    Sensors with a sum need all state changes to detect resets, for the
+    others the significant state changes are enough.
+    """
+    entity_ids = {
+        state.entity_id: "sum" in wanted_statistics[state.entity_id]
+        for state in sensor_states
+    }
+    try:
+        return run_callback_threadsafe(
+            hass.loop, _async_get_accumulated_history, hass, entity_ids, start, end
+        ).result()
+    except RuntimeError:
+        # The event loop is shutting down
+        return {}
+
+
+@callback
+def _async_get_accumulated_history(
+    hass: HomeAssistant,
+    entity_ids: dict[str, bool],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Return the history kept by the statistics accumulator."""
+    return async_get_statistics_accumulator(hass).async_get_history(
+        entity_ids, start, end
+    )
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,34 +452,43 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    # Get history between start and end, the history of the sensors which were
+    # tracked by the statistics accumulator during the period is kept in memory
+    history_list = _get_accumulated_history(
+        hass, sensor_states, wanted_statistics, start, end
+    )
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -0,0 +1,205 @@
+"""Accumulate the state changes of sensors for the statistics of the current period."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import ATTR_STATE_CLASS, DOMAIN
+
+# State changes older than this are dropped even if no statistics were
+# compiled for them, the periods they cover fall back to the database
+ACCUMULATOR_MAX_AGE = timedelta(hours=1)
+_MAX_AGE_SECONDS = ACCUMULATOR_MAX_AGE.total_seconds()
+
+DATA_STATISTICS_ACCUMULATOR: HassKey[StatisticsAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_accumulator"
+)
+
+_ENTITY_ID_PREFIX = f"{DOMAIN}."
+
+
+class _StateChange(NamedTuple):
+    """A state change of a sensor.
+
+    The state is None when the sensor was removed. A state change is
+    significant if the state changed and not only the attributes.
+    """
+
+    last_updated_ts: float
+    state: State | None
+    significant: bool
+
+
+def _state_change(state: State) -> _StateChange:
+    """Return the state change of a state."""
+    return _StateChange(
+        state.last_updated_timestamp, state, state.last_changed == state.last_updated
+    )
+
+
+class _EntityStateChanges:
+    """The state changes of a sensor since a point in time.
+
+    The first state change is the one in effect at that point in time,
+    all state changes after it are kept.
+    """
+
+    __slots__ = ("changes", "since_ts")
+
+    def __init__(self, since_ts: float, changes: list[_StateChange]) -> None:
+        """Initialize the state changes."""
+        self.since_ts = since_ts
+        self.changes = changes
+
+
+class StatisticsAccumulator:
+    """Keep the state changes of the sensors with a state class in memory.
+
+    The state changes are fed from the state_changed events, so the
+    statistics of a period which started after the accumulator started to
+    track a sensor can be compiled without querying its history from the
+    database. The history returned matches the one of the database query
+    used to compile the statistics.
+
+    The state changes are dropped once the statistics of their period are
+    compiled, or after ACCUMULATOR_MAX_AGE.
+
+    This class is not thread-safe and must be used from the event loop.
+    """
+
+    __slots__ = ("_entities", "_pruned_ts", "_since_ts")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator with the current state of the sensors."""
+        now_ts = dt_util.utcnow().timestamp()
+        self._since_ts = now_ts
+        self._pruned_ts = now_ts
+        self._entities: dict[str, _EntityStateChanges] = {
+            state.entity_id: _EntityStateChanges(
+                max(now_ts, state.last_updated_timestamp), [_state_change(state)]
+            )
+            for state in hass.states.async_all(DOMAIN)
+            if ATTR_STATE_CLASS in state.attributes
+        }
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change of a sensor."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if not entity_id.startswith(_ENTITY_ID_PREFIX):
+            return
+        new_state = data["new_state"]
+        if (entity := self._entities.get(entity_id)) is None:
+            # Start tracking a sensor once it has a state class
+            if new_state is None or ATTR_STATE_CLASS not in new_state.attributes:
+                return
+            changes = [_state_change(new_state)]
+            if (old_state := data["old_state"]) is None:
+                since_ts = self._since_ts
+            else:
+                since_ts = old_state.last_updated_timestamp
+                changes.insert(0, _state_change(old_state))
+            self._entities[entity_id] = _EntityStateChanges(since_ts, changes)
+            return
+        if new_state is None:
+            change = _StateChange(event.time_fired_timestamp, None, True)
+        else:
+            change = _state_change(new_state)
+        if change.last_updated_ts < entity.changes[-1].last_updated_ts:
+            # The clock went backwards, stop tracking the sensor
+            # until its next state change
+            del self._entities[entity_id]
+            return
+        entity.changes.append(change)
+        if change.last_updated_ts - self._pruned_ts > _MAX_AGE_SECONDS:
+            self._async_prune(change.last_updated_ts - _MAX_AGE_SECONDS / 2)
+
+    @callback
+    def _async_prune(self, cutoff_ts: float) -> None:
+        """Drop the state changes which are not needed after the cutoff."""
+        self._pruned_ts = cutoff_ts
+        for entity_id, entity in list(self._entities.items()):
+            if entity.since_ts >= cutoff_ts:
+                continue
+            entity.since_ts = cutoff_ts
+            changes = entity.changes
+            # Keep the state change in effect at the cutoff
+            idx = 0
+            while (
+                idx + 1 < len(changes) and changes[idx + 1].last_updated_ts < cutoff_ts
+            ):
+                idx += 1
+            if idx:
+                del changes[:idx]
+            if changes[0].state is None and len(changes) == 1:
+                # The sensor was removed before the cutoff
+                del self._entities[entity_id]
+
+    @callback
+    def async_get_history(
+        self,
+        entity_ids: dict[str, bool],
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, list[State]]:
+        """Return the history of the sensors which were tracked since before start.
+
+        entity_ids maps the entity_id of the sensors to whether all state
+        changes are included, or only the significant ones. Like the
+        database query, the history includes the state in effect at the
+        start of the period, and sensors without a state in the period are
+        left out.
+
+        The state changes before the end of the period are dropped, the
+        statistics of the periods are compiled in order.
+        """
+        start_ts = (start - timedelta.resolution).timestamp()
+        end_ts = end.timestamp()
+        history: dict[str, list[State]] = {}
+        for entity_id, all_changes in entity_ids.items():
+            if (
+                entity := self._entities.get(entity_id)
+            ) is None or entity.since_ts > start_ts:
+                continue
+            start_state: State | None = None
+            states: list[State] = []
+            for last_updated_ts, state, significant in entity.changes:
+                if last_updated_ts < start_ts:
+                    start_state = state
+                elif last_updated_ts >= end_ts:
+                    break
+                elif (
+                    state is not None
+                    and last_updated_ts > start_ts
+                    and (all_changes or significant)
+                ):
+                    states.append(state)
+            if start_state is not None:
+                states.insert(0, start_state)
+            if states:
+                history[entity_id] = states
+        if (cutoff_ts := (end - timedelta.resolution).timestamp()) > self._pruned_ts:
+            self._async_prune(cutoff_ts)
+        return history
+
+
+@callback
+@singleton(DATA_STATISTICS_ACCUMULATOR)
+def async_get_statistics_accumulator(hass: HomeAssistant) -> StatisticsAccumulator:
+    """Return the statistics accumulator, start it on first use."""
+    return StatisticsAccumulator(hass)
@@ -0,0 +1,315 @@
+"""Incremental statistics over the samples of the statistics sensor."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime
+import math
+import statistics
+
+# Sums are kept as integers scaled by 2**1074, which represents every
+# finite float exactly, so removing samples never accumulates rounding
+# errors and the results are correctly rounded like the statistics module.
+_SCALE_BITS = 1074
+_ONE = 1 << _SCALE_BITS
+
+TRACK_SUM = "sum"
+TRACK_SQUARES = "squares"
+TRACK_COUNT_ON = "count_on"
+TRACK_MAX = "max"
+TRACK_MIN = "min"
+TRACK_ORDER = "order"
+TRACK_DIFFERENCES = "differences"
+TRACK_DIFFERENCES_NONNEGATIVE = "differences_nonnegative"
+TRACK_AREA_LINEAR = "area_linear"
+TRACK_AREA_STEP = "area_step"
+TRACK_CIRCULAR = "circular"
+
+
+def _scaled(value: float) -> int:
+    """Return a finite float as an integer scaled by 2**1074."""
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_SCALE_BITS + 1 - denominator.bit_length())
+
+
+class _ExactSum:
+    """An exact running sum of floats which supports removing values."""
+
+    __slots__ = ("nonfinite", "total")
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self.total = 0
+        self.nonfinite = 0
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        if math.isfinite(value):
+            self.total += _scaled(value)
+        else:
+            self.nonfinite += 1
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before from the sum."""
+        if math.isfinite(value):
+            self.total -= _scaled(value)
+        else:
+            self.nonfinite -= 1
+
+    def value(self, terms: Iterable[float]) -> float:
+        """Return the sum, the terms are summed up if any is not finite."""
+        if self.nonfinite:
+            return sum(terms)
+        return self.total / _ONE
+
+
+class RollingStatistics:
+    """Keep the statistical characteristics of the samples up to date.
+
+    The samples are owned by the sensor in the states and ages deques, add
+    must be called after a sample is appended and remove before the oldest
+    sample is removed. Only the trackers which are needed for the configured
+    characteristic are updated, each in O(1) or O(log n) time, instead of
+    going over all samples for every update.
+
+    If a sample is not finite the characteristics which depend on the values
+    are calculated from scratch until the sample is removed again.
+    """
+
+    def __init__(
+        self,
+        states: deque[float | bool],
+        ages: deque[datetime],
+        trackers: set[str],
+    ) -> None:
+        """Initialize the rolling statistics."""
+        self._states = states
+        self._ages = ages
+        self._trackers = trackers
+        # Number of samples ever added and removed, used as the
+        # position of a sample in the monotonic min and max queues
+        self._added = 0
+        self._removed = 0
+        self._nonfinite = 0
+        self._sum = 0
+        self._squares = 0
+        self._count_on = 0
+        self._max: deque[tuple[int, float]] = deque()
+        self._min: deque[tuple[int, float]] = deque()
+        self._sorted: list[float] = []
+        self._differences = _ExactSum()
+        self._differences_nonnegative = _ExactSum()
+        self._area_linear = _ExactSum()
+        self._area_step = _ExactSum()
+        self._sin = _ExactSum()
+        self._cos = _ExactSum()
+
+    def add(self) -> None:
+        """Update the trackers after the newest sample was appended."""
+        states = self._states
+        trackers = self._trackers
+        value = states[-1]
+        position = self._added
+        self._added += 1
+        if finite := math.isfinite(value):
+            if TRACK_SUM in trackers or TRACK_SQUARES in trackers:
+                scaled = _scaled(value)
+                self._sum += scaled
+                self._squares += scaled * scaled
+            if TRACK_MAX in trackers:
+                maximum = self._max
+                while maximum and maximum[-1][1] < value:
+                    maximum.pop()
+                maximum.append((position, value))
+            if TRACK_MIN in trackers:
+                minimum = self._min
+                while minimum and minimum[-1][1] > value:
+                    minimum.pop()
+                minimum.append((position, value))
+            if TRACK_ORDER in trackers:
+                insort(self._sorted, value)
+        else:
+            self._nonfinite += 1
+        if TRACK_COUNT_ON in trackers and value is True:
+            self._count_on += 1
+        if TRACK_CIRCULAR in trackers and finite:
+            self._sin.add(math.sin(math.radians(value)))
+            self._cos.add(math.cos(math.radians(value)))
+        if len(states) >= 2:
+            self._update_pair(states[-2], value, self._ages[-2], self._ages[-1], 1)
+
+    def remove(self) -> None:
+        """Update the trackers before the oldest sample is removed."""
+        states = self._states
+        trackers = self._trackers
+        value = states[0]
+        position = self._removed
+        self._removed += 1
+        if finite := math.isfinite(value):
+            if TRACK_SUM in trackers or TRACK_SQUARES in trackers:
+                scaled = _scaled(value)
+                self._sum -= scaled
+                self._squares -= scaled * scaled
+            if self._max and self._max[0][0] == position:
+                self._max.popleft()
+            if self._min and self._min[0][0] == position:
+                self._min.popleft()
+            if TRACK_ORDER in trackers:
+                del self._sorted[bisect_left(self._sorted, value)]
+        else:
+            self._nonfinite -= 1
+        if TRACK_COUNT_ON in trackers and value is True:
+            self._count_on -= 1
+        if TRACK_CIRCULAR in trackers and finite:
+            self._sin.remove(math.sin(math.radians(value)))
+            self._cos.remove(math.cos(math.radians(value)))
+        if len(states) >= 2:
+            self._update_pair(value, states[1], self._ages[0], self._ages[1], -1)
+
+    def _update_pair(
+        self,
+        previous: float,
+        value: float,
+        previous_age: datetime,
+        age: datetime,
+        direction: int,
+    ) -> None:
+        """Add or remove the terms of two neighbouring samples."""
+        trackers = self._trackers
+        terms: list[tuple[_ExactSum, float]] = []
+        if TRACK_DIFFERENCES in trackers:
+            terms.append((self._differences, abs(value - previous)))
+        if TRACK_DIFFERENCES_NONNEGATIVE in trackers:
+            terms.append(
+                (
+                    self._differences_nonnegative,
+                    value - previous if value >= previous else value - 0,
+                )
+            )
+        if TRACK_AREA_LINEAR in trackers or TRACK_AREA_STEP in trackers:
+            seconds = (age - previous_age).total_seconds()
+            if TRACK_AREA_LINEAR in trackers:
+                terms.append((self._area_linear, 0.5 * (value + previous) * seconds))
+            if TRACK_AREA_STEP in trackers:
+                terms.append((self._area_step, previous * seconds))
+        for exact_sum, term in terms:
+            if direction > 0:
+                exact_sum.add(term)
+            else:
+                exact_sum.remove(term)
+
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        if self._nonfinite:
+            return sum(self._states)
+        return self._sum / _ONE
+
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        if self._nonfinite:
+            return statistics.mean(self._states)
+        return self._sum / (_ONE * len(self._states))
+
+    def variance(self) -> float:
+        """Return the sample variance of at least two samples."""
+        if self._nonfinite:
+            return statistics.variance(self._states)
+        count = len(self._states)
+        return (count * self._squares - self._sum * self._sum) / (
+            count * (count - 1) * _ONE * _ONE
+        )
+
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation of at least two samples."""
+        if self._nonfinite:
+            return statistics.stdev(self._states)
+        return math.sqrt(self.variance())
+
+    def count_on(self) -> int:
+        """Return the number of samples which are on."""
+        return self._count_on
+
+    def max_index(self) -> int:
+        """Return the index of the first sample with the largest value."""
+        if self._nonfinite:
+            return self._states.index(max(self._states))
+        return self._max[0][0] - self._removed
+
+    def min_index(self) -> int:
+        """Return the index of the first sample with the smallest value."""
+        if self._nonfinite:
+            return self._states.index(min(self._states))
+        return self._min[0][0] - self._removed
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        if self._nonfinite:
+            return statistics.median(self._states)
+        data = self._sorted
+        count = len(data)
+        if count % 2 == 1:
+            return data[count // 2]
+        i = count // 2
+        return (data[i - 1] + data[i]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of at least two samples.
+
+        This is the same as statistics.quantiles with n=100 and the
+        exclusive method, but only calculates the requested cut point.
+        """
+        if self._nonfinite:
+            return statistics.quantiles(self._states, n=100, method="exclusive")[
+                percentile - 1
+            ]
+        data = self._sorted
+        count = len(data)
+        cut_points = 100
+        m = count + 1
+        j = percentile * m // cut_points
+        j = max(1, min(j, count - 1))
+        delta = percentile * m - j * cut_points
+        return (data[j - 1] * (cut_points - delta) + data[j] * delta) / cut_points
+
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences of the samples."""
+        states = list(self._states)
+        return self._differences.value(
+            abs(j - i) for i, j in zip(states, states[1:], strict=False)
+        )
+
+    def sum_differences_nonnegative(self) -> float:
+        """Return the sum of the differences with resets to zero."""
+        states = list(self._states)
+        return self._differences_nonnegative.value(
+            (j - i if j >= i else j - 0)
+            for i, j in zip(states, states[1:], strict=False)
+        )
+
+    def area_linear(self) -> float:
+        """Return the area under the linearly interpolated samples."""
+        return self._area_linear.value(
+            0.5 * (self._states[i] + self._states[i - 1]) * self._seconds(i)
+            for i in range(1, len(self._states))
+        )
+
+    def area_step(self) -> float:
+        """Return the area under the samples held until the next sample."""
+        return self._area_step.value(
+            self._states[i - 1] * self._seconds(i) for i in range(1, len(self._states))
+        )
+
+    def _seconds(self, i: int) -> float:
+        """Return the seconds between a sample and the previous one."""
+        return (self._ages[i] - self._ages[i - 1]).total_seconds()
+
+    def circular_sums(self) -> tuple[float, float]:
+        """Return the sums of the sine and cosine of the samples in degrees."""
+        if self._nonfinite:
+            return (
+                sum(math.sin(math.radians(x)) for x in self._states),
+                sum(math.cos(math.radians(x)) for x in self._states),
+            )
+        return self._sin.value(()), self._cos.value(())
@@ -8,7 +8,6 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -56,6 +55,20 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .rolling import (
+    TRACK_AREA_LINEAR,
+    TRACK_AREA_STEP,
+    TRACK_CIRCULAR,
+    TRACK_COUNT_ON,
+    TRACK_DIFFERENCES,
+    TRACK_DIFFERENCES_NONNEGATIVE,
+    TRACK_MAX,
+    TRACK_MIN,
+    TRACK_ORDER,
+    TRACK_SQUARES,
+    TRACK_SUM,
+    RollingStatistics,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -182,6 +195,40 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Rolling statistics kept up to date for the characteristics of a sensor source
+STATS_NUMERIC_TRACKERS = {
+    STAT_AVERAGE_LINEAR: {TRACK_AREA_LINEAR},
+    STAT_AVERAGE_STEP: {TRACK_AREA_STEP},
+    STAT_AVERAGE_TIMELESS: {TRACK_SUM},
+    STAT_DATETIME_VALUE_MAX: {TRACK_MAX},
+    STAT_DATETIME_VALUE_MIN: {TRACK_MIN},
+    STAT_DISTANCE_95P: {TRACK_SQUARES},
+    STAT_DISTANCE_99P: {TRACK_SQUARES},
+    STAT_DISTANCE_ABSOLUTE: {TRACK_MAX, TRACK_MIN},
+    STAT_MEAN: {TRACK_SUM},
+    STAT_MEAN_CIRCULAR: {TRACK_CIRCULAR},
+    STAT_MEDIAN: {TRACK_ORDER},
+    STAT_NOISINESS: {TRACK_DIFFERENCES},
+    STAT_PERCENTILE: {TRACK_ORDER},
+    STAT_STANDARD_DEVIATION: {TRACK_SQUARES},
+    STAT_SUM: {TRACK_SUM},
+    STAT_SUM_DIFFERENCES: {TRACK_DIFFERENCES},
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: {TRACK_DIFFERENCES_NONNEGATIVE},
+    STAT_TOTAL: {TRACK_SUM},
+    STAT_VALUE_MAX: {TRACK_MAX},
+    STAT_VALUE_MIN: {TRACK_MIN},
+    STAT_VARIANCE: {TRACK_SQUARES},
+}
+
+# Rolling statistics kept up to date for the characteristics of a binary_sensor source
+STATS_BINARY_TRACKERS = {
+    STAT_AVERAGE_STEP: {TRACK_AREA_STEP},
+    STAT_AVERAGE_TIMELESS: {TRACK_COUNT_ON},
+    STAT_COUNT_BINARY_ON: {TRACK_COUNT_ON},
+    STAT_COUNT_BINARY_OFF: {TRACK_COUNT_ON},
+    STAT_MEAN: {TRACK_COUNT_ON},
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -365,6 +412,13 @@ class StatisticsSensor(SensorEntity):
         self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
+        self._rolling = RollingStatistics(
+            self.states,
+            self.ages,
+            (STATS_BINARY_TRACKERS if self.is_binary else STATS_NUMERIC_TRACKERS).get(
+                self._state_characteristic, set()
+            ),
+        )
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
@@ -446,10 +500,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._append_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -462,6 +515,20 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _append_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample and update the rolling statistics."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._popleft_sample()
+        self.states.append(value)
+        self.ages.append(age)
+        self._rolling.add()
+
+    def _popleft_sample(self) -> None:
+        """Remove the oldest sample and update the rolling statistics."""
+        self._rolling.remove()
+        self.ages.popleft()
+        self.states.popleft()
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -573,8 +640,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -736,27 +802,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._rolling.area_linear() / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._rolling.area_step() / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -794,12 +847,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self.ages[self._rolling.max_index()]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self.ages[self._rolling.min_index()]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -814,24 +867,26 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return (
+                self.states[self._rolling.max_index()]
+                - self.states[self._rolling.min_index()]
+            )
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._rolling.mean()
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            sin_sum, cos_sum = self._rolling.circular_sums()
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._rolling.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -841,34 +896,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._rolling.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return self._rolling.standard_deviation()
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._rolling.sum()
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._rolling.sum_differences()
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._rolling.sum_differences_nonnegative()
         return None
 
     def _stat_total(self) -> StateType:
@@ -876,27 +924,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self.states[self._rolling.max_index()]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self.states[self._rolling.min_index()]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._rolling.variance()
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = self._rolling.area_step()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -908,10 +953,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._rolling.count_on()
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._rolling.count_on()
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -921,5 +966,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._rolling.count_on()
         return None
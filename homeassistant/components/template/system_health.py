@@ -0,0 +1,29 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.template import async_get_render_info_cache
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    render_info_cache = async_get_render_info_cache(hass)
+    renders = render_info_cache.hits + render_info_cache.misses
+    return {
+        "renders_skipped": render_info_cache.hits,
+        "render_cache_hit_rate": (
+            f"{render_info_cache.hits / renders * 100:.1f} %" if renders else "0.0 %"
+        ),
+    }
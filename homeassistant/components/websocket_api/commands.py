@@ -60,6 +60,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +68,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+COMPRESSED_STATES_CACHE: HassKey[_CompressedStatesCache] = HassKey(
+    "websocket_api_compressed_states"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -309,6 +313,64 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+class _CompressedStatesCache:
+    """Keep the compressed states of all entities serialized.
+
+    The initial payload of subscribe_entities is the same for every user
+    who can read all entities, so it is joined once and shared by all
+    subscriptions until a state changes. Only the states which changed
+    since the payload was last joined are serialized again.
+    """
+
+    __slots__ = ("_dirty", "_hass", "_joined", "_serialized")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._serialized: dict[str, bytes] = {}
+        self._dirty: set[str] = set(hass.states.async_entity_ids())
+        self._joined: bytes | None = None
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the state of an entity as changed."""
+        self._dirty.add(event.data["entity_id"])
+        self._joined = None
+
+    @callback
+    def async_get_joined(self) -> bytes | None:
+        """Return the joined compressed states of all entities.
+
+        None is returned if a state can not be serialized.
+        """
+        if self._joined is not None:
+            return self._joined
+        serialized = self._serialized
+        get_state = self._hass.states.get
+        dirty = self._dirty
+        while dirty:
+            entity_id = dirty.pop()
+            if (state := get_state(entity_id)) is None:
+                serialized.pop(entity_id, None)
+                continue
+            try:
+                serialized[entity_id] = state.as_compressed_state_json
+            except (ValueError, TypeError):
+                dirty.add(entity_id)
+                return None
+        self._joined = b",".join(serialized.values())
+        return self._joined
+
+
+@callback
+def _async_get_compressed_states_cache(hass: HomeAssistant) -> _CompressedStatesCache:
+    """Return the compressed states cache."""
+    if (cache := hass.data.get(COMPRESSED_STATES_CACHE)) is None:
+        cache = hass.data[COMPRESSED_STATES_CACHE] = _CompressedStatesCache(hass)
+    return cache
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
@@ -409,10 +471,20 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    user = connection.user
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    joined_states: bytes | None = None
+    if (
+        not entity_ids
+        and not entity_filter
+        and (user.is_admin or user.permissions.access_all_entities(POLICY_READ))
+    ):
+        joined_states = _async_get_compressed_states_cache(hass).async_get_joined()
+    states = (
+        _async_get_allowed_states(hass, connection) if joined_states is None else []
+    )
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
     connection.subscriptions[msg_id] = hass.bus.async_listen(
@@ -428,6 +500,12 @@ def handle_subscribe_entities(
     )
     connection.send_result(msg_id)
 
+    if joined_states is not None:
+        _send_handle_entities_init_response(
+            connection, message_id_as_bytes, [joined_states]
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -42,6 +42,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "deflate_window_bits",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +65,7 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.deflate_window_bits: int | None = None
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -79,6 +81,16 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        if (window_bits := features.get(const.FEATURE_DEFLATE_MESSAGES)) is None:
+            self.deflate_window_bits = None
+        elif (
+            const.DEFLATE_MIN_WINDOW_BITS
+            <= window_bits
+            <= const.DEFLATE_MAX_WINDOW_BITS
+        ):
+            self.deflate_window_bits = int(window_bits)
+        else:
+            self.deflate_window_bits = const.DEFLATE_MAX_WINDOW_BITS
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
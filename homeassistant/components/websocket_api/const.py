@@ -58,3 +58,11 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Messages are sent as binary frames with the raw deflate stream of the
+# connection like permessage-deflate does, without the trailing 00 00 ff ff.
+# The value of the feature is the window size in bits.
+FEATURE_DEFLATE_MESSAGES = "deflate_messages"
+DEFLATE_MIN_WINDOW_BITS: Final = 9
+DEFLATE_MAX_WINDOW_BITS: Final = 15
+# Smaller messages are sent as text frames as they do not compress well
+DEFLATE_MIN_MESSAGE_SIZE: Final = 256
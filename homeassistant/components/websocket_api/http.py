@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
@@ -24,6 +25,7 @@ from homeassistant.util.json import json_loads
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
+    DEFLATE_MIN_MESSAGE_SIZE,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -41,6 +43,9 @@ if TYPE_CHECKING:
 
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
+# The end of the empty block of a sync flush which is
+# stripped from every message like permessage-deflate does
+_DEFLATE_TRAILER: Final = b"\x00\x00\xff\xff"
 
 
 class WebsocketAPIView(HomeAssistantView):
@@ -128,6 +133,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -138,6 +144,11 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        # permessage-deflate already compresses every frame
+        # if it was negotiated with the client
+        can_deflate = not wsock.compress
+        deflate_window_bits: int | None = None
+        compressor: zlib._Compress | None = None
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -153,18 +164,34 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if (
+                    can_deflate
+                    and connection.deflate_window_bits != deflate_window_bits
+                ):
+                    # deflate may be enabled or disabled later in the connection
+                    deflate_window_bits = connection.deflate_window_bits
+                    compressor = (
+                        None
+                        if deflate_window_bits is None
+                        else zlib.compressobj(wbits=-deflate_window_bits)
+                    )
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
+                if is_debug_log_enabled():
+                    debug("%s: Sending %s", self.description, message)
+                if compressor is None or len(message) < DEFLATE_MIN_MESSAGE_SIZE:
                     await send_bytes_text(message)
                     continue
-
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                # The compressor keeps its window between messages, so
+                # repeated keys and values are sent as back references
+                compressed = compressor.compress(message) + compressor.flush(
+                    zlib.Z_SYNC_FLUSH
+                )
+                await send_bytes_binary(compressed[: -len(_DEFLATE_TRAILER)])
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -335,6 +362,7 @@ class WebSocketHandler:
             send_frame = writer._send_frame  # noqa: SLF001
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -342,7 +370,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -377,6 +407,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -407,7 +438,9 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -13,6 +13,7 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
     ValuesView,
@@ -1446,6 +1447,64 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+class _KeyedListeners(Generic[_DataT]):
+    """Listeners of an event type indexed by a key of the event data.
+
+    All listeners of the same key function share a single listener on the
+    event bus, so firing an event looks up the listeners of its key instead
+    of running the event filter of every listener.
+    """
+
+    __slots__ = ("_dispatch_soon", "_hass", "_key_func", "listeners", "remove")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key_func: Callable[[_DataT], str | None],
+        dispatch_soon: bool,
+    ) -> None:
+        """Initialize the keyed listeners."""
+        self._hass = hass
+        self._key_func = key_func
+        self._dispatch_soon = dispatch_soon
+        self.listeners: defaultdict[
+            str, list[HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None]]
+        ] = defaultdict(list)
+        self.remove: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_filter(self, event_data: _DataT) -> bool:
+        """Return if there are listeners for the key of the event data."""
+        listeners = self.listeners
+        return (key := self._key_func(event_data)) is not None and (
+            key in listeners or MATCH_ALL in listeners
+        )
+
+    @callback
+    def async_dispatch(self, event: Event[_DataT]) -> None:
+        """Dispatch an event to the listeners of its key."""
+        if self._dispatch_soon:
+            # Ensure one event loop iteration runs before dispatch
+            self._hass.loop.call_soon(self._async_run_listeners, event)
+        else:
+            self._async_run_listeners(event)
+
+    @callback
+    def _async_run_listeners(self, event: Event[_DataT]) -> None:
+        """Run the listeners of the key of an event."""
+        if (key := self._key_func(event.data)) is None:
+            return
+        listeners = self.listeners
+        # Listeners may be removed while dispatching
+        for job in [*listeners.get(key, ()), *listeners.get(MATCH_ALL, ())]:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", key, job
+                )
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1460,7 +1519,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1533,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        self._keyed_listeners: dict[
+            tuple[EventType[Any] | str, Callable[[Any], str | None], bool],
+            _KeyedListeners[Any],
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1642,6 +1711,76 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_func: Callable[[_DataT], str | None],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+        *,
+        dispatch_soon: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with the given keys.
+
+        key_func, which must be a callable decorated with @callback, returns
+        the key of the event data, or None if no listener should run. The
+        listeners of the same event type and key function are indexed by
+        key, so they cost a single lookup per event instead of an event
+        filter per listener. Listeners of the MATCH_ALL key run for all keys.
+
+        If dispatch_soon is set, the listeners run in the next iteration of
+        the event loop.
+
+        This method must be run in the event loop.
+        """
+        keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        group = (event_type, key_func, dispatch_soon)
+        if (keyed_listeners := self._keyed_listeners.get(group)) is None:
+            if not is_callback_check_partial(key_func):
+                raise HomeAssistantError(f"Key function {key_func} is not a callback")
+            keyed_listeners = _KeyedListeners(self._hass, key_func, dispatch_soon)
+            keyed_listeners.remove = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        keyed_listeners.async_dispatch,
+                        f"keyed listen {event_type}",
+                        job_type=HassJobType.Callback,
+                    ),
+                    keyed_listeners.async_filter,
+                ),
+            )
+            self._keyed_listeners[group] = keyed_listeners
+        job = HassJob(listener, f"listen {event_type} {keys}", job_type=job_type)
+        listeners = keyed_listeners.listeners
+        for key in keys:
+            listeners[key].append(job)
+        return functools.partial(self._async_remove_keyed_listener, group, keys, job)
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        group: tuple[EventType[Any] | str, Callable[[Any], str | None], bool],
+        keys: tuple[str, ...],
+        job: HassJob[[Event[Any]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners[group]
+        listeners = keyed_listeners.listeners
+        for key in keys:
+            listeners[key].remove(job)
+            if not listeners[key]:
+                del listeners[key]
+        if not listeners:
+            del self._keyed_listeners[group]
+            assert keyed_listeners.remove is not None
+            keyed_listeners.remove()
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2022,6 +2161,74 @@ class State:
         )
 
 
+class StatesSnapshot(Mapping[str, State]):
+    """Immutable snapshot of the states, maps entity_id -> State.
+
+    The per domain dicts are never modified once the snapshot is created,
+    so the snapshot can be read from any thread. Domains which did not
+    change are shared with the previous snapshot.
+
+    The State objects are the same as in the state machine, only
+    last_reported is updated in place when a state is reported again.
+    """
+
+    __slots__ = ("_domains", "_len", "version")
+
+    def __init__(self, version: int, domains: dict[str, dict[str, State]]) -> None:
+        """Initialize the snapshot."""
+        self.version = version
+        self._domains = domains
+        self._len = sum(len(states) for states in domains.values())
+
+    def __getitem__(self, key: str) -> State:
+        """Get the state of an entity."""
+        domain, _, _ = key.partition(".")
+        if (states := self._domains.get(domain)) is None:
+            raise KeyError(key)
+        return states[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity ids."""
+        for states in self._domains.values():
+            yield from states
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return self._len
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<StatesSnapshot version={self.version} states={self._len}>"
+
+    def domains(self) -> KeysView[str]:
+        """Get all domains which have states."""
+        return self._domains.keys()
+
+    def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
+        """Get all entity_ids for a domain."""
+        if (states := self._domains.get(key)) is None:
+            return ()
+        return states.keys()
+
+    def domain_states(self, key: str) -> ValuesView[State] | tuple[()]:
+        """Get all states for a domain."""
+        if (states := self._domains.get(key)) is None:
+            return ()
+        return states.values()
+
+    def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
+        """Create a list of all states matching the filter."""
+        if domain_filter is None:
+            return [
+                state for states in self._domains.values() for state in states.values()
+            ]
+        if isinstance(domain_filter, str):
+            return list(self.domain_states(domain_filter.lower()))
+        return [
+            state for domain in domain_filter for state in self.domain_states(domain)
+        ]
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2033,6 +2240,12 @@ class States(UserDict[str, State]):
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        # Incremented on every change, the copies of the domains
+        # which did not change since the last snapshot are reused
+        self._version = 0
+        self._snapshot: StatesSnapshot | None = None
+        self._snapshot_domains: dict[str, dict[str, State]] = {}
+        self._changed_domains: set[str] = set()
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2042,12 +2255,35 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self._version += 1
+        self._changed_domains.add(entry.domain)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        self._version += 1
+        self._changed_domains.add(entry.domain)
+
+    def snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of the states.
+
+        Only the domains which changed since the last snapshot are copied.
+        """
+        if (snapshot := self._snapshot) is not None and (
+            snapshot.version == self._version
+        ):
+            return snapshot
+        snapshot_domains = self._snapshot_domains
+        for domain in self._changed_domains:
+            if states := self._domain_index.get(domain):
+                snapshot_domains[domain] = states.copy()
+            else:
+                snapshot_domains.pop(domain, None)
+        self._changed_domains.clear()
+        self._snapshot = StatesSnapshot(self._version, snapshot_domains.copy())
+        return self._snapshot
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -2148,6 +2384,23 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    def snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states."""
+        return run_callback_threadsafe(self._loop, self.async_snapshot).result()
+
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states.
+
+        The snapshot is cheap to create and can be passed to executor
+        threads to walk all states without blocking the event loop.
+        The same snapshot is returned until a state is changed, its
+        version can be used to detect changes.
+
+        This method must be run in the event loop.
+        """
+        return self._states.snapshot()
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -7,7 +7,7 @@ from collections.abc import Iterable
 import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utc_from_timestamp, utcnow
@@ -80,6 +80,25 @@ class AreaEntry(NormalizedNameBaseRegistryEntry):
     picture: str | None
     _cache: dict[str, Any] = field(default_factory=dict, compare=False, init=False)
 
+    @under_cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment for storage."""
+        return json_fragment(
+            json_bytes(
+                {
+                    "aliases": list(self.aliases),
+                    "floor_id": self.floor_id,
+                    "icon": self.icon,
+                    "id": self.id,
+                    "labels": list(self.labels),
+                    "name": self.name,
+                    "picture": self.picture,
+                    "created_at": self.created_at.isoformat(),
+                    "modified_at": self.modified_at.isoformat(),
+                }
+            )
+        )
+
     @under_cached_property
     def json_fragment(self) -> json_fragment:
         """Return a JSON representation of this AreaEntry."""
@@ -393,22 +412,11 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
     @callback
     def _data_to_save(self) -> AreasRegistryStoreData:
         """Return data of area registry to store in a file."""
-        return {
-            "areas": [
-                {
-                    "aliases": list(entry.aliases),
-                    "floor_id": entry.floor_id,
-                    "icon": entry.icon,
-                    "id": entry.id,
-                    "labels": list(entry.labels),
-                    "name": entry.name,
-                    "picture": entry.picture,
-                    "created_at": entry.created_at.isoformat(),
-                    "modified_at": entry.modified_at.isoformat(),
-                }
-                for entry in self.areas.values()
-            ]
-        }
+        # The storage fragments are serialized like the stored areas
+        return cast(
+            AreasRegistryStoreData,
+            {"areas": [entry.as_storage_fragment for entry in self.areas.values()]},
+        )
 
     @callback
     def _async_setup_cleanup(self) -> None:
@@ -6,7 +6,7 @@ from collections.abc import Iterable
 import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.util.dt import utc_from_timestamp, utcnow
@@ -14,11 +14,18 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.ulid import ulid_now
 
+from .json import json_bytes, json_fragment
 from .registry import BaseRegistry
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
 
+if TYPE_CHECKING:
+    # mypy cannot workout _cache Protocol with dataclasses
+    from propcache import cached_property as under_cached_property
+else:
+    from propcache import under_cached_property
+
 DATA_REGISTRY: HassKey[CategoryRegistry] = HassKey("category_registry")
 EVENT_CATEGORY_REGISTRY_UPDATED: EventType[EventCategoryRegistryUpdatedData] = (
     EventType("category_registry_updated")
@@ -64,6 +71,22 @@ class CategoryEntry:
     icon: str | None = None
     modified_at: datetime = field(default_factory=utcnow)
     name: str
+    _cache: dict[str, Any] = field(default_factory=dict, compare=False, init=False)
+
+    @under_cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment for storage."""
+        return json_fragment(
+            json_bytes(
+                {
+                    "category_id": self.category_id,
+                    "created_at": self.created_at.isoformat(),
+                    "icon": self.icon,
+                    "modified_at": self.modified_at.isoformat(),
+                    "name": self.name,
+                }
+            )
+        )
 
 
 class CategoryRegistryStore(Store[CategoryRegistryStoreData]):
@@ -227,21 +250,16 @@ class CategoryRegistry(BaseRegistry[CategoryRegistryStoreData]):
     @callback
     def _data_to_save(self) -> CategoryRegistryStoreData:
         """Return data of category registry to store in a file."""
-        return {
-            "categories": {
-                scope: [
-                    {
-                        "category_id": entry.category_id,
-                        "created_at": entry.created_at.isoformat(),
-                        "icon": entry.icon,
-                        "modified_at": entry.modified_at.isoformat(),
-                        "name": entry.name,
-                    }
-                    for entry in entries.values()
-                ]
-                for scope, entries in self.categories.items()
-            }
-        }
+        # The storage fragments are serialized like the stored categories
+        return cast(
+            CategoryRegistryStoreData,
+            {
+                "categories": {
+                    scope: [entry.as_storage_fragment for entry in entries.values()]
+                    for scope, entries in self.categories.items()
+                }
+            },
+        )
 
     @callback
     def _async_ensure_name_is_available(
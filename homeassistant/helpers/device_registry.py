@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from enum import StrEnum
 from functools import lru_cache, partial
@@ -40,7 +40,12 @@ from .deprecation import (
 )
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistry,
+    BaseRegistryItems,
+    LazyRegistryEntries,
+    RegistryIndexType,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -527,28 +532,68 @@ class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return old_data
 
 
+def _device_from_storage(device: dict[str, Any]) -> DeviceEntry:
+    """Create a device entry from its stored data."""
+    return DeviceEntry(
+        area_id=device["area_id"],
+        config_entries=set(device["config_entries"]),
+        configuration_url=device["configuration_url"],
+        # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
+        connections={
+            tuple(conn)  # type: ignore[misc]
+            for conn in device["connections"]
+        },
+        created_at=datetime.fromisoformat(device["created_at"]),
+        disabled_by=(
+            DeviceEntryDisabler(device["disabled_by"])
+            if device["disabled_by"]
+            else None
+        ),
+        entry_type=(
+            DeviceEntryType(device["entry_type"]) if device["entry_type"] else None
+        ),
+        hw_version=device["hw_version"],
+        id=device["id"],
+        identifiers={
+            tuple(iden)  # type: ignore[misc]
+            for iden in device["identifiers"]
+        },
+        labels=set(device["labels"]),
+        manufacturer=device["manufacturer"],
+        model=device["model"],
+        model_id=device["model_id"],
+        modified_at=datetime.fromisoformat(device["modified_at"]),
+        name_by_user=device["name_by_user"],
+        name=device["name"],
+        primary_config_entry=device["primary_config_entry"],
+        serial_number=device["serial_number"],
+        sw_version=device["sw_version"],
+        via_device_id=device["via_device_id"],
+    )
+
+
 class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
     BaseRegistryItems[_EntryTypeT]
 ):
     """Container for device registry items, maps device id -> entry.
 
     Maintains two additional indexes:
-    - (connection_type, connection identifier) -> entry
-    - (DOMAIN, identifier) -> entry
+    - (connection_type, connection identifier) -> key
+    - (DOMAIN, identifier) -> key
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._connections: dict[tuple[str, str], _EntryTypeT] = {}
-        self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self._connections: dict[tuple[str, str], str] = {}
+        self._identifiers: dict[tuple[str, str], str] = {}
 
     def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
         """Index an entry."""
         for connection in entry.connections:
-            self._connections[connection] = entry
+            self._connections[connection] = key
         for identifier in entry.identifiers:
-            self._identifiers[identifier] = entry
+            self._identifiers[identifier] = key
 
     def _unindex_entry(
         self, key: str, replacement_entry: _EntryTypeT | None = None
@@ -569,19 +614,21 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
         if identifiers:
             for identifier in identifiers:
                 if identifier in self._identifiers:
-                    return self._identifiers[identifier]
+                    return self.data[self._identifiers[identifier]]
         if not connections:
             return None
         for connection in _normalize_connections(connections):
             if connection in self._connections:
-                return self._connections[connection]
+                return self.data[self._connections[connection]]
         return None
 
 
 class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
     """Container for active (non-deleted) device registry entries."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, create_entry: Callable[[dict[str, Any]], DeviceEntry] | None = None
+    ) -> None:
         """Initialize the container.
 
         Maintains three additional indexes:
@@ -589,8 +636,13 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         - area_id -> dict[key, True]
         - config_entry_id -> dict[key, True]
         - label -> dict[key, True]
+
+        If create_entry is set, entries can be added with their stored data
+        and are created when they are accessed for the first time.
         """
         super().__init__()
+        if create_entry is not None:
+            self.data = LazyRegistryEntries(create_entry)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
@@ -605,6 +657,23 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         for config_entry_id in entry.config_entries:
             self._config_entry_id_index[config_entry_id][key] = True
 
+    def add_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Add the stored data of an entry which is created on first access."""
+        assert isinstance(self.data, LazyRegistryEntries)
+        if key in self.data:
+            self._unindex_entry(key)
+        self.data.add_stored(key, stored)
+        for connection in stored["connections"]:
+            self._connections[tuple(connection)] = key
+        for identifier in stored["identifiers"]:
+            self._identifiers[tuple(identifier)] = key
+        if (area_id := stored["area_id"]) is not None:
+            self._area_id_index[area_id][key] = True
+        for label in stored["labels"]:
+            self._labels_index[label][key] = True
+        for config_entry_id in stored["config_entries"]:
+            self._config_entry_id_index[config_entry_id][key] = True
+
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
     ) -> None:
@@ -655,6 +724,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -1167,49 +1237,12 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
 
         data = await self._store.async_load()
 
-        devices = ActiveDeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems(_device_from_storage)
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
-                devices[device["id"]] = DeviceEntry(
-                    area_id=device["area_id"],
-                    config_entries=set(device["config_entries"]),
-                    configuration_url=device["configuration_url"],
-                    # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
-                    connections={
-                        tuple(conn)  # type: ignore[misc]
-                        for conn in device["connections"]
-                    },
-                    created_at=datetime.fromisoformat(device["created_at"]),
-                    disabled_by=(
-                        DeviceEntryDisabler(device["disabled_by"])
-                        if device["disabled_by"]
-                        else None
-                    ),
-                    entry_type=(
-                        DeviceEntryType(device["entry_type"])
-                        if device["entry_type"]
-                        else None
-                    ),
-                    hw_version=device["hw_version"],
-                    id=device["id"],
-                    identifiers={
-                        tuple(iden)  # type: ignore[misc]
-                        for iden in device["identifiers"]
-                    },
-                    labels=set(device["labels"]),
-                    manufacturer=device["manufacturer"],
-                    model=device["model"],
-                    model_id=device["model_id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
-                    name_by_user=device["name_by_user"],
-                    name=device["name"],
-                    primary_config_entry=device["primary_config_entry"],
-                    serial_number=device["serial_number"],
-                    sw_version=device["sw_version"],
-                    via_device_id=device["via_device_id"],
-                )
+                devices.add_stored(device["id"], device)
             # Introduced in 0.111
             for device in data["deleted_devices"]:
                 deleted_devices[device["id"]] = DeletedDeviceEntry(
@@ -47,6 +47,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import async_get_polling_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -664,7 +665,9 @@ class EntityPlatform:
             return
 
         self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+            async_get_polling_scheduler(self.hass).async_first_poll_delay(
+                self.scan_interval_seconds
+            ),
             self._async_handle_interval_callback,
         )
 
@@ -1023,6 +1026,8 @@ class EntityPlatform:
 
         This method must be run in the event loop.
         """
+        scheduler = async_get_polling_scheduler(self.hass)
+        key = f"{self.domain}.{self.platform_name}"
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
@@ -1032,28 +1037,49 @@ class EntityPlatform:
                 self.domain,
                 self.scan_interval,
             )
+            scheduler.async_record_overrun(key)
             return
 
+        loop = self.hass.loop
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = loop.time()
+            try:
+                await self._async_poll_entities()
+            finally:
+                scheduler.async_record_poll(key, loop.time() - start)
+
+    async def _async_poll_entities(self) -> None:
+        """Update the states of the polling entities in parallel or sequence."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await self._async_poll_entity(entity)
+            return
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            create_eager_task(self._async_poll_entity(entity), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
+
+    async def _async_poll_entity(self, entity: Entity) -> None:
+        """Poll an entity within the system wide budget of executor updates.
+
+        The executor slot is taken before the parallel updates semaphore of
+        the platform, and only polls take executor slots, so a poll can not
+        wait for a slot while holding up the updates of other entities.
+        """
+        if hasattr(entity, "async_update") or not hasattr(entity, "update"):
+            await entity.async_update_ha_state(True)
+            return
+        async with async_get_polling_scheduler(self.hass).executor_updates:
+            await entity.async_update_ha_state(True)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
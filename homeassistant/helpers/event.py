@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -34,7 +33,6 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
@@ -42,6 +40,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheel, TimerWheelHandle
 
 from . import frame
 from .device_registry import (
@@ -53,28 +52,17 @@ from .entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from .ratelimit import KeyedRateLimit
+from .singleton import singleton
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    Template,
+    async_get_render_info_cache,
+    result_as_boolean,
+)
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
-_TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventEntityRegistryUpdatedData]
-] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
+_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -97,32 +85,9 @@ _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 class _KeyedEventTracker(Generic[_TypedDictT]):
     """Class to track events by key."""
 
-    key: HassKey[_KeyedEventData[_TypedDictT]]
     event_type: EventType[_TypedDictT] | str
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            Event[_TypedDictT],
-        ],
-        None,
-    ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventData(Generic[_TypedDictT]):
-    """Class to track data for events by key."""
-
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    key_callable: Callable[[_TypedDictT], str | None]
+    dispatch_soon: bool = False
 
 
 @dataclass(slots=True)
@@ -329,50 +294,15 @@ def async_track_state_change_event(
 
 
 @callback
-def _async_dispatch_entity_id_event_soon(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
+def _async_entity_id_key(event_data: _StateEventDataT) -> str:
+    """Return the entity_id of a state event as key."""
+    return event_data["entity_id"]
 
 
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    key_callable=_async_entity_id_key,
+    dispatch_soon=True,
 )
 
 
@@ -390,10 +320,8 @@ def _async_track_state_change_event(
 
 
 _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    key_callable=_async_entity_id_key,
 )
 
 
@@ -414,24 +342,6 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback
-def _remove_listener(
-    hass: HomeAssistant,
-    tracker: _KeyedEventTracker[_TypedDictT],
-    keys: Iterable[str],
-    job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
-            del callbacks[key]
-
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
-
-
 # tracker, not hass is intentionally the first argument here since its
 # constant and may be used in a partial in the future
 def _async_track_event(
@@ -447,78 +357,27 @@ def _async_track_event(
     """
     if not keys:
         return _remove_empty_listener
-
-    hass_data = hass.data
-    tracker_key = tracker.key
-    if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
-    else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
-
-    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
-
-    if isinstance(keys, str):
-        # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
-        keys = (keys,)
-    else:
-        for key in keys:
-            callbacks[key].append(job)
-
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
-
-
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    return hass.bus.async_listen_keyed(
+        tracker.event_type,
+        tracker.key_callable,
+        keys,
+        action,
+        job_type,
+        dispatch_soon=tracker.dispatch_soon,
+    )
 
 
 @callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+def _async_old_entity_id_or_entity_id_key(
     event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
+) -> str:
+    """Return the old entity_id or the entity_id of a registry update as key."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
 _KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
     event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+    key_callable=_async_old_entity_id_or_entity_id_key,
 )
 
 
@@ -542,40 +401,14 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+def _async_device_id_key(event_data: EventDeviceRegistryUpdatedData) -> str:
+    """Return the device_id of a device registry update as key."""
+    return event_data["device_id"]
 
 
 _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    key_callable=_async_device_id_key,
 )
 
 
@@ -596,36 +429,13 @@ def async_track_device_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of an added entity as key."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
 @bind_hass
@@ -642,10 +452,8 @@ def async_track_state_added_domain(
 
 
 _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    key_callable=_async_domain_added_key,
 )
 
 
@@ -663,26 +471,18 @@ def _async_track_state_added_domain(
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of a removed entity as key."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    key_callable=_async_domain_removed_key,
 )
 
 
@@ -998,6 +798,7 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_info_cache = async_get_render_info_cache(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1019,8 +820,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_info_cache.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -1040,8 +841,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_info_cache.async_render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1165,8 +966,10 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        # The render is skipped if none of the states it depends on changed,
+        # unless the refresh was forced
+        self._info[template] = info = self._render_info_cache.async_render_to_info(
+            template, track_template_.variables, force=event is None
         )
 
         try:
@@ -1554,6 +1357,13 @@ def async_track_point_in_utc_time(
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
 
+@callback
+@singleton(_TIMER_WHEEL)
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel which coalesces timers with a tolerance."""
+    return TimerWheel(hass.loop)
+
+
 def _run_async_call_action(
     hass: HomeAssistant, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
 ) -> None:
@@ -1568,16 +1378,29 @@ def async_call_at(
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
     loop_time: float,
+    *,
+    tolerance: timedelta | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <loop_time>.
 
     The listener is passed the time it fires in UTC time.
+
+    If a tolerance is given, the listener may fire up to the tolerance
+    late so it can share a wakeup of the event loop with other timers.
     """
     job = (
         action
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
+    if tolerance:
+        return (
+            async_get_timer_wheel(hass)
+            .call_at(
+                loop_time, tolerance.total_seconds(), _run_async_call_action, hass, job
+            )
+            .cancel
+        )
     return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
 
 
@@ -1588,10 +1411,15 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    tolerance: timedelta | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <delay>.
 
     The listener is passed the time it fires in UTC time.
+
+    If a tolerance is given, the listener may fire up to the tolerance
+    late so it can share a wakeup of the event loop with other timers.
     """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
@@ -1601,6 +1429,8 @@ def async_call_later(
         else HassJob(action, f"call_later {delay}")
     )
     loop = hass.loop
+    if tolerance:
+        return async_call_at(hass, job, loop.time() + delay, tolerance=tolerance)
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
@@ -1616,9 +1446,11 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
+    tolerance: float = 0
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelHandle | None = None
+    _expected_fire_time: float = 0
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1633,6 +1465,7 @@ class _TrackTimeInterval:
             f"track time interval {self.seconds}",
             cancel_on_shutdown=self.cancel_on_shutdown,
         )
+        self._expected_fire_time = self.hass.loop.time()
         self._schedule_timer()
 
     def _schedule_timer(self) -> None:
@@ -1641,8 +1474,22 @@ class _TrackTimeInterval:
             assert self._track_job is not None
         hass = self.hass
         loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        if not self.tolerance:
+            self._timer_handle = loop.call_at(
+                loop.time() + self.seconds, self._interval_listener, self._track_job
+            )
+            return
+        # Timers on the wheel fire up to the tolerance late, schedule from
+        # the expected time so the interval does not drift by that much
+        now = loop.time()
+        self._expected_fire_time += self.seconds
+        if self._expected_fire_time <= now:
+            self._expected_fire_time = now + self.seconds
+        self._timer_handle = async_get_timer_wheel(hass).call_at(
+            self._expected_fire_time,
+            self.tolerance,
+            self._interval_listener,
+            self._track_job,
         )
 
     @callback
@@ -1670,16 +1517,27 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    tolerance: timedelta | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval.
 
     The listener is passed the time it fires in UTC time.
+
+    If a tolerance is given, the listener may fire up to the tolerance
+    late so it can share a wakeup of the event loop with other timers.
     """
     seconds = interval.total_seconds()
     job_name = f"track time interval {seconds} {action}"
     if name:
         job_name = f"{name}: {job_name}"
-    track = _TrackTimeInterval(hass, seconds, job_name, action, cancel_on_shutdown)
+    track = _TrackTimeInterval(
+        hass,
+        seconds,
+        job_name,
+        action,
+        cancel_on_shutdown,
+        tolerance.total_seconds() if tolerance else 0,
+    )
     track.async_attach()
     return track.async_cancel
 
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.util.dt import utc_from_timestamp, utcnow
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
+from .json import json_bytes, json_fragment
 from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryEntry,
     NormalizedNameBaseRegistryItems,
@@ -22,6 +23,12 @@ from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
 
+if TYPE_CHECKING:
+    # mypy cannot workout _cache Protocol with dataclasses
+    from propcache import cached_property as under_cached_property
+else:
+    from propcache import under_cached_property
+
 DATA_REGISTRY: HassKey[FloorRegistry] = HassKey("floor_registry")
 EVENT_FLOOR_REGISTRY_UPDATED: EventType[EventFloorRegistryUpdatedData] = EventType(
     "floor_registry_updated"
@@ -67,6 +74,24 @@ class FloorEntry(NormalizedNameBaseRegistryEntry):
     floor_id: str
     icon: str | None = None
     level: int | None = None
+    _cache: dict[str, Any] = field(default_factory=dict, compare=False, init=False)
+
+    @under_cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment for storage."""
+        return json_fragment(
+            json_bytes(
+                {
+                    "aliases": list(self.aliases),
+                    "floor_id": self.floor_id,
+                    "icon": self.icon,
+                    "level": self.level,
+                    "name": self.name,
+                    "created_at": self.created_at.isoformat(),
+                    "modified_at": self.modified_at.isoformat(),
+                }
+            )
+        )
 
 
 class FloorRegistryStore(Store[FloorRegistryStoreData]):
@@ -246,20 +271,11 @@ class FloorRegistry(BaseRegistry[FloorRegistryStoreData]):
     @callback
     def _data_to_save(self) -> FloorRegistryStoreData:
         """Return data of floor registry to store in a file."""
-        return {
-            "floors": [
-                {
-                    "aliases": list(entry.aliases),
-                    "floor_id": entry.floor_id,
-                    "icon": entry.icon,
-                    "level": entry.level,
-                    "name": entry.name,
-                    "created_at": entry.created_at.isoformat(),
-                    "modified_at": entry.modified_at.isoformat(),
-                }
-                for entry in self.floors.values()
-            ]
-        }
+        # The storage fragments are serialized like the stored floors
+        return cast(
+            FloorRegistryStoreData,
+            {"floors": [entry.as_storage_fragment for entry in self.floors.values()]},
+        )
 
 
 @callback
@@ -6,7 +6,7 @@ import dataclasses
 from datetime import datetime
 from enum import StrEnum
 import functools as ft
-from typing import Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from awesomeversion import AwesomeVersion, AwesomeVersionStrategy
 
@@ -17,10 +17,17 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
+from .json import json_bytes, json_fragment
 from .registry import BaseRegistry
 from .singleton import singleton
 from .storage import Store
 
+if TYPE_CHECKING:
+    # mypy cannot workout _cache Protocol with dataclasses
+    from propcache import cached_property as under_cached_property
+else:
+    from propcache import under_cached_property
+
 DATA_REGISTRY: HassKey[IssueRegistry] = HassKey("issue_registry")
 EVENT_REPAIRS_ISSUE_REGISTRY_UPDATED: EventType[EventIssueRegistryUpdatedData] = (
     EventType("repairs_issue_registry_updated")
@@ -65,6 +72,9 @@ class IssueEntry:
     severity: IssueSeverity | None
     translation_key: str | None
     translation_placeholders: dict[str, str] | None
+    _cache: dict[str, Any] = dataclasses.field(
+        default_factory=dict, compare=False, init=False
+    )
 
     def to_json(self) -> dict[str, Any]:
         """Return a JSON serializable representation for storage."""
@@ -91,6 +101,11 @@ class IssueEntry:
             "translation_placeholders": self.translation_placeholders,
         }
 
+    @under_cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment for storage."""
+        return json_fragment(json_bytes(self.to_json()))
+
 
 class IssueRegistryStore(Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
@@ -298,13 +313,9 @@ class IssueRegistry(BaseRegistry):
         self.issues = issues
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, str | None]]]:
+    def _data_to_save(self) -> dict[str, list[json_fragment]]:
         """Return data of issue registry to store in a file."""
-        data = {}
-
-        data["issues"] = [entry.to_json() for entry in self.issues.values()]
-
-        return data
+        return {"issues": [entry.as_storage_fragment for entry in self.issues.values()]}
 
 
 @callback
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.util.dt import utc_from_timestamp, utcnow
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
+from .json import json_bytes, json_fragment
 from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryEntry,
     NormalizedNameBaseRegistryItems,
@@ -22,6 +23,12 @@ from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
 
+if TYPE_CHECKING:
+    # mypy cannot workout _cache Protocol with dataclasses
+    from propcache import cached_property as under_cached_property
+else:
+    from propcache import under_cached_property
+
 DATA_REGISTRY: HassKey[LabelRegistry] = HassKey("label_registry")
 EVENT_LABEL_REGISTRY_UPDATED: EventType[EventLabelRegistryUpdatedData] = EventType(
     "label_registry_updated"
@@ -67,6 +74,24 @@ class LabelEntry(NormalizedNameBaseRegistryEntry):
     description: str | None = None
     color: str | None = None
     icon: str | None = None
+    _cache: dict[str, Any] = field(default_factory=dict, compare=False, init=False)
+
+    @under_cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment for storage."""
+        return json_fragment(
+            json_bytes(
+                {
+                    "color": self.color,
+                    "description": self.description,
+                    "icon": self.icon,
+                    "label_id": self.label_id,
+                    "name": self.name,
+                    "created_at": self.created_at.isoformat(),
+                    "modified_at": self.modified_at.isoformat(),
+                }
+            )
+        )
 
 
 class LabelRegistryStore(Store[LabelRegistryStoreData]):
@@ -247,20 +272,11 @@ class LabelRegistry(BaseRegistry[LabelRegistryStoreData]):
     @callback
     def _data_to_save(self) -> LabelRegistryStoreData:
         """Return data of label registry to store in a file."""
-        return {
-            "labels": [
-                {
-                    "color": entry.color,
-                    "description": entry.description,
-                    "icon": entry.icon,
-                    "label_id": entry.label_id,
-                    "name": entry.name,
-                    "created_at": entry.created_at.isoformat(),
-                    "modified_at": entry.modified_at.isoformat(),
-                }
-                for entry in self.labels.values()
-            ]
-        }
+        # The storage fragments are serialized like the stored labels
+        return cast(
+            LabelRegistryStoreData,
+            {"labels": [entry.as_storage_fragment for entry in self.labels.values()]},
+        )
 
 
 @callback
@@ -0,0 +1,99 @@
+"""Schedule the polling of entity platforms."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+# Half of the executor workers, so updates of polled entities
+# can not starve the other jobs which run in the executor
+MAX_PARALLEL_EXECUTOR_UPDATES = 32
+# The fractional parts of multiples of the golden ratio are spread
+# evenly over the unit interval for any number of platforms
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+
+@dataclass(slots=True)
+class PollStats:
+    """Statistics of the polls of an entity platform."""
+
+    polls: int = 0
+    overruns: int = 0
+    last_duration: float = 0
+    max_duration: float = 0
+    total_duration: float = 0
+
+    @property
+    def average_duration(self) -> float:
+        """Return the average duration of a poll."""
+        return self.total_duration / self.polls if self.polls else 0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return a dict representation of the statistics."""
+        return {
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "average_duration": self.average_duration,
+        }
+
+
+class PollingScheduler:
+    """Spread the polls of the entity platforms over their scan interval.
+
+    All entities with a synchronous update method share a budget of
+    executor workers, so the polls of many platforms which are due at
+    the same time can not fill up the executor.
+    """
+
+    __slots__ = ("_platforms", "executor_updates", "stats")
+
+    def __init__(self) -> None:
+        """Initialize the polling scheduler."""
+        self._platforms = 0
+        self.executor_updates = asyncio.Semaphore(MAX_PARALLEL_EXECUTOR_UPDATES)
+        self.stats: dict[str, PollStats] = {}
+
+    @callback
+    def async_first_poll_delay(self, scan_interval: float) -> float:
+        """Return the delay before the first poll of a platform.
+
+        The first poll is moved up by a part of the scan interval, so
+        platforms which are set up at the same time do not poll at the
+        same time for every interval after that.
+        """
+        offset = (self._platforms * _GOLDEN_RATIO_CONJUGATE) % 1
+        self._platforms += 1
+        return scan_interval * (1 - offset)
+
+    @callback
+    def async_record_poll(self, key: str, duration: float) -> None:
+        """Record the duration of a poll of a platform."""
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = PollStats()
+        stats.polls += 1
+        stats.last_duration = duration
+        stats.total_duration += duration
+        stats.max_duration = max(stats.max_duration, duration)
+
+    @callback
+    def async_record_overrun(self, key: str) -> None:
+        """Record a poll which was skipped as the previous one was running."""
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = PollStats()
+        stats.overruns += 1
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler()
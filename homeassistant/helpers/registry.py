@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Callable, ItemsView, Mapping, Sequence, ValuesView
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -18,6 +19,73 @@ SAVE_DELAY_LONG = 180
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
 
+class LazyRegistryEntries[_DataT](dict[str, _DataT]):
+    """Registry entries which are created from their stored data on first access.
+
+    The stored data of an entry is kept in the dict until the entry is read,
+    so loading a registry does not have to create entries which are not used
+    yet. The indexes of the registry items are built from the stored data.
+    """
+
+    __slots__ = ("_create_entry", "create_time", "created", "pending")
+
+    def __init__(self, create_entry: Callable[[dict[str, Any]], _DataT]) -> None:
+        """Initialize the entries."""
+        super().__init__()
+        self._create_entry = create_entry
+        self.created = 0
+        self.pending = 0
+        self.create_time = 0.0
+
+    def add_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Add the stored data of an entry."""
+        dict.__setitem__(self, key, stored)  # type: ignore[misc]
+        self.pending += 1
+
+    def _create(self, key: str, stored: dict[str, Any]) -> _DataT:
+        """Create an entry from its stored data."""
+        start = monotonic()
+        entry = self._create_entry(stored)
+        dict.__setitem__(self, key, entry)
+        self.create_time += monotonic() - start
+        self.created += 1
+        self.pending -= 1
+        return entry
+
+    def _create_all(self) -> None:
+        """Create all entries which have not been accessed yet."""
+        for key, value in dict.items(self):
+            if type(value) is dict:
+                self._create(key, value)
+
+    def __getitem__(self, key: str) -> _DataT:
+        """Return an entry."""
+        value = dict.__getitem__(self, key)
+        if type(value) is dict:
+            return self._create(key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return an entry or the default."""
+        if (value := dict.get(self, key)) is None:
+            return default
+        if type(value) is dict:
+            return self._create(key, value)
+        return value
+
+    def values(self) -> ValuesView[_DataT]:  # type: ignore[override]
+        """Return the entries."""
+        if self.pending:
+            self._create_all()
+        return dict.values(self)
+
+    def items(self) -> ItemsView[str, _DataT]:  # type: ignore[override]
+        """Return the keys and entries."""
+        if self.pending:
+            self._create_all()
+        return dict.items(self)
+
+
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     """Base class for registry items."""
 
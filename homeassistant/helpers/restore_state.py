@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
 import logging
-from typing import Any, Self, cast
+import time
+from typing import Any, NamedTuple, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
@@ -18,7 +21,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -35,6 +38,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an unchanged state is kept when dumping,
+# the state of an entity which no longer exists expires up to this much early
+STATE_LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -81,6 +88,11 @@ class StoredState:
             "last_seen": self.last_seen,
         }
 
+    @cached_property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment of the stored state for storage."""
+        return json_fragment(json_bytes(self.as_dict()))
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -96,6 +108,36 @@ class StoredState:
         )
 
 
+class _DumpedState(NamedTuple):
+    """A stored state of an entity which was dumped."""
+
+    stored_state: StoredState
+    extra_data: dict[str, Any] | None
+
+
+@dataclass(slots=True)
+class DumpStats:
+    """Statistics of the dumps of the restore states."""
+
+    dumps: int = 0
+    last_duration: float = 0
+    last_states: int = 0
+    last_serialized: int = 0
+    last_bytes_written: int = 0
+    total_bytes_written: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return a dict representation of the statistics."""
+        return {
+            "dumps": self.dumps,
+            "last_duration": self.last_duration,
+            "last_states": self.last_states,
+            "last_serialized": self.last_serialized,
+            "last_bytes_written": self.last_bytes_written,
+            "total_bytes_written": self.total_bytes_written,
+        }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -135,10 +177,14 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self.dump_stats = DumpStats()
+        # The stored states of the entities in the last dump, an unchanged
+        # state is dumped again with the fragment which is already serialized
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -188,15 +234,30 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
-            )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
+        stored_states: list[StoredState] = []
+        dumped_states = self._dumped_states
+        self._dumped_states = {}
+        refresh_time = now - STATE_LAST_SEEN_REFRESH_INTERVAL
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            if (
+                (dumped := dumped_states.get(entity_id)) is None
+                or dumped.stored_state.state is not state
+                or dumped.stored_state.last_seen < refresh_time
+                # The same dict may have been changed in place
+                or (
+                    extra_data_dict is not None and dumped.extra_data is extra_data_dict
+                )
+                or dumped.extra_data != extra_data_dict
+            ):
+                dumped = _DumpedState(
+                    StoredState(state, extra_data, now), extra_data_dict
+                )
+            self._dumped_states[entity_id] = dumped
+            stored_states.append(dumped.stored_state)
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -215,17 +276,44 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the stored states which changed since the last dump are
+        serialized, and the store appends only the changed states to
+        its journal.
+        """
         _LOGGER.debug("Dumping states")
+        start = time.monotonic()
+        stats = self.dump_stats
+        stored_states = self.async_get_stored_states()
+        serialized = 0
+        data: list[Any] = []
+        for stored_state in stored_states:
+            if "as_storage_fragment" not in stored_state.__dict__:
+                serialized += 1
+            try:
+                data.append(stored_state.as_storage_fragment)
+            except TypeError:
+                # Let the store report where the data can not be serialized
+                data.append(stored_state.as_dict())
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(data)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        stats.dumps += 1
+        stats.last_duration = time.monotonic() - start
+        stats.last_states = len(stored_states)
+        stats.last_serialized = serialized
+        stats.last_bytes_written = self.store.last_write_size
+        stats.total_bytes_written += self.store.last_write_size
+        _LOGGER.debug(
+            "Dumped %s states (%s serialized) in %.3f seconds, wrote %s bytes",
+            stats.last_states,
+            stats.last_serialized,
+            stats.last_duration,
+            stats.last_bytes_written,
+        )
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
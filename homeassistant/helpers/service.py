@@ -9,7 +9,7 @@ from enum import Enum
 from functools import cache, partial
 import logging
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, TypeGuard, cast
 
 import voluptuous as vol
 
@@ -48,6 +48,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import Integration, async_get_integrations, bind_hass
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
 from homeassistant.util.yaml.loader import JSON_TYPE
@@ -64,6 +65,7 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .singleton import singleton
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -79,6 +81,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[TargetIndex] = HassKey("service_target_index")
 
 
 @cache
@@ -501,8 +504,245 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+class _LabelTarget(NamedTuple):
+    """Items which are referenced by a label."""
+
+    areas: frozenset[str]
+    devices: frozenset[str]
+    entities: frozenset[str]
+
+
+class _AreaTarget(NamedTuple):
+    """Items which are referenced by an area."""
+
+    devices: frozenset[str]
+    entities: frozenset[str]
+
+
+class _DeviceTarget(NamedTuple):
+    """Entities which are referenced by a device."""
+
+    entities: frozenset[str]
+    entities_without_area: frozenset[str]
+
+
+def _is_targetable(entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity can be targeted by a device, area, floor or label.
+
+    Entities which are hidden or which are config
+    or diagnostic entities are not targeted.
+    """
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+class TargetIndex:
+    """Reverse index of the items referenced by labels, floors, areas and devices.
+
+    The index is filled on demand and cleared when any of the registries
+    is updated, so resolving the targets of a service call is a union of
+    sets instead of walking the registries for every call.
+    """
+
+    __slots__ = (
+        "_areas",
+        "_devices",
+        "_floors",
+        "_hass",
+        "_labels",
+        "_registries",
+        "hits",
+        "misses",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._labels: dict[str, _LabelTarget] = {}
+        self._floors: dict[str, frozenset[str]] = {}
+        self._areas: dict[str, _AreaTarget] = {}
+        self._devices: dict[str, _DeviceTarget] = {}
+        self._registries: tuple[Any, ...] = ()
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Clear the index when any of the registries is updated."""
+        bus = self._hass.bus
+        event_types: tuple[EventType[Any], ...] = (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        )
+        for event_type in event_types:
+            bus.async_listen(event_type, self._async_clear)
+
+    @callback
+    def _async_clear(self, _event: Any = None) -> None:
+        """Clear the index."""
+        self._labels.clear()
+        self._floors.clear()
+        self._areas.clear()
+        self._devices.clear()
+
+    @callback
+    def async_resolve(
+        self, selector: ServiceTargetSelector, selected: SelectedEntities
+    ) -> None:
+        """Add the items referenced by the selector to the selected entities."""
+        hass = self._hass
+        ent_reg = entity_registry.async_get(hass)
+        entities = ent_reg.entities
+        dev_reg = device_registry.async_get(hass)
+        area_reg = area_registry.async_get(hass)
+        registries = (ent_reg, dev_reg, area_reg)
+        if not self._registries or any(
+            registry is not indexed
+            for registry, indexed in zip(registries, self._registries, strict=True)
+        ):
+            # The registries were replaced since the index was filled
+            self._async_clear()
+            self._registries = registries
+
+        if selector.floor_ids:
+            floor_reg = floor_registry.async_get(hass)
+            for floor_id in selector.floor_ids:
+                if floor_id not in floor_reg.floors:
+                    selected.missing_floors.add(floor_id)
+                selected.referenced_areas.update(self._floor_areas(area_reg, floor_id))
+
+        for area_id in selector.area_ids:
+            if area_id not in area_reg.areas:
+                selected.missing_areas.add(area_id)
+
+        for device_id in selector.device_ids:
+            if device_id not in dev_reg.devices:
+                selected.missing_devices.add(device_id)
+
+        if selector.label_ids:
+            label_reg = label_registry.async_get(hass)
+            for label_id in selector.label_ids:
+                if label_id not in label_reg.labels:
+                    selected.missing_labels.add(label_id)
+                label = self._label(entities, dev_reg, area_reg, label_id)
+                selected.indirectly_referenced.update(label.entities)
+                selected.referenced_devices.update(label.devices)
+                selected.referenced_areas.update(label.areas)
+
+        selected.referenced_devices.update(selector.device_ids)
+        selected.referenced_areas.update(selector.area_ids)
+        for area_id in selected.referenced_areas:
+            area = self._area(entities, dev_reg, area_id)
+            selected.referenced_devices.update(area.devices)
+            # The entity's area matches a targeted area
+            selected.indirectly_referenced.update(area.entities)
+
+        for device_id in selected.referenced_devices:
+            device = self._device(entities, device_id)
+            if device_id in selector.device_ids:
+                # The entity's device matches a targeted device
+                selected.indirectly_referenced.update(device.entities)
+            else:
+                # The entity's device matches a device referenced
+                # by an area or label and the entity has no explicitly set area
+                selected.indirectly_referenced.update(device.entities_without_area)
+
+    def _label(
+        self,
+        entities: entity_registry.EntityRegistryItems,
+        dev_reg: device_registry.DeviceRegistry,
+        area_reg: area_registry.AreaRegistry,
+        label_id: str,
+    ) -> _LabelTarget:
+        """Return the items referenced by a label."""
+        if (label := self._labels.get(label_id)) is not None:
+            self.hits += 1
+            return label
+        self.misses += 1
+        label = self._labels[label_id] = _LabelTarget(
+            frozenset(
+                entry.id for entry in area_reg.areas.get_areas_for_label(label_id)
+            ),
+            frozenset(
+                entry.id for entry in dev_reg.devices.get_devices_for_label(label_id)
+            ),
+            frozenset(
+                entry.entity_id
+                for entry in entities.get_entries_for_label(label_id)
+                if _is_targetable(entry)
+            ),
+        )
+        return label
+
+    def _floor_areas(
+        self, area_reg: area_registry.AreaRegistry, floor_id: str
+    ) -> frozenset[str]:
+        """Return the areas on a floor."""
+        if (areas := self._floors.get(floor_id)) is not None:
+            self.hits += 1
+            return areas
+        self.misses += 1
+        areas = self._floors[floor_id] = frozenset(
+            entry.id for entry in area_reg.areas.get_areas_for_floor(floor_id)
+        )
+        return areas
+
+    def _area(
+        self,
+        entities: entity_registry.EntityRegistryItems,
+        dev_reg: device_registry.DeviceRegistry,
+        area_id: str,
+    ) -> _AreaTarget:
+        """Return the items referenced by an area."""
+        if (area := self._areas.get(area_id)) is not None:
+            self.hits += 1
+            return area
+        self.misses += 1
+        area = self._areas[area_id] = _AreaTarget(
+            frozenset(
+                entry.id for entry in dev_reg.devices.get_devices_for_area_id(area_id)
+            ),
+            frozenset(
+                entry.entity_id
+                for entry in entities.get_entries_for_area_id(area_id)
+                if _is_targetable(entry)
+            ),
+        )
+        return area
+
+    def _device(
+        self, entities: entity_registry.EntityRegistryItems, device_id: str
+    ) -> _DeviceTarget:
+        """Return the entities referenced by a device."""
+        if (device := self._devices.get(device_id)) is not None:
+            self.hits += 1
+            return device
+        self.misses += 1
+        entries = [
+            entry
+            for entry in entities.get_entries_for_device_id(device_id)
+            if _is_targetable(entry)
+        ]
+        device = self._devices[device_id] = _DeviceTarget(
+            frozenset(entry.entity_id for entry in entries),
+            frozenset(entry.entity_id for entry in entries if not entry.area_id),
+        )
+        return device
+
+
+@callback
+@singleton(TARGET_INDEX)
+def async_get_target_index(hass: HomeAssistant) -> TargetIndex:
+    """Return the reverse index of the targets of service calls."""
+    index = TargetIndex(hass)
+    index.async_setup()
+    return index
+
+
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,95 +766,7 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
-
-    if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
-        for floor_id in selector.floor_ids:
-            if floor_id not in floor_reg.floors:
-                selected.missing_floors.add(floor_id)
-
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
-
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
-
-    if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
-        for label_id in selector.label_ids:
-            if label_id not in label_reg.labels:
-                selected.missing_labels.add(label_id)
-
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
-
-    # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
-
-    # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
-
-    selected.referenced_areas.update(selector.area_ids)
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            selected.referenced_devices.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
-            )
-        )
-    )
+    async_get_target_index(hass).async_resolve(selector, selected)
     return selected
 
 
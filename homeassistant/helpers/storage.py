@@ -32,7 +32,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +49,8 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -227,6 +229,247 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class _StoreJournal:
+    """Append the changes of the data of a store to a journal file.
+
+    The journal is a JSON Lines file next to the store file. Its first line
+    holds the size and modification time of the snapshot in the store file it
+    applies to and every other line is a change of the top level lists or
+    values of the data since that snapshot. The store file itself is written
+    unchanged, so it can be read without the journal. The items of the lists
+    are compared by identity first, so data which reuses the objects of
+    unchanged items, like the cached fragments of the registry entries, is
+    diffed in linear time.
+
+    The journal is compacted into a new snapshot on the first write, when it
+    grows larger than the snapshot and on the final write at shutdown.
+    """
+
+    __slots__ = (
+        "_journal_size",
+        "_private",
+        "_saved",
+        "_snapshot_size",
+        "_version",
+        "compact",
+        "pending",
+    )
+
+    def __init__(self, private: bool) -> None:
+        """Initialize the journal."""
+        self._private = private
+        self._saved: dict[str | None, Any] | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
+        self._version: tuple[int, int] | None = None
+        self.compact = False
+        # The journal holds records which are not in the snapshot
+        self.pending = False
+
+    def replay(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal of the snapshot in the store file to its data."""
+        self.pending = False
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        try:
+            with open(journal_path, "rb") as journal_file:
+                lines = journal_file.read().split(b"\n")
+            header = json_util.json_loads(lines[0])
+        except FileNotFoundError:
+            return data
+        except ValueError:
+            header = None
+        if header != _journal_header(path):
+            _LOGGER.debug("Ignoring stale journal %s", journal_path)
+            return data
+        stored = data["data"]
+        replayed = 0
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                _apply_journal_record(stored, json_util.json_loads_object(line))
+            except (ValueError, LookupError, TypeError):
+                # A write was interrupted, the records after
+                # it were never acknowledged to the caller
+                _LOGGER.warning(
+                    "Ignoring invalid record in journal %s after %s records",
+                    journal_path,
+                    replayed,
+                )
+                break
+            replayed += 1
+        _LOGGER.debug("Replayed %s records of journal %s", replayed, journal_path)
+        self.pending = replayed > 0
+        return data
+
+    def fold(self, path: str, atomic_writes: bool) -> int:
+        """Write the snapshot with the records of the journal applied.
+
+        Returns the number of bytes written.
+        """
+        if not self.pending:
+            return 0
+        if not (data := json_util.load_json_object(path)):
+            return 0
+        data = self.replay(path, data)
+        return self._compact(path, data, _journal_values(data["data"]), atomic_writes)
+
+    def write(self, path: str, data: dict[str, Any], atomic_writes: bool) -> int:
+        """Append the changes since the last write or compact the journal.
+
+        Returns the number of bytes written.
+        """
+        values = _journal_values(data["data"])
+        saved = self._saved
+        if (
+            saved is None
+            or self.compact
+            or saved.keys() != values.keys()
+            or self._version != (data["version"], data["minor_version"])
+        ):
+            return self._compact(path, data, values, atomic_writes)
+        records: list[dict[str, Any]] = []
+        for key, value in values.items():
+            if (old := saved[key]) is value:
+                continue
+            if isinstance(value, list) and isinstance(old, list):
+                records.extend(_diff_journal_list(key, old, value))
+            elif old != value:
+                records.append({"k": key, "op": "put", "v": value})
+        if not records:
+            self._saved = values
+            return 0
+        try:
+            payload = b"".join(
+                json_helper.json_bytes(record) + b"\n" for record in records
+            )
+        except TypeError:
+            # Let the snapshot report where the data can not be serialized
+            return self._compact(path, data, values, atomic_writes)
+        if self._journal_size + len(payload) > self._snapshot_size:
+            return self._compact(path, data, values, atomic_writes)
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        try:
+            fd = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            _LOGGER.exception("Appending to journal failed: %s", journal_path)
+            # The journal may end with a partial record now
+            self._saved = None
+            raise WriteError(error) from error
+        self._journal_size += len(payload)
+        self._saved = values
+        self.pending = True
+        return len(payload)
+
+    def _compact(
+        self,
+        path: str,
+        data: dict[str, Any],
+        values: dict[str | None, Any],
+        atomic_writes: bool,
+    ) -> int:
+        """Write a new snapshot and start an empty journal for it."""
+        self._saved = None
+        self.compact = False
+        json_helper.save_json(path, data, self._private, atomic_writes=atomic_writes)
+        self.pending = False
+        header = json_helper.json_bytes(_journal_header(path)) + b"\n"
+        write_utf8_file_atomic(
+            f"{path}{JOURNAL_SUFFIX}", header, self._private, mode="wb"
+        )
+        self._snapshot_size = os.path.getsize(path)
+        self._journal_size = len(header)
+        self._version = (data["version"], data["minor_version"])
+        self._saved = values
+        return self._snapshot_size + self._journal_size
+
+
+def _journal_header(path: str) -> dict[str, int] | None:
+    """Return the header of the journal of the snapshot in a store file."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def _journal_values(stored: Any) -> dict[str | None, Any]:
+    """Return the top level values of the data of a store to diff."""
+    if isinstance(stored, list):
+        return {None: list(stored)}
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in stored.items()
+    }
+
+
+def _diff_journal_list(
+    key: str | None, old: list[Any], new: list[Any]
+) -> list[dict[str, Any]]:
+    """Return the journal records which change the old list into the new list."""
+    records: list[dict[str, Any]] = []
+    # Skip the common start and end, which usually leaves only the changed items
+    start = 0
+    old_end = len(old)
+    new_end = len(new)
+    while start < old_end and start < new_end and old[start] is new[start]:
+        start += 1
+    while old_end > start and new_end > start and old[old_end - 1] is new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    old_positions = {id(old[idx]): idx for idx in range(start, old_end)}
+    new_ids = {id(new[idx]) for idx in range(start, new_end)}
+    # The position in the old list and the position in the list
+    # the records have been applied to so far
+    idx = cursor = start
+    for item in new[start:new_end]:
+        position = old_positions.get(id(item))
+        if position is not None and position >= idx:
+            if position > idx:
+                records.append(
+                    {"k": key, "op": "del", "i": cursor, "n": position - idx}
+                )
+            idx = position + 1
+        elif idx < old_end and old[idx] == item:
+            idx += 1
+        elif idx < old_end and id(old[idx]) not in new_ids:
+            records.append({"k": key, "op": "set", "i": cursor, "v": item})
+            idx += 1
+        else:
+            records.append({"k": key, "op": "ins", "i": cursor, "v": item})
+        cursor += 1
+    if idx < old_end:
+        records.append({"k": key, "op": "del", "i": cursor, "n": old_end - idx})
+    return records
+
+
+def _apply_journal_record(stored: Any, record: dict[str, Any]) -> None:
+    """Apply a record of a journal to the data of a store."""
+    key = record["k"]
+    op = record["op"]
+    if op == "put":
+        stored[key] = record["v"]
+        return
+    target = stored if key is None else stored[key]
+    if op == "set":
+        target[record["i"]] = record["v"]
+    elif op == "ins":
+        target.insert(record["i"], record["v"])
+    elif op == "del":
+        del target[record["i"] : record["i"] + record["n"]]
+    else:
+        raise ValueError(f"Unknown journal operation {op}")
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -242,8 +485,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, changes are appended to a journal file instead
+        of rewriting the whole file for every save. This is only supported
+        with the default encoder.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +508,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal: _StoreJournal | None = None
+        if journal and (encoder is None or encoder is json_helper.JSONEncoder):
+            self._journal = _StoreJournal(private)
+        # Number of bytes written to disk by the last write
+        self.last_write_size = 0
 
     @cached_property
     def path(self):
@@ -388,6 +642,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._journal is not None:
+            data = await self.hass.async_add_executor_job(
+                self._journal.replay, self.path, data
+            )
+            if self._journal.pending:
+                self._async_ensure_final_write_listener()
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -518,8 +779,26 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal is not None:
+            self._journal.compact = True
+            if self._data is None:
+                await self._async_fold_journal()
+                return
         await self._async_handle_write_data()
 
+    async def _async_fold_journal(self) -> None:
+        """Fold the journal into the snapshot when there is nothing to write."""
+        assert self._journal is not None
+        async with self._write_lock:
+            if self._read_only:
+                return
+            try:
+                self.last_write_size = await self.hass.async_add_executor_job(
+                    self._journal.fold, self.path, self._atomic_writes
+                )
+            except (json_util.SerializationError, HomeAssistantError) as err:
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
         async with self._write_lock:
@@ -542,6 +821,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.pending:
+                # Fold the journal into the snapshot at shutdown
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -552,6 +835,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None:
+            _LOGGER.debug("Writing journal for %s to %s", self.key, path)
+            self.last_write_size = self._journal.write(path, data, self._atomic_writes)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +848,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        self.last_write_size = os.path.getsize(path)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +862,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
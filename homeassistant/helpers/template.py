@@ -23,7 +23,7 @@ import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
 from types import CodeType, TracebackType
-from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
+from typing import Any, Concatenate, Literal, NamedTuple, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -102,6 +102,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_RENDER_INFO_CACHE: HassKey[RenderInfoCache] = HassKey("template.render_info_cache")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -151,6 +152,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+CACHED_RENDER_INFOS = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
@@ -385,6 +387,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "full_state_entities",
         "rate_limit",
         "has_time",
     )
@@ -403,6 +406,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which more than the state string was accessed
+        self.full_state_entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -458,6 +463,7 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.full_state_entities = frozenset(self.full_state_entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -490,6 +496,147 @@ class RenderInfo:
             self.filter = _false
 
 
+class _CachedRender(NamedTuple):
+    """A render of a template and the states it depended on."""
+
+    render_info: RenderInfo
+    versions: tuple[Any, ...]
+
+
+class _IdentityKey:
+    """Compare an unhashable variable by identity in a cache key.
+
+    The key holds a reference to the variable, so its id can not be reused
+    by another object while the key is cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        """Initialize the key."""
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        """Return the hash of the identity of the variable."""
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        """Return if the other key is for the same variable."""
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
+def _variables_key(variables: TemplateVarsType) -> tuple[Any, ...]:
+    """Return a cache key for the values of the variables of a render."""
+    if not variables:
+        return ()
+    key: list[tuple[str, Any]] = []
+    for name, value in variables.items():
+        try:
+            hash(value)
+        except TypeError:
+            value = _IdentityKey(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+class RenderInfoCache:
+    """Cache the renders of templates by the states they depended on.
+
+    A render is reused when the same compiled template is rendered with equal
+    variables and none of the states it accessed have changed since. Variables
+    which can not be hashed, like state objects, must be the same object.
+    Only the state string is compared for entities of which nothing else was
+    accessed, so attribute-only changes of those entities do not re-render.
+
+    Renders which depend on the time, on all states, on whole domains or
+    which failed are not cached.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._renders: LRU[tuple[jinja2.Template, tuple[Any, ...]], _CachedRender] = (
+            LRU(CACHED_RENDER_INFOS)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _versions(self, render_info: RenderInfo) -> tuple[Any, ...] | None:
+        """Return the versions of the states a render depended on.
+
+        The version is the state string if only the state was accessed,
+        otherwise the State object as it is replaced on every change.
+        """
+        if (
+            render_info.exception
+            or render_info.is_static
+            or render_info.has_time
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+        ):
+            return None
+        get_state = self._hass.states.get
+        full_state_entities = render_info.full_state_entities
+        return tuple(
+            None
+            if (state := get_state(entity_id)) is None
+            else state
+            if entity_id in full_state_entities
+            else state.state
+            for entity_id in render_info.entities
+        )
+
+    @callback
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType = None,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+        force: bool = False,
+    ) -> RenderInfo:
+        """Render the template unless a cached render is still valid.
+
+        If force is True the template is always rendered.
+        """
+        variables_key = _variables_key(variables)
+        if (
+            not force
+            and (compiled := template._compiled) is not None  # noqa: SLF001
+            and (cached := self._renders.get((compiled, variables_key))) is not None
+            and cached.versions == self._versions(cached.render_info)
+        ):
+            self.hits += 1
+            return cached.render_info
+        self.misses += 1
+        render_info = template.async_render_to_info(
+            variables, strict=strict, log_fn=log_fn
+        )
+        # The template is compiled by the first render
+        if (compiled := template._compiled) is None:  # noqa: SLF001
+            return render_info
+        key = (compiled, variables_key)
+        if (versions := self._versions(render_info)) is not None:
+            self._renders[key] = _CachedRender(render_info, versions)
+        elif key in self._renders:
+            del self._renders[key]
+        return render_info
+
+    @callback
+    def async_clear(self) -> None:
+        """Remove all cached renders."""
+        self._renders.clear()
+
+
+@callback
+@singleton(_RENDER_INFO_CACHE)
+def async_get_render_info_cache(hass: HomeAssistant) -> RenderInfoCache:
+    """Return the render info cache."""
+    return RenderInfoCache(hass)
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -780,10 +927,12 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        value_json: Any = _SENTINEL,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers which already
+        parsed value can pass its JSON value as value_json.
 
         This method must be run in the event loop.
         """
@@ -797,10 +946,13 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if value_json is not _SENTINEL:
+            variables["value_json"] = value_json
+        else:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -1042,6 +1194,11 @@ class TemplateStateBase(State):
         self._cache: dict[str, Any] = {}
 
     def _collect_state(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.full_state_entities.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_state_string(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
@@ -1053,6 +1210,8 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item != "state":
+                    render_info.full_state_entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1071,7 +1230,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_string()
         return self._state.state
 
     @property
@@ -1196,6 +1355,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect.full_state_entities.add(entity_id)  # type: ignore[attr-defined]
 
 
 def _state_generator(
@@ -2791,6 +2951,9 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
     _get_hass_loader(hass).sources = custom_templates
+    # Cached renders may have used the previous macros
+    if (render_info_cache := hass.data.get(_RENDER_INFO_CACHE)) is not None:
+        render_info_cache.async_clear()
 
 
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
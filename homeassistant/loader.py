@@ -7,11 +7,13 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
 import importlib
+from itertools import chain
 import logging
 import os
 import pathlib
@@ -29,7 +31,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -41,6 +43,7 @@ from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED
+from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
@@ -49,6 +52,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -132,6 +136,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -149,6 +154,17 @@ IMPORT_EVENT_LOOP_WARNING = (
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+# Manifests of development versions can be changed without changing the
+# version, so the cache of the manifests is only used for releases
+MANIFEST_CACHE_ENABLED = "dev" not in __version__
+# The import executor has a single worker, limiting the imports which are
+# queued ahead of time lets the imports which are waited for by the setup
+# of an integration run next instead of after all queued imports
+MAX_PENDING_IMPORTS = 2
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -262,6 +278,13 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class CachedManifest(TypedDict):
+    """Manifest and top level files of a built-in integration."""
+
+    manifest: Manifest
+    files: list[str]
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -748,6 +771,23 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_cache(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        cached: CachedManifest,
+    ) -> Integration:
+        """Resolve a built-in integration from the manifest cache."""
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__path__[0]) / domain,
+            cached["manifest"].copy(),
+            set(cached["files"]),
+        )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -1403,6 +1443,19 @@ async def async_get_integrations(
         if domain in needed:
             del needed[domain]
 
+    manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
+    if needed and manifest_cache:
+        from . import components  # pylint: disable=import-outside-toplevel
+
+        for domain, future in list(needed.items()):
+            if cached := manifest_cache.integrations.get(domain):
+                results[domain] = cache[domain] = Integration.resolve_from_cache(
+                    hass, components, domain, cached
+                )
+                future.set_result(None)
+                del needed[domain]
+                manifest_cache.hits += 1
+
     # Now the rest use resolve_from_root
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
@@ -1410,6 +1463,8 @@ async def async_get_integrations(
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
+        if manifest_cache:
+            manifest_cache.async_add(integrations.values())
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -1427,6 +1482,130 @@ async def async_get_integrations(
     return results
 
 
+class ManifestCache:
+    """Cache of the manifests and top level files of built-in integrations.
+
+    The cache is stored for the version of Home Assistant, so the next start
+    does not have to read the manifests and list the files of the built-in
+    integrations from disk.
+    """
+
+    __slots__ = ("_store", "hits", "integrations", "misses")
+
+    def __init__(
+        self, store: Store[dict[str, Any]], integrations: dict[str, CachedManifest]
+    ) -> None:
+        """Initialize the manifest cache."""
+        self._store = store
+        self.integrations = integrations
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_add(self, integrations: Iterable[Integration]) -> None:
+        """Add integrations which were resolved from disk to the cache."""
+        for integration in integrations:
+            manifest = integration.manifest.copy()
+            del manifest["is_built_in"]
+            self.integrations[integration.domain] = {
+                "manifest": manifest,
+                "files": sorted(integration._top_level_files),  # noqa: SLF001
+            }
+            self.misses += 1
+            self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        return {"ha_version": __version__, "integrations": self.integrations}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the cache of the manifests of the built-in integrations."""
+    if not MANIFEST_CACHE_ENABLED or DATA_MANIFEST_CACHE in hass.data:
+        return
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[dict[str, Any]] = Store(
+        hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+    )
+    integrations: dict[str, CachedManifest] = {}
+    if (data := await store.async_load()) and data["ha_version"] == __version__:
+        integrations = data["integrations"]
+    hass.data[DATA_MANIFEST_CACHE] = ManifestCache(store, integrations)
+
+
+async def async_import_integrations(
+    hass: HomeAssistant, integrations: Mapping[str, Integration]
+) -> None:
+    """Import the components of integrations in the order of their dependencies.
+
+    The component of an integration is imported as soon as the components
+    of the integrations it depends on are imported, so an import job does
+    not have to wait for the import lock of a dependency which is imported
+    by another job, and the integrations which are set up in a later stage
+    do not have to wait for that stage to be imported.
+    """
+    if debug := _LOGGER.isEnabledFor(logging.DEBUG):
+        start = time.perf_counter()
+    remaining: dict[str, int] = {}
+    dependents: defaultdict[str, list[str]] = defaultdict(list)
+    for domain, integration in integrations.items():
+        dependencies = {
+            dependency
+            for dependency in chain(
+                integration.dependencies, integration.after_dependencies
+            )
+            if dependency in integrations and dependency != domain
+        }
+        remaining[domain] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(domain)
+    ready = deque(domain for domain, count in remaining.items() if not count)
+    for domain in ready:
+        del remaining[domain]
+    pending: set[asyncio.Task[str]] = set()
+    while ready or pending or remaining:
+        if not ready and not pending:
+            # Only integrations with circular after dependencies are left
+            ready.extend(remaining)
+            remaining.clear()
+        while ready and len(pending) < MAX_PENDING_IMPORTS:
+            integration = integrations[ready.popleft()]
+            pending.add(
+                create_eager_task(
+                    _async_import_component(integration),
+                    name=f"import {integration.domain}",
+                    loop=hass.loop,
+                )
+            )
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            for dependent in dependents.pop(task.result(), ()):
+                if dependent in remaining:
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        del remaining[dependent]
+                        ready.append(dependent)
+    if debug:
+        _LOGGER.debug(
+            "Imported %s integrations in %.3f seconds",
+            len(integrations),
+            time.perf_counter() - start,
+        )
+
+
+async def _async_import_component(integration: Integration) -> str:
+    """Import the component of an integration and return its domain."""
+    try:
+        await integration.async_get_component()
+    except ImportError as err:
+        # Failures are reported when the integration is set up
+        _LOGGER.debug("Unable to import %s ahead of setup: %s", integration.domain, err)
+    return integration.domain
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -72,6 +72,12 @@ async def async_load_installed_versions(
     await _async_get_manager(hass).async_load_installed_versions(requirements)
 
 
+@callback
+def async_requirements_installed(hass: HomeAssistant, requirements: list[str]) -> bool:
+    """Return if the requirements are known to be installed."""
+    return _async_get_manager(hass).is_installed_cache.issuperset(requirements)
+
+
 @callback
 @singleton.singleton(DATA_REQUIREMENTS_MANAGER)
 def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
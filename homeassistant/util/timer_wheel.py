@@ -0,0 +1,160 @@
+"""Timer wheel to coalesce timers on the event loop."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from collections.abc import Callable
+import math
+from typing import Any
+
+
+class TimerWheelHandle:
+    """Handle of a timer scheduled on a timer wheel."""
+
+    __slots__ = ("_args", "_bucket", "_callback", "_cancelled")
+
+    def __init__(
+        self, bucket: _TimerBucket, callback: Callable[..., Any], args: tuple[Any, ...]
+    ) -> None:
+        """Initialize the handle."""
+        self._bucket = bucket
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (
+            f"<TimerWheelHandle when={self._bucket.when} callback={self._callback}"
+            f"{' cancelled' if self._cancelled else ''}>"
+        )
+
+    def when(self) -> float:
+        """Return the loop time the timer fires at."""
+        return self._bucket.when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if not self._cancelled:
+            self._cancelled = True
+            self._bucket.remove(self)
+
+
+class _TimerBucket:
+    """Timers which fire with the same loop handle."""
+
+    __slots__ = ("handle", "timers", "wheel", "when")
+
+    def __init__(self, wheel: TimerWheel, when: float) -> None:
+        """Initialize the bucket."""
+        self.wheel = wheel
+        self.when = when
+        self.timers: dict[TimerWheelHandle, None] = {}
+        self.handle: TimerHandle | None = None
+
+    def remove(self, timer: TimerWheelHandle) -> None:
+        """Remove a cancelled timer from the bucket."""
+        timers = self.timers
+        timers.pop(timer, None)
+        if not timers and self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+            self.wheel.remove_bucket(self)
+
+
+class TimerWheel:
+    """Coalesce timers which may fire a little late into shared loop handles.
+
+    The loop time is divided into slots of the tolerance of a timer and
+    a timer is put in the bucket of the slot it ends in. All timers in a
+    bucket fire with a single loop handle at the end of the slot, so the
+    event loop only has to keep and wake up for one handle per bucket
+    instead of one per timer. Timers with a tolerance which is a multiple
+    of the tolerance of other timers share their buckets when they end in
+    the same slot.
+
+    A timer never fires early, but may fire up to its tolerance late.
+    """
+
+    __slots__ = ("_buckets", "_loop", "_started", "timers_fired", "wakeups")
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._buckets: dict[float, _TimerBucket] = {}
+        self._started = loop.time()
+        self.wakeups = 0
+        self.timers_fired = 0
+
+    @property
+    def buckets(self) -> int:
+        """Return the number of loop handles the timers are scheduled with."""
+        return len(self._buckets)
+
+    @property
+    def timers(self) -> int:
+        """Return the number of scheduled timers."""
+        return sum(len(bucket.timers) for bucket in self._buckets.values())
+
+    @property
+    def wakeups_per_second(self) -> float:
+        """Return the average number of loop wakeups per second."""
+        if (elapsed := self._loop.time() - self._started) <= 0:
+            return 0.0
+        return self.wakeups / elapsed
+
+    def call_at(
+        self,
+        when: float,
+        tolerance: float,
+        callback: Callable[..., Any],
+        *args: Any,
+    ) -> TimerWheelHandle:
+        """Schedule a callback at or up to tolerance seconds after a loop time.
+
+        Must be called from the event loop.
+        """
+        if tolerance > 0:
+            when = math.ceil(when / tolerance) * tolerance
+        if (bucket := self._buckets.get(when)) is None:
+            bucket = self._buckets[when] = _TimerBucket(self, when)
+            bucket.handle = self._loop.call_at(when, self._fire, bucket)
+        timer = TimerWheelHandle(bucket, callback, args)
+        bucket.timers[timer] = None
+        return timer
+
+    def remove_bucket(self, bucket: _TimerBucket) -> None:
+        """Remove a bucket which has no timers left."""
+        if self._buckets.get(bucket.when) is bucket:
+            del self._buckets[bucket.when]
+
+    def _fire(self, bucket: _TimerBucket) -> None:
+        """Run the timers of a bucket."""
+        self.remove_bucket(bucket)
+        bucket.handle = None
+        timers = bucket.timers
+        self.wakeups += 1
+        self.timers_fired += len(timers)
+        # Timers scheduled at the same time while running the
+        # callbacks go in a new bucket, so the timers do not change
+        for timer in list(timers):
+            if timer._cancelled:  # noqa: SLF001
+                continue
+            timer._cancelled = True  # noqa: SLF001
+            try:
+                timer._callback(*timer._args)  # noqa: SLF001
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer callback {timer!r}",
+                        "exception": exc,
+                        "handle": timer,
+                    }
+                )
+        timers.clear()
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import os
 from pathlib import Path
+import tarfile
+import threading
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.backup import BackupManager
+from homeassistant.components.backup.incremental import CHUNK_SIZE
 from homeassistant.components.backup.manager import BackupPlatformProtocol
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -195,6 +202,152 @@ async def test_generate_backup(
     assert "Loaded 0 platforms" in caplog.text
 
 
+async def test_generate_incremental_backup(
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test incremental backups share the chunks of unchanged data."""
+    config_dir = tmp_path / "config"
+    (config_dir / ".storage").mkdir(parents=True)
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    (config_dir / ".storage" / "core.config").write_text("{}")
+    database = os.urandom(CHUNK_SIZE * 2 + 100)
+    (config_dir / "home-assistant_v2.db").write_bytes(database)
+    (config_dir / "secrets.yaml").symlink_to("configuration.yaml")
+    hass.config.config_dir = str(config_dir)
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+
+    first = await manager.generate_backup(incremental=True)
+    assert first.path == manager.incremental_dir / f"{first.slug}.json"
+    chunks = {path.name for path in manager.chunk_store.path.glob("*/*")}
+    assert len(chunks) == 5
+
+    # Only the changed chunk of the database is added to the store
+    database = database[:CHUNK_SIZE] + os.urandom(CHUNK_SIZE) + database[-100:]
+    (config_dir / "home-assistant_v2.db").write_bytes(database)
+    second = await manager.generate_backup(incremental=True)
+    second_chunks = {path.name for path in manager.chunk_store.path.glob("*/*")}
+    assert len(second_chunks) == 6
+    assert chunks < second_chunks
+
+    # The backup is downloaded as a standard backup tar file
+    tar_file_path = await manager.async_export_backup(second)
+    assert tar_file_path == second.path.with_suffix(".tar")
+    with tarfile.open(tar_file_path, "r:") as backup_file:
+        backup_json = backup_file.extractfile("./backup.json")
+        assert backup_json is not None
+        assert json.loads(backup_json.read())["slug"] == second.slug
+        inner_tar = backup_file.extractfile("homeassistant.tar.gz")
+        assert inner_tar is not None
+        with tarfile.open(fileobj=io.BytesIO(inner_tar.read()), mode="r:gz") as core:
+            names = core.getnames()
+            database_file = core.extractfile("data/home-assistant_v2.db")
+            assert database_file is not None
+            assert database_file.read() == database
+            assert core.getmember("data/secrets.yaml").linkname == (
+                "configuration.yaml"
+            )
+    assert names == [
+        "data",
+        "data/.storage",
+        "data/.storage/core.config",
+        "data/backups",
+        "data/backups/incremental",
+        "data/configuration.yaml",
+        "data/home-assistant_v2.db",
+        "data/secrets.yaml",
+    ]
+
+    # Removing a backup removes the chunks only it referenced
+    await manager.remove_backup(second.slug)
+    assert not second.path.exists()
+    assert not tar_file_path.exists()
+    assert {path.name for path in manager.chunk_store.path.glob("*/*")} == chunks
+    await manager.remove_backup(first.slug)
+    assert not list(manager.chunk_store.path.glob("*/*"))
+
+
+async def test_remove_backup_during_incremental_backup(
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test chunks are not removed while an incremental backup is generated."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    database = os.urandom(CHUNK_SIZE * 2)
+    (config_dir / "home-assistant_v2.db").write_bytes(database)
+    hass.config.config_dir = str(config_dir)
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    first = await manager.generate_backup(incremental=True)
+
+    generating = threading.Event()
+    resume = threading.Event()
+    chunk_size = manager.chunk_store.size
+
+    def _chunk_size_slowly(digest: str) -> int:
+        # The chunks of the backup are added, its manifest is not written yet
+        generating.set()
+        resume.wait()
+        return chunk_size(digest)
+
+    with patch.object(manager.chunk_store, "size", _chunk_size_slowly):
+        backup_task = asyncio.create_task(manager.generate_backup(incremental=True))
+        try:
+            await hass.async_add_executor_job(generating.wait)
+            remove_task = asyncio.create_task(manager.remove_backup(first.slug))
+            await asyncio.wait([remove_task], timeout=0.1)
+            assert not remove_task.done()
+            assert first.path.exists()
+        finally:
+            resume.set()
+        second = await backup_task
+        await remove_task
+
+    assert not first.path.exists()
+    tar_file_path = await manager.async_export_backup(second)
+    with tarfile.open(tar_file_path, "r:") as backup_file:
+        inner_tar = backup_file.extractfile("homeassistant.tar.gz")
+        assert inner_tar is not None
+        with tarfile.open(fileobj=io.BytesIO(inner_tar.read()), mode="r:gz") as core:
+            database_file = core.extractfile("data/home-assistant_v2.db")
+            assert database_file is not None
+            assert database_file.read() == database
+
+
+async def test_load_backups_from_index(
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test unchanged backup files are not read again to load the backups."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "configuration.yaml").write_text("default_config:\n")
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    backup = await manager.generate_backup()
+    incremental_backup = await manager.generate_backup(incremental=True)
+
+    manager = BackupManager(hass)
+    with patch("tarfile.open", wraps=tarfile.open) as tarfile_open:
+        await manager.load_backups()
+    assert tarfile_open.call_count == 1
+    assert await manager.get_backups() == {
+        backup.slug: backup,
+        incremental_backup.slug: incremental_backup,
+    }
+
+    manager = BackupManager(hass)
+    with patch("tarfile.open", wraps=tarfile.open) as tarfile_open:
+        await manager.load_backups()
+    assert tarfile_open.call_count == 0
+    assert await manager.get_backups() == {
+        backup.slug: backup,
+        incremental_backup.slug: incremental_backup,
+    }
+
+
 async def test_loading_platforms(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -173,6 +173,57 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_from_recent_history(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period is answered from the recent history."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    start_time = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_wait_recording_done(hass)
+
+    recent_history = recorder_mock.recent_history
+    client = await hass_ws_client()
+    results = []
+    for msg_id in (1, 2):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "significant_changes_only": False,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        results.append(response["result"])
+        assert recent_history.hits == 1
+        # The second request is answered from the database
+        recent_history.async_clear()
+
+    assert recent_history.misses == 1
+    assert results[0] == results[1]
+    assert results[0] == {
+        "sensor.test": [
+            {
+                "a": {"any": "attr"},
+                "lu": pytest.approx(start_time.timestamp()),
+                "s": "on",
+            },
+            {"a": {"any": "attr"}, "lu": ANY, "s": "off"},
+            {"a": {"any": "changed"}, "lc": ANY, "lu": ANY, "s": "off"},
+        ]
+    }
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
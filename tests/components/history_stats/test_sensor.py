@@ -17,7 +17,7 @@ from homeassistant.components.history_stats.const import (
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     CONF_ENTITY_ID,
@@ -1722,7 +1722,8 @@ async def test_history_stats_handles_floored_timestamps(
         await async_update_entity(hass, "sensor.sensor1")
         await hass.async_block_till_done()
 
-    assert last_times == (start_time, start_time + timedelta(hours=2))
+    # The shared timeline of the entity is loaded up to now
+    assert last_times == (start_time, None)
 
 
 async def test_unique_id(
@@ -1796,3 +1797,119 @@ async def test_device_id(
     history_stats_entity = entity_registry.async_get("sensor.history_stats")
     assert history_stats_entity is not None
     assert history_stats_entity.device_id == source_entity.device_id
+
+
+async def test_shared_timeline(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test sensors of the same entity share a timeline loaded once from the database."""
+    await hass.config.async_set_time_zone("UTC")
+    start_time = dt_util.utcnow().replace(microsecond=0) + timedelta(seconds=1)
+
+    with (
+        freeze_time(start_time) as freezer,
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            wraps=history.state_changes_during_period,
+        ) as state_changes_during_period,
+    ):
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await async_wait_recording_done(hass)
+        freezer.tick(timedelta(minutes=70))
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor2",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        # The first refresh of each sensor queries its period
+        assert state_changes_during_period.call_count == 2
+
+        freezer.tick(timedelta(minutes=10))
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(minutes=10))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.83"
+        assert hass.states.get("sensor.sensor2").state == "2"
+        assert state_changes_during_period.call_count == 3
+
+        # The periods move forward without querying the database
+        freezer.tick(timedelta(minutes=55))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.92"
+        assert hass.states.get("sensor.sensor2").state == "1"
+        assert state_changes_during_period.call_count == 3
+
+
+async def test_shared_timeline_fixed_period(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a change just after the end of a fixed period is not counted."""
+    await hass.config.async_set_time_zone("UTC")
+    start_time = dt_util.utcnow().replace(microsecond=0) + timedelta(seconds=1)
+    period_start = start_time + timedelta(minutes=10)
+    period_end = start_time + timedelta(minutes=20)
+
+    with freeze_time(start_time) as freezer:
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_wait_recording_done(hass)
+        freezer.tick(timedelta(minutes=12))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await async_wait_recording_done(hass)
+        freezer.tick(timedelta(minutes=3))
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_wait_recording_done(hass)
+        freezer.move_to(period_end + timedelta(milliseconds=500))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(start_time + timedelta(minutes=30))
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": f"{{{{ {period_start.timestamp()} }}}}",
+                        "end": f"{{{{ {period_end.timestamp()} }}}}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1"
+
+        # The period is computed from the shared timeline
+        freezer.tick(timedelta(minutes=1))
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1"
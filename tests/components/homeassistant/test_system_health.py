@@ -0,0 +1,57 @@
+"""Test Home Assistant system health."""
+
+from datetime import timedelta
+
+from homeassistant.components.homeassistant import DOMAIN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.polling import async_get_polling_scheduler
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed, get_system_health_info
+
+
+async def test_system_health_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the wakeups of the timer wheel are reported."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert "timer_wakeups_per_second" not in info
+
+    @callback
+    def action(now: object) -> None:
+        """Do nothing."""
+
+    for _ in range(4):
+        async_call_later(hass, 10, action, tolerance=timedelta(seconds=5))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=16))
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert float(info["timer_wakeups_per_second"]) > 0
+    assert info["timers_per_wakeup"] == "4.0"
+
+
+async def test_system_health_polling(hass: HomeAssistant) -> None:
+    """Test the statistics of the polls are reported."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert "polled_platforms" not in info
+
+    scheduler = async_get_polling_scheduler(hass)
+    scheduler.async_record_poll("sensor.fast", 0.01)
+    scheduler.async_record_poll("sensor.slow", 0.2)
+    scheduler.async_record_poll("sensor.slow", 0.4)
+    scheduler.async_record_overrun("sensor.slow")
+    scheduler.async_record_overrun("light.other")
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["polled_platforms"] == 3
+    assert info["poll_overruns"] == 2
+    assert info["slowest_poll"] == "sensor.slow (300 ms)"
@@ -1,18 +1,25 @@
 """The tests for the MQTT client."""
 
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import socket
 import ssl
+import time
 from typing import Any
 from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+import paho.mqtt.matcher as paho_matcher
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -22,7 +29,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -1992,3 +2005,102 @@ async def test_loop_write_failure(
     await hass.async_block_till_done()
 
     assert "Disconnected from MQTT server test-broker:1883" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("#", "a/b/c", True),
+        ("+/+", "/b", True),
+        ("+", "$SYS", False),
+        ("#", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_subscription_trie_matches_paho(
+    topic_filter: str, topic: str, matches: bool
+) -> None:
+    """Test the subscription trie matches topics like paho's matcher."""
+    matcher = paho_matcher.MQTTMatcher()
+    matcher[topic_filter] = True
+    assert bool(next(matcher.iter_match(topic), False)) is matches
+
+    subscription = Subscription(topic_filter, False, HassJob(lambda msg: None))
+    trie = SubscriptionTrie()
+    trie.add(subscription)
+    assert list(trie.iter_match(topic)) == ([subscription] if matches else [])
+
+    trie.remove(subscription)
+    assert list(trie.iter_match(topic)) == []
+    with pytest.raises(KeyError):
+        trie.remove(subscription)
+
+
+async def test_subscribe_wildcard_after_topic_was_matched(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test cached matches are updated when subscriptions change."""
+    await mqtt_mock_entry()
+    unsub_simple = await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "simple")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 1
+
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "both")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    unsub_simple()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "wildcard")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+    unsub_wildcard()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "none")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+
+async def test_benchmark_dispatch_with_many_subscriptions(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark dispatching messages with 10k subscriptions.
+
+    The dispatch rate is recorded as a test property.
+    """
+    await mqtt_mock_entry()
+    received: list[ReceiveMessage] = []
+
+    @callback
+    def _record(msg: ReceiveMessage) -> None:
+        received.append(msg)
+
+    for device in range(5000):
+        await mqtt.async_subscribe(hass, f"test-topic/device_{device}", _record)
+        await mqtt.async_subscribe(hass, f"test-topic/{device}/+/state", _record)
+    await mqtt.async_subscribe(hass, "test-discovery/#", _record)
+
+    messages = 20000
+    start = time.perf_counter()
+    for index in range(messages):
+        async_fire_mqtt_message(
+            hass, f"test-topic/{index % 5000}/sensor_{index}/state", "on"
+        )
+    elapsed = time.perf_counter() - start
+    await hass.async_block_till_done()
+
+    assert len(received) == messages
+    record_property("messages_per_second", round(messages / elapsed))
@@ -1,6 +1,7 @@
 """The tests for the MQTT component setup and helpers."""
 
 import asyncio
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime, timedelta
 from functools import partial
@@ -40,6 +41,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -214,6 +216,97 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_json_key(hass: HomeAssistant) -> None:
+    """Test value templates reading a key of the JSON payload."""
+    payload = '{"temperature": 21.5, "state": " ON ", "items": [1], "empty": null}'
+    for template_str, result in (
+        ("{{ value_json.temperature }}", "21.5"),
+        ("  {{value_json.state}} ", "ON"),
+        ("{{ value_json.empty }}", "None"),
+        ("{{ value_json.missing }}", ""),
+        ("{{ value_json['items'] }}", "[1]"),
+    ):
+        tpl = template.Template(template_str, hass=hass)
+        val_tpl = mqtt.MqttValueTemplate(tpl)
+        assert val_tpl.async_render_with_possible_json_value(payload) == result
+        assert val_tpl.async_render_with_possible_json_value("not json") == "not json"
+        assert val_tpl.async_render_with_possible_json_value("[1]") == ""
+
+    # The payload is parsed once for the value templates rendering it
+    templates = [
+        mqtt.MqttValueTemplate(template.Template(template_str, hass=hass))
+        for template_str in (
+            "{{ value_json.temperature }}",
+            "{{ value_json.temperature | round(0) }}",
+            "{{ value_json.state | trim | lower }}",
+        )
+    ]
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads", wraps=json_loads
+    ) as json_loads_mock:
+        assert [
+            val_tpl.async_render_with_possible_json_value(payload)
+            for val_tpl in templates
+        ] == ["21.5", "22", "on"]
+        assert json_loads_mock.call_count == 1
+        assert (
+            templates[1].async_render_with_possible_json_value('{"temperature": 1.2}')
+            == "1"
+        )
+        assert json_loads_mock.call_count == 2
+
+
+async def test_benchmark_value_templates(
+    hass: HomeAssistant, record_property: Callable[[str, object], None]
+) -> None:
+    """Benchmark rendering the value templates of many devices.
+
+    100 devices have 15 value templates each, one of them with a filter, and
+    2000 payloads with 17 keys are rendered by the templates of their device.
+    The rate of payloads rendered by the templates directly, which parse
+    every payload again, and by the MQTT value templates is recorded as
+    test properties.
+    """
+    keys = [f"key_{idx}" for idx in range(17)]
+    templates = [
+        template.Template(f"{{{{ value_json.{key} }}}}", hass=hass) for key in keys[:14]
+    ]
+    templates.append(template.Template("{{ value_json.key_14 | round(1) }}", hass=hass))
+    devices = [
+        [
+            mqtt.MqttValueTemplate(template.Template(tpl.template, hass=hass))
+            for tpl in templates
+        ]
+        for _ in range(100)
+    ]
+    messages = 2000
+    payloads = [
+        json.dumps({key: idx + offset / 3 for offset, key in enumerate(keys)})
+        for idx in range(messages)
+    ]
+
+    start = time.perf_counter()
+    expected = [
+        [tpl.async_render_with_possible_json_value(payload) for tpl in templates]
+        for payload in payloads
+    ]
+    direct_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [
+        [
+            val_tpl.async_render_with_possible_json_value(payload)
+            for val_tpl in devices[idx % 100]
+        ]
+        for idx, payload in enumerate(payloads)
+    ]
+    mqtt_elapsed = time.perf_counter() - start
+
+    assert results == expected
+    record_property("direct_messages_per_second", round(messages / direct_elapsed))
+    record_property("mqtt_messages_per_second", round(messages / mqtt_elapsed))
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
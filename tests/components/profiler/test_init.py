@@ -5,6 +5,7 @@ from functools import lru_cache
 import logging
 import os
 from pathlib import Path
+import time
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -27,16 +28,20 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_MONITOR,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_MONITOR,
 )
-from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
+from homeassistant.components.profiler.loop_monitor import SLOW_JOB_THRESHOLD
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +451,112 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_loop_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the durations of the jobs on the event loop are recorded."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The job methods are left alone until the monitor is started
+    assert "async_run_hass_job" not in vars(hass)
+    assert "_async_add_hass_job" not in vars(hass)
+    with pytest.raises(HomeAssistantError, match="Loop monitor not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True
+        )
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_MONITOR, {}, blocking=True
+    )
+    assert "async_run_hass_job" in vars(hass)
+    with pytest.raises(HomeAssistantError, match="Loop monitor already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LOOP_MONITOR, {}, blocking=True
+        )
+
+    @callback
+    def _slow_listener(event) -> None:
+        end = time.perf_counter() + SLOW_JOB_THRESHOLD
+        while time.perf_counter() < end:
+            pass
+
+    @callback
+    def _outer_listener(event) -> None:
+        hass.bus.async_fire_internal("profiler_test_inner")
+
+    async def _coroutine_listener(event) -> None:
+        _slow_listener(event)
+
+    hass.bus.async_listen("profiler_test_inner", _slow_listener)
+    hass.bus.async_listen("profiler_test_outer", _outer_listener)
+    hass.bus.async_listen("profiler_test_coroutine", _coroutine_listener)
+    for _ in range(3):
+        hass.bus.async_fire("profiler_test_outer")
+    hass.bus.async_fire("profiler_test_coroutine")
+    await hass.async_block_till_done()
+    hass.data[DOMAIN][LOOP_MONITOR].lag_samples.append(0.02)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    assert result["lag"] == {"samples": 1, "p50": 0.02, "p99": 0.02, "max": 0.02}
+    callables = {stats["name"]: stats for stats in result["callables"]}
+    prefix = f"{__name__}.test_loop_stats.<locals>"
+    slow = callables[f"{prefix}._slow_listener"]
+    assert slow["count"] == 3
+    assert slow["total_duration"] >= 3 * SLOW_JOB_THRESHOLD
+    assert sum(slow["histogram"]) == 3
+    assert slow["histogram"][3] + slow["histogram"][4] == 3
+    # The duration of the nested listener is not included in the outer one
+    outer = callables[f"{prefix}._outer_listener"]
+    assert outer["count"] == 3
+    assert outer["max_duration"] < SLOW_JOB_THRESHOLD
+    # Coroutine functions are timed until they yield to the loop
+    coroutine = callables[f"{prefix}._coroutine_listener"]
+    assert coroutine["count"] == 1
+    assert coroutine["max_duration"] >= SLOW_JOB_THRESHOLD
+    assert [job["name"] for job in result["slow_jobs"]] == [
+        f"{prefix}._slow_listener",
+        f"{prefix}._slow_listener",
+        f"{prefix}._slow_listener",
+        f"{prefix}._coroutine_listener",
+    ]
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats", "limit": 1})
+    response = await client.receive_json()
+    assert [stats["name"] for stats in response["result"]["callables"]] == [
+        f"{prefix}._slow_listener"
+    ]
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True)
+    assert "async_run_hass_job" not in vars(hass)
+    assert "_async_add_hass_job" not in vars(hass)
+    hass.bus.async_fire("profiler_test_outer")
+    await hass.async_block_till_done()
+
+    # The statistics are kept after the monitor is stopped
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert response["result"]["running"] is False
+    callables = {stats["name"]: stats for stats in response["result"]["callables"]}
+    assert callables[f"{prefix}._outer_listener"]["count"] == 3
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_MONITOR, {}, blocking=True
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert "async_run_hass_job" not in vars(hass)
+    assert "_async_add_hass_job" not in vars(hass)
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
@@ -0,0 +1,49 @@
+"""Test the event loop lag sensors of the profiler."""
+
+import pytest
+
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
+from homeassistant.components.profiler.loop_monitor import LAG_SAMPLES
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+
+from tests.common import MockConfigEntry
+
+
+async def test_loop_lag_sensors(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the sensors of the percentiles of the event loop lag."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    p50_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_loop_lag_p50"
+    )
+    p99_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_loop_lag_p99"
+    )
+    assert hass.states.get(p50_entity_id).state == STATE_UNKNOWN
+    assert hass.states.get(p99_entity_id).state == STATE_UNKNOWN
+
+    loop_monitor = hass.data[DOMAIN][LOOP_MONITOR]
+    # The oldest samples are dropped from the ring buffer
+    loop_monitor.lag_samples.extend([1.0] * 10)
+    loop_monitor.lag_samples.extend(lag / 1000 for lag in range(LAG_SAMPLES))
+    assert len(loop_monitor.lag_samples) == LAG_SAMPLES
+
+    await async_update_entity(hass, p50_entity_id)
+    await async_update_entity(hass, p99_entity_id)
+
+    state = hass.states.get(p50_entity_id)
+    assert float(state.state) == pytest.approx(299, abs=0.1)
+    assert state.attributes["unit_of_measurement"] == "ms"
+    assert float(hass.states.get(p99_entity_id).state) == (pytest.approx(593, abs=0.1))
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
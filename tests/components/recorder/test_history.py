@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from copy import copy
 from datetime import datetime, timedelta
+from itertools import product
 import json
 from unittest.mock import sentinel
 
@@ -18,10 +19,12 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history.recent import RecentHistory
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -1014,3 +1017,150 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_recent_significant_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the recent history returns the same states as the database."""
+    entity_ids = ["sensor.test", "climate.test", "light.test", "switch.removed"]
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("climate.test", "heat", {"current_temperature": 20})
+    hass.states.async_set("light.test", "on", {ATTR_SUPPORTED_FEATURES: 4})
+    hass.states.async_set("switch.removed", "on")
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("climate.test", "heat", {"current_temperature": 21})
+    hass.states.async_set(
+        "light.test", "on", {ATTR_SUPPORTED_FEATURES: 4, "brightness": 10}
+    )
+    hass.states.async_remove("switch.removed")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "kW"})
+    hass.states.async_set("climate.test", "cool", {"current_temperature": 21})
+    hass.states.async_set("light.test", "off", {ATTR_SUPPORTED_FEATURES: 4})
+    await async_recorder_block_till_done(hass)
+    end = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "3", {"unit_of_measurement": "kW"})
+    await async_wait_recording_done(hass)
+
+    recent_history = recorder_mock.recent_history
+    for end_time, entities in product(
+        (None, end), (entity_ids, ["sensor.test"], ["switch.removed"])
+    ):
+        recent_states = recent_history.async_get_states(entities, start)
+        assert recent_states is not None
+        for options in product((True, False), repeat=4):
+            assert json_bytes(
+                history.get_recent_significant_states(
+                    hass, recent_states, start, end_time, *options
+                )
+            ) == json_bytes(
+                history.get_significant_states(
+                    hass, start, end_time, entities, None, *options, True
+                )
+            )
+
+    assert (
+        recent_history.async_get_states(entity_ids, start - timedelta(hours=1)) is None
+    )
+    assert recent_history.async_get_states(["sensor.unknown"], start) is None
+    assert recent_history.hits == 6
+    assert recent_history.misses == 2
+
+
+def test_recent_history_eviction() -> None:
+    """Test the recent history keeps the last state before the cutoff."""
+    recent_history = RecentHistory(max_age=timedelta(seconds=10), max_states=5)
+    start = dt_util.utcnow()
+
+    def _add(entity_id: str, state: str | None, seconds: int) -> None:
+        time_fired = start + timedelta(seconds=seconds)
+        new_state = (
+            State(entity_id, state, last_updated=time_fired, last_changed=time_fired)
+            if state is not None
+            else None
+        )
+        recent_history.async_add(
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": entity_id, "new_state": new_state},
+                time_fired_timestamp=time_fired.timestamp(),
+            )
+        )
+
+    _add("sensor.a", "1", 0)
+    _add("sensor.a", "2", 2)
+    _add("sensor.b", "1", 3)
+    _add("sensor.b", None, 4)
+    assert recent_history.size == 4
+
+    # sensor.a keeps its last state before the cutoff and the removed
+    # sensor.b is forgotten
+    _add("sensor.a", "3", 15)
+    assert recent_history.size == 2
+    cutoff = start + timedelta(seconds=5)
+    assert (states := recent_history.async_get_states(["sensor.a"], cutoff))
+    assert [recent.state for recent in states["sensor.a"]] == ["2", "3"]
+    assert recent_history.async_get_states(["sensor.b"], cutoff) is None
+
+    for seconds in range(16, 20):
+        _add("sensor.c", "on", seconds)
+    assert recent_history.size == 5
+    # The oldest state change of sensor.a was evicted to make room
+    assert recent_history.async_get_states(["sensor.a"], cutoff) is None
+    assert (
+        states := recent_history.async_get_states(
+            ["sensor.a"], start + timedelta(seconds=16)
+        )
+    )
+    assert [recent.state for recent in states["sensor.a"]] == ["3"]
+
+    recent_history.async_remove("sensor.c")
+    assert recent_history.size == 1
+    recent_history.async_clear()
+    assert recent_history.size == 0
+
+
+def test_recent_history_eviction_of_removed_entities() -> None:
+    """Test removed entities are not kept once their state changes are evicted."""
+    recent_history = RecentHistory(max_age=timedelta(seconds=100), max_states=3)
+    start = dt_util.utcnow()
+
+    def _add(entity_id: str, state: str | None, seconds: int) -> None:
+        time_fired = start + timedelta(seconds=seconds)
+        new_state = (
+            State(entity_id, state, last_updated=time_fired, last_changed=time_fired)
+            if state is not None
+            else None
+        )
+        recent_history.async_add(
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": entity_id, "new_state": new_state},
+                time_fired_timestamp=time_fired.timestamp(),
+            )
+        )
+
+    _add("sensor.a", "1", 0)
+    _add("sensor.a", None, 1)
+    for seconds in range(2, 5):
+        _add("sensor.b", "on", seconds)
+    # The removal of sensor.a is dropped with its last entry
+    assert recent_history.size == 3
+    assert (
+        recent_history.async_get_states(["sensor.a"], start + timedelta(seconds=2))
+        is None
+    )
+
+    # Removing an entity drops its entries from the eviction order
+    recent_history.async_remove("sensor.b")
+    assert recent_history.size == 0
+    assert not recent_history._order
+    _add("sensor.b", "on", 5)
+    assert list(recent_history._order) == [
+        ((start + timedelta(seconds=5)).timestamp(), "sensor.b")
+    ]
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -21,6 +22,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BATCH_WRITES,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -1468,6 +1470,135 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BATCH_WRITES: True, CONF_COMMIT_INTERVAL: 30}]
+)
+@pytest.mark.parametrize("use_returning", [True, False])
+async def test_saving_with_batch_writes(
+    hass: HomeAssistant, setup_recorder: None, use_returning: bool
+) -> None:
+    """Test batched writes link old states and deduplicate attributes."""
+    engine = get_instance(hass).engine
+    assert engine is not None
+    engine.dialect.insert_executemany_returning_sort_by_parameter_order = use_returning
+    states_inserts = 0
+
+    def _count_states_inserts(conn, clauseelement, *args: Any) -> None:
+        nonlocal states_inserts
+        if getattr(clauseelement, "is_insert", False) and (
+            clauseelement.table.name == States.__tablename__
+        ):
+            states_inserts += 1
+
+    sqlalchemy_event.listen(engine, "before_execute", _count_states_inserts)
+    hass.states.async_set("test.one", "s1", {"shared": True})
+    hass.states.async_set("test.two", "s2", {"shared": True})
+    hass.states.async_set("test.three", "s6", {"shared": True})
+    hass.states.async_set("test.one", "s3", {"shared": True})
+    hass.states.async_set("test.one", "s4", {"other": True})
+    hass.bus.async_fire("test_event", {"some": "data"})
+    hass.bus.async_fire("test_event", {"some": "data"})
+    # Process the events before the commit is triggered
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {"other": True})
+    hass.states.async_remove("test.two")
+    hass.states.async_remove("test.three")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    sqlalchemy_event.remove(engine, "before_execute", _count_states_inserts)
+    # With RETURNING, each generation is inserted with one statement, without
+    # it the rows which are linked as an old state are inserted one by one and
+    # the removed states with one statement
+    assert states_inserts == (4 if use_returning else 7)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 8
+        states_by_state = {
+            state.state: state for state in states if state.state is not None
+        }
+        removed_states = {
+            state.entity_id: state for state in states if state.state is None
+        }
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert removed_states["test.two"].old_state_id == states_by_state["s2"].state_id
+        assert (
+            removed_states["test.three"].old_state_id == states_by_state["s6"].state_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id
+            == states_by_state["s2"].attributes_id
+            == states_by_state["s3"].attributes_id
+        )
+        assert (
+            states_by_state["s4"].attributes_id == states_by_state["s5"].attributes_id
+        )
+        assert (
+            states_by_state["s4"].attributes_id != states_by_state["s1"].attributes_id
+        )
+        # The removed state is recorded with empty attributes
+        assert session.query(StateAttributes).count() == 3
+
+        events = list(
+            session.query(Events.data_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(events) == 2
+        assert events[0].data_id is not None
+        assert events[0].data_id == events[1].data_id
+
+    batch_writer = get_instance(hass).batch_writer
+    assert batch_writer is not None
+    assert not batch_writer.has_pending
+    assert batch_writer.rows_per_second > 0
+    assert batch_writer.commit_latency is not None
+    assert batch_writer.batched_states is use_returning
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BATCH_WRITES: True}])
+async def test_saving_state_with_serializable_data_batch_writes(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test a state which can not be serialized is not linked as an old state."""
+    hass.states.async_set("test.one", "s1", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s2", {"fail": CannotSerializeMe()})
+    await async_wait_recording_done(hass)
+    states_manager = get_instance(hass).states_manager
+    assert "test.one" not in states_manager._last_committed_id
+
+    hass.states.async_set("test.one", "s3", {})
+    await async_wait_recording_done(hass)
+    assert states_manager._last_committed_id["test.one"] is not None
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = {
+            state.state: state
+            for state in session.query(
+                States.state_id, States.old_state_id, States.state
+            )
+        }
+        assert states.keys() == {"s1", "s3"}
+        assert states["s3"].old_state_id is None
+
+    assert "State is not JSON serializable" in caplog.text
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
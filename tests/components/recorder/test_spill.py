@@ -0,0 +1,358 @@
+"""Test spilling events to disk while the recorder backlog is too large."""
+
+from collections.abc import Generator
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import (
+    CONF_COMMIT_INTERVAL,
+    CONF_SPILL_MAX_SIZE,
+    Recorder,
+    get_instance,
+)
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.spill import SpillBuffer
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture(autouse=True)
+def spill_file(tmp_path: Path) -> Generator[str]:
+    """Write the spill file of the recorder to a temporary directory."""
+    spill_file = str(tmp_path / "recorder.spill")
+    with patch("homeassistant.components.recorder.core.SPILL_FILE", spill_file):
+        yield spill_file
+
+
+def _write_events(spill_buffer: SpillBuffer, events: list[Event]) -> None:
+    """Write events to a spill buffer."""
+    spill_buffer.start_writer()
+    for event in events:
+        spill_buffer.put(event)
+    spill_buffer.stop_writer()
+
+
+def test_spill_buffer_round_trip(tmp_path: Path) -> None:
+    """Test the recorded parts of events are read back from the spill file."""
+    now = dt_util.utcnow()
+    context = Context(user_id="b" * 32)
+    old_state = State("sensor.one", "1", {"any": "attr"}, last_updated=now)
+    new_state = State(
+        "sensor.one",
+        "2",
+        {"recorded": 1, "unrecorded": 2, "restored": True},
+        last_changed=now,
+        context=context,
+        state_info={"unrecorded_attributes": frozenset({"unrecorded"})},
+    )
+    events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.one", "old_state": old_state, "new_state": new_state},
+            context=context,
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.one", "old_state": new_state, "new_state": None},
+        ),
+        Event("custom_event", {"some": "data"}, EventOrigin.remote),
+    ]
+    spill_buffer = SpillBuffer(str(tmp_path / "spill"), 1024**2)
+    assert not spill_buffer.exists()
+    assert not spill_buffer.begin_replay()
+    assert list(spill_buffer.read_events()) == []
+    _write_events(spill_buffer, events)
+    assert spill_buffer.exists()
+    assert spill_buffer.stats.spilled_events == 3
+    assert spill_buffer.stats.spilled_bytes == (tmp_path / "spill").stat().st_size
+
+    assert spill_buffer.begin_replay()
+    assert not (tmp_path / "spill").exists()
+    changed, removed, custom = spill_buffer.read_events()
+    assert changed.event_type == EVENT_STATE_CHANGED
+    assert changed.time_fired_timestamp == events[0].time_fired_timestamp
+    assert changed.context == context
+    assert changed.data["entity_id"] == "sensor.one"
+    state = changed.data["new_state"]
+    assert state.state == "2"
+    assert state.attributes == {"recorded": 1}
+    assert state.last_updated_timestamp == new_state.last_updated_timestamp
+    assert state.last_changed == now
+    assert state.last_reported == state.last_updated
+    assert state.context == context
+    assert changed.data["old_state"].last_reported_timestamp == (
+        old_state.last_reported_timestamp
+    )
+    assert removed.data["new_state"] is None
+    assert removed.data["old_state"].state == "2"
+    assert custom.event_type == "custom_event"
+    assert custom.data == {"some": "data"}
+    assert custom.origin is EventOrigin.remote
+
+    # A partially written record is ignored
+    with open(spill_buffer.replay_path, "ab") as file:
+        file.write(b"\xff\x00\x00\x00{")
+    assert len(list(spill_buffer.read_events())) == 3
+
+    spill_buffer.finish_replay()
+    assert not spill_buffer.exists()
+    assert spill_buffer.stats.spilled_bytes == 0
+
+
+def test_spill_buffer_resume_replay(tmp_path: Path) -> None:
+    """Test a failed replay is resumed after the committed events."""
+    spill_buffer = SpillBuffer(str(tmp_path / "spill"), 1024**2)
+    _write_events(
+        spill_buffer, [Event("custom_event", {"index": index}) for index in range(5)]
+    )
+    assert spill_buffer.begin_replay()
+    events = spill_buffer.read_events()
+    assert [next(events).data["index"] for _ in range(2)] == [0, 1]
+    spill_buffer.mark_replayed()
+    assert next(events).data["index"] == 2
+    events.close()
+
+    # Events are spilled to a new file while the replay file is left over
+    _write_events(
+        spill_buffer, [Event("custom_event", {"index": index}) for index in (5, 6)]
+    )
+    spill_buffer = SpillBuffer(str(tmp_path / "spill"), 1024**2)
+    replayed: list[int] = []
+    while spill_buffer.begin_replay():
+        replayed.extend(event.data["index"] for event in spill_buffer.read_events())
+        spill_buffer.finish_replay()
+    assert replayed == [2, 3, 4, 5, 6]
+    assert not spill_buffer.exists()
+
+
+def test_spill_buffer_max_size(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events are dropped once the spill file reached its maximum size."""
+    spill_buffer = SpillBuffer(str(tmp_path / "spill"), 200)
+    _write_events(
+        spill_buffer, [Event("custom_event", {"index": index}) for index in range(10)]
+    )
+    stats = spill_buffer.stats
+    assert stats.spilled_events
+    assert stats.spilled_events + stats.dropped_events == 10
+    assert stats.spilled_bytes <= 200
+    assert spill_buffer.begin_replay()
+    assert [event.data["index"] for event in spill_buffer.read_events()] == list(
+        range(stats.spilled_events)
+    )
+    assert caplog.text.count("reached its maximum size") == 1
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_SPILL_MAX_SIZE: 1, CONF_COMMIT_INTERVAL: 0}]
+)
+async def test_spill_and_replay(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test events are spilled while the backlog is too large and replayed later."""
+    instance = get_instance(hass)
+    spill_buffer = instance.spill_buffer
+    assert spill_buffer is not None
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    assert spill_buffer.spilling
+    assert instance.recording
+    hass.states.async_set("test.one", "s2", {"attr": 2})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    await async_wait_recording_done(hass)
+
+    def _get_states() -> list[tuple[str, int | None, int, str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.state, row.old_state_id, row.state_id, row.shared_attrs)
+                for row in session.query(
+                    States.state,
+                    States.old_state_id,
+                    States.state_id,
+                    StateAttributes.shared_attrs,
+                )
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.one")
+                .order_by(States.state_id)
+            ]
+
+    assert [row[0] for row in await instance.async_add_executor_job(_get_states)] == [
+        "s1"
+    ]
+
+    # The backlog is small again, the spilled events are
+    # written before the events which are queued after them
+    instance._async_check_queue()
+    assert not spill_buffer.spilling
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    await async_wait_recording_done(hass)
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert [row[0] for row in states] == ["s1", "s2", "s3", "s4"]
+    assert [row[1] for row in states[1:]] == [row[2] for row in states[:-1]]
+    assert [row[3] for row in states] == [
+        '{"attr":1}',
+        '{"attr":2}',
+        '{"attr":2}',
+        '{"attr":2}',
+    ]
+    assert not spill_buffer.writing
+    assert not await hass.async_add_executor_job(spill_buffer.exists)
+    assert spill_buffer.stats.spilled_events == 2
+    assert spill_buffer.stats.replayed_events == 2
+    assert spill_buffer.stats.replay_events_per_second > 0
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_SPILL_MAX_SIZE: 1, CONF_COMMIT_INTERVAL: 0}]
+)
+async def test_no_spilling_while_replaying(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test events are not spilled to the file which is being replayed."""
+    instance = get_instance(hass)
+    spill_buffer = instance.spill_buffer
+    assert spill_buffer is not None
+    await async_wait_recording_done(hass)
+    assert not spill_buffer.replaying
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    assert spill_buffer.spilling
+    hass.states.async_set("test.one", "s1")
+    hass.states.async_set("test.one", "s2")
+    await async_wait_recording_done(hass)
+
+    read_events = spill_buffer.read_events
+    replay_started = threading.Event()
+    resume_replay = threading.Event()
+
+    def _read_events_slowly() -> Generator[Event]:
+        for event in read_events():
+            yield event
+            replay_started.set()
+            resume_replay.wait()
+
+    with patch.object(spill_buffer, "read_events", _read_events_slowly):
+        instance._async_check_queue()
+        assert not spill_buffer.spilling
+        assert spill_buffer.replaying
+        await hass.async_add_executor_job(replay_started.wait)
+
+        # The backlog is too large again while the replay is running
+        try:
+            with patch.object(instance, "_reached_max_backlog", return_value=True):
+                instance._async_check_queue()
+            hass.states.async_set("test.one", "s3")
+        finally:
+            resume_replay.set()
+        await async_wait_recording_done(hass)
+
+    assert not spill_buffer.replaying
+    assert not await hass.async_add_executor_job(spill_buffer.exists)
+
+    def _get_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                row.state
+                for row in session.query(States.state)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.one")
+                .order_by(States.state_id)
+            ]
+
+    assert await instance.async_add_executor_job(_get_states) == ["s1", "s2", "s3"]
+
+    # Events are spilled again once the replay is done
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    assert spill_buffer.spilling
+
+
+async def test_replay_spill_file_on_start(
+    async_test_recorder: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    spill_file: str,
+) -> None:
+    """Test events spilled before a restart are written at the next start."""
+    spill_buffer = SpillBuffer(spill_file, 1024**2)
+    await hass.async_add_executor_job(
+        _write_events,
+        spill_buffer,
+        [Event("spilled_event", {"index": index}) for index in range(3)],
+    )
+
+    async with async_test_recorder(hass, {CONF_SPILL_MAX_SIZE: 1}) as instance:
+        await async_wait_recording_done(hass)
+        assert instance.spill_buffer is not None
+        assert instance.spill_buffer.stats.replayed_events == 3
+        assert not await hass.async_add_executor_job(spill_buffer.exists)
+
+        def _get_events() -> list[str | None]:
+            with session_scope(hass=hass, read_only=True) as session:
+                return [
+                    row.shared_data
+                    for row in session.query(EventData.shared_data)
+                    .join(Events, Events.data_id == EventData.data_id)
+                    .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                    .filter(EventTypes.event_type == "spilled_event")
+                    .order_by(Events.event_id)
+                ]
+
+        assert await instance.async_add_executor_job(_get_events) == [
+            '{"index":0}',
+            '{"index":1}',
+            '{"index":2}',
+        ]
+
+
+async def test_replay_spill_file_on_start_spilling_disabled(
+    async_test_recorder: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    spill_file: str,
+) -> None:
+    """Test events spilled before a restart are written if spilling was disabled."""
+    spill_buffer = SpillBuffer(spill_file, 1024**2)
+    await hass.async_add_executor_job(
+        _write_events,
+        spill_buffer,
+        [Event("spilled_event", {"index": index}) for index in range(3)],
+    )
+
+    async with async_test_recorder(hass) as instance:
+        await async_wait_recording_done(hass)
+        assert instance.spill_buffer is None
+        assert not await hass.async_add_executor_job(spill_buffer.exists)
+
+        def _count_events() -> int:
+            with session_scope(hass=hass, read_only=True) as session:
+                return (
+                    session.query(Events)
+                    .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                    .filter(EventTypes.event_type == "spilled_event")
+                    .count()
+                )
+
+        assert await instance.async_add_executor_job(_count_events) == 3
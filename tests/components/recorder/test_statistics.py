@@ -1,6 +1,11 @@
 """The tests for sensor recorder platform."""
 
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import timedelta
+from itertools import chain
+import random
+import time
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -20,6 +25,7 @@ from homeassistant.components.recorder.statistics import (
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _reduce_statistics_columnar,
     async_add_external_statistics,
     async_import_statistics,
     async_list_statistic_ids,
@@ -2647,3 +2653,160 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+def _generate_hourly_statistics(
+    statistic_ids: int, hours: int, seed: int
+) -> dict[str, list[statistics.StatisticsRow]]:
+    """Generate hourly statistics rows, including missing values."""
+    generator = random.Random(seed)
+    start = dt_util.as_timestamp(dt_util.parse_datetime("2022-01-01T00:00:00+00:00"))
+    stats: dict[str, list[statistics.StatisticsRow]] = {}
+    for index in range(statistic_ids):
+        total = 0.0
+        rows: list[statistics.StatisticsRow] = []
+        for hour in range(hours):
+            total += generator.random()
+            value = None if generator.random() < 0.05 else generator.random() * 100
+            rows.append(
+                {
+                    "start": start + hour * 3600,
+                    "end": start + (hour + 1) * 3600,
+                    "mean": value,
+                    "min": None if value is None else value - 1,
+                    "max": None if value is None else value + 1,
+                    "last_reset": None,
+                    "state": total,
+                    "sum": total,
+                }
+            )
+        stats[f"sensor.test_{index}"] = rows
+    return stats
+
+
+def _reduce_statistics_per_row(
+    stats: dict[str, list[statistics.StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[str],
+) -> dict[str, list[statistics.StatisticsRow]]:
+    """Reduce hourly statistics row by row, the reference for the columnar reducer."""
+    result: dict[str, list[statistics.StatisticsRow]] = defaultdict(list)
+    period_seconds = period.total_seconds()
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    for statistic_id, stat_list in stats.items():
+        max_values: list[float] = []
+        mean_values: list[float] = []
+        min_values: list[float] = []
+        prev_stat: statistics.StatisticsRow = stat_list[0]
+        fake_entry: statistics.StatisticsRow = {
+            "start": stat_list[-1]["start"] + period_seconds
+        }
+
+        # Loop over the hourly statistics + a fake entry to end the period
+        for statistic in chain(stat_list, (fake_entry,)):
+            if not same_period(prev_stat["start"], statistic["start"]):
+                start, end = period_start_end(prev_stat["start"])
+                # The previous statistic was the last entry of the period
+                row: statistics.StatisticsRow = {
+                    "start": start,
+                    "end": end,
+                }
+                if _want_mean:
+                    row["mean"] = statistics.mean(mean_values) if mean_values else None
+                    mean_values.clear()
+                if _want_min:
+                    row["min"] = min(min_values) if min_values else None
+                    min_values.clear()
+                if _want_max:
+                    row["max"] = max(max_values) if max_values else None
+                    max_values.clear()
+                if _want_last_reset:
+                    row["last_reset"] = prev_stat.get("last_reset")
+                if _want_state:
+                    row["state"] = prev_stat.get("state")
+                if _want_sum:
+                    row["sum"] = prev_stat["sum"]
+                result[statistic_id].append(row)
+            if _want_max and (_max := statistic.get("max")) is not None:
+                max_values.append(_max)
+            if _want_mean and (_mean := statistic.get("mean")) is not None:
+                mean_values.append(_mean)
+            if _want_min and (_min := statistic.get("min")) is not None:
+                min_values.append(_min)
+            prev_stat = statistic
+
+    return result
+
+
+@pytest.mark.parametrize(
+    ("factory", "period"),
+    [
+        (statistics.reduce_day_ts_factory, timedelta(days=1)),
+        (statistics.reduce_week_ts_factory, timedelta(days=7)),
+        (statistics.reduce_month_ts_factory, timedelta(days=31)),
+    ],
+)
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+async def test_reduce_statistics_columnar(
+    hass: HomeAssistant,
+    factory: Callable[[], tuple[Any, Any]],
+    period: timedelta,
+    timezone: str,
+) -> None:
+    """Test the columnar reducer matches the per-row reducer."""
+    await hass.config.async_set_time_zone(timezone)
+    stats = _generate_hourly_statistics(3, 24 * 100, 1)
+    # Drop some hours to create gaps, including the start of some periods
+    stats["sensor.test_1"] = (
+        stats["sensor.test_1"][5:400] + stats["sensor.test_1"][800:]
+    )
+    types: set[Any] = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    same_period, period_start_end = factory()
+    expected = _reduce_statistics_per_row(
+        stats, same_period, period_start_end, period, types
+    )
+    _, period_start_end = factory()
+    assert _reduce_statistics_columnar(stats, period_start_end, types) == expected
+
+    same_period, period_start_end = factory()
+    expected = _reduce_statistics_per_row(
+        stats, same_period, period_start_end, period, {"mean"}
+    )
+    _, period_start_end = factory()
+    assert _reduce_statistics_columnar(stats, period_start_end, {"mean"}) == expected
+
+
+async def test_benchmark_reduce_statistics(
+    hass: HomeAssistant, record_property: Callable[[str, object], None]
+) -> None:
+    """Benchmark the columnar reducer against the per-row reducer.
+
+    A year of hourly statistics for 200 statistic IDs is reduced per day,
+    the durations are recorded as test properties.
+    """
+    stats = _generate_hourly_statistics(200, 24 * 365, 1)
+    types: set[Any] = {"max", "mean", "min", "sum"}
+
+    same_day, day_start_end = statistics.reduce_day_ts_factory()
+    start = time.perf_counter()
+    expected = _reduce_statistics_per_row(
+        stats, same_day, day_start_end, timedelta(days=1), types
+    )
+    per_row_duration = time.perf_counter() - start
+
+    _, day_start_end = statistics.reduce_day_ts_factory()
+    start = time.perf_counter()
+    result = _reduce_statistics_columnar(stats, day_start_end, types)
+    columnar_duration = time.perf_counter() - start
+
+    assert result == expected
+    record_property("per_row_seconds", round(per_row_duration, 4))
+    record_property("columnar_seconds", round(columnar_duration, 4))
@@ -8,6 +8,7 @@ from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -38,6 +39,81 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"batch_writes": True}])
+async def test_recorder_system_health_batch_writes(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with batched writes."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    instance = get_instance(hass)
+    assert info == {
+        "current_recorder_run": instance.recorder_runs_manager.current.start,
+        "oldest_recorder_run": instance.recorder_runs_manager.first.start,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "rows_per_second": ANY,
+        "commit_latency": ANY,
+        "batched_state_inserts": True,
+    }
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health with recent history lookups."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    recent_history = instance.recent_history
+    now = dt_util.utcnow()
+    assert recent_history.async_get_states(["test.one"], now) is not None
+    assert recent_history.async_get_states(["test.two"], now) is None
+    assert recent_history.async_get_states(["test.one"], now) is not None
+    info = await get_system_health_info(hass, "recorder")
+    assert info == {
+        "current_recorder_run": instance.recorder_runs_manager.current.start,
+        "oldest_recorder_run": instance.recorder_runs_manager.first.start,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "recent_history_hit_rate": "66.7 %",
+        "recent_history_states": 1,
+    }
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"spill_max_size": 1}])
+async def test_recorder_system_health_spill(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health after events were spilled to disk."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert "spilled_events" not in info
+
+    instance = get_instance(hass)
+    spill_buffer = instance.spill_buffer
+    spill_buffer.stats.spilled_events = 1000
+    spill_buffer.stats.spilled_bytes = 3 * 1024**2
+    spill_buffer.stats.replayed_events = 1000
+    spill_buffer.stats.replay_duration = 0.5
+    info = await get_system_health_info(hass, "recorder")
+    assert info["spilled_events"] == 1000
+    assert info["spill_size"] == "3.00 MiB"
+    assert info["spill_replay_rate"] == "2000.0 events/s"
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -1,9 +1,17 @@
 """Tests for Search integration."""
 
+from collections.abc import Callable
+import time
+from unittest.mock import patch
+
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.search import ItemType, Searcher
+from homeassistant.components.search import (
+    ItemType,
+    Searcher,
+    async_get_relationship_index,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
     area_registry as ar,
@@ -1013,3 +1021,159 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_search_after_reload(hass: HomeAssistant) -> None:
+    """Test the relationship index follows reloaded and removed automations."""
+    assert await async_setup_component(hass, "search", {})
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "id": "lights",
+                "alias": "lights",
+                "triggers": {"trigger": "state", "entity_id": "light.kitchen"},
+                "actions": {
+                    "action": "light.turn_on",
+                    "target": {"area_id": "kitchen"},
+                },
+            }
+        },
+    )
+    assert await async_setup_component(
+        hass,
+        "group",
+        {"group": {"lights": {"entities": ["light.kitchen", "light.bedroom"]}}},
+    )
+    await hass.async_block_till_done()
+
+    def search(item_type: ItemType, item_id: str) -> dict[str, set[str]]:
+        """Search."""
+        return Searcher(hass, {}).async_search(item_type, item_id)
+
+    assert search(ItemType.ENTITY, "light.kitchen") == {
+        ItemType.AUTOMATION: {"automation.lights"},
+        ItemType.GROUP: {"group.lights"},
+    }
+    assert search(ItemType.AREA, "kitchen") == {}
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            "automation": {
+                "id": "lights",
+                "alias": "lights",
+                "triggers": {"trigger": "state", "entity_id": "light.bedroom"},
+                "actions": {
+                    "action": "light.turn_on",
+                    "target": {"area_id": "bedroom"},
+                },
+            }
+        },
+    ):
+        await hass.services.async_call("automation", "reload", blocking=True)
+    await hass.services.async_call(
+        "group", "set", {"object_id": "lights", "entities": ["light.bedroom"]}
+    )
+    await hass.async_block_till_done()
+
+    assert search(ItemType.ENTITY, "light.kitchen") == {}
+    assert search(ItemType.ENTITY, "light.bedroom") == {
+        ItemType.AUTOMATION: {"automation.lights"},
+        ItemType.GROUP: {"group.lights"},
+    }
+
+    await hass.services.async_call("group", "remove", {"object_id": "lights"})
+    await hass.async_block_till_done()
+
+    assert search(ItemType.ENTITY, "light.bedroom") == {
+        ItemType.AUTOMATION: {"automation.lights"},
+    }
+
+
+async def test_benchmark_relationship_index(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark searching with the relationship index.
+
+    300 automations and 100 scripts reference 1000 lights in 20 areas. The
+    time to build the index and the time of a search with the index are
+    recorded as test properties.
+    """
+    config_entry = MockConfigEntry(domain="hue")
+    config_entry.add_to_hass(hass)
+    areas = [area_registry.async_create(f"Area {idx}") for idx in range(20)]
+    for idx in range(1000):
+        entity_registry.async_get_or_create(
+            "light", "hue", str(idx), config_entry=config_entry
+        )
+        entity_registry.async_update_entity(
+            f"light.hue_{idx}", area_id=areas[idx % 20].id
+        )
+    assert await async_setup_component(hass, "search", {})
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "id": str(idx),
+                    "alias": f"Automation {idx}",
+                    "triggers": {
+                        "trigger": "state",
+                        "entity_id": f"light.hue_{idx % 1000}",
+                    },
+                    "actions": {
+                        "action": "light.turn_on",
+                        "target": {"area_id": areas[idx % 20].id},
+                    },
+                }
+                for idx in range(300)
+            ]
+        },
+    )
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                f"script_{idx}": {
+                    "sequence": {
+                        "action": "light.turn_on",
+                        "target": {
+                            "entity_id": [
+                                f"light.hue_{(idx * 10 + light) % 1000}"
+                                for light in range(10)
+                            ]
+                        },
+                    }
+                }
+                for idx in range(100)
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    # The automations and scripts are indexed before the first search
+    index = async_get_relationship_index(hass)
+    start = time.perf_counter()
+    index.async_update()
+    record_property("index_build_ms", round((time.perf_counter() - start) * 1000, 2))
+
+    for name, item_type, item_id in (
+        ("area", ItemType.AREA, areas[0].id),
+        ("config_entry", ItemType.CONFIG_ENTRY, config_entry.entry_id),
+        ("entity", ItemType.ENTITY, "light.hue_0"),
+    ):
+        start = time.perf_counter()
+        results = Searcher(hass, {}).async_search(item_type, item_id)
+        record_property(
+            f"{name}_search_ms", round((time.perf_counter() - start) * 1000, 2)
+        )
+        assert results[ItemType.AUTOMATION]
+        assert results[ItemType.SCRIPT]
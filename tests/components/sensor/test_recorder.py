@@ -36,6 +36,10 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import compile_statistics
+from homeassistant.components.sensor.statistics_accumulator import (
+    async_get_statistics_accumulator,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -4191,6 +4195,122 @@ async def test_compile_statistics_hourly_daily_monthly_summary(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_accumulator(hass: HomeAssistant) -> None:
+    """Test statistics compiled from the accumulated state changes match the database."""
+    # The recorder run must have started before the first state change
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=15)
+    end = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "100", energy_attributes)
+        async_get_statistics_accumulator(hass)
+        for offset, power, energy in (
+            (30, STATE_UNAVAILABLE, "110"),
+            (60, "20", "110"),
+            (120, "20", "120"),
+            (180, "40", "5"),
+            (320, "100", "10"),
+        ):
+            freezer.move_to(zero + timedelta(seconds=offset))
+            hass.states.async_set(
+                "sensor.power",
+                power,
+                {**POWER_SENSOR_ATTRIBUTES, "offset": offset},
+            )
+            hass.states.async_set(
+                "sensor.energy",
+                energy,
+                {**energy_attributes, "offset": offset},
+            )
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics(start: datetime) -> list[dict[str, Any]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return compile_statistics(
+                hass, session, start, start + timedelta(minutes=5)
+            ).platform_stats
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history_mock:
+        accumulated_stats = await hass.async_add_executor_job(_compile_statistics, zero)
+        assert get_history_mock.call_count == 0
+        # The state changes of the period were dropped after it was compiled
+        stats = await hass.async_add_executor_job(_compile_statistics, zero)
+        assert get_history_mock.call_count == 2
+        # Periods before the accumulator started fall back to the database
+        await hass.async_add_executor_job(
+            _compile_statistics, zero - timedelta(minutes=5)
+        )
+        assert get_history_mock.call_count == 4
+        # The next period only needs the state in effect at its start
+        await hass.async_add_executor_job(_compile_statistics, end)
+        assert get_history_mock.call_count == 4
+
+    assert accumulated_stats == stats
+    assert [stat["stat"] for stat in stats] == [
+        {
+            "start": zero,
+            "mean": pytest.approx(26.0),
+            "min": 10.0,
+            "max": 40.0,
+        },
+        {
+            "start": zero,
+            "state": 5.0,
+            "sum": 25.0,
+        },
+    ]
+
+
+async def test_compile_statistics_from_accumulator_removed_sensor(
+    hass: HomeAssistant,
+) -> None:
+    """Test sensors without a state in the period fall back to the database."""
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=15)
+    end = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        async_get_statistics_accumulator(hass)
+        freezer.move_to(zero - timedelta(seconds=30))
+        hass.states.async_remove("sensor.power")
+        freezer.move_to(end + timedelta(seconds=30))
+        hass.states.async_set("sensor.power", "20", POWER_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics(start: datetime) -> list[dict[str, Any]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return compile_statistics(
+                hass, session, start, start + timedelta(minutes=5)
+            ).platform_stats
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history_mock:
+        accumulated_stats = await hass.async_add_executor_job(_compile_statistics, zero)
+        assert get_history_mock.call_count == 1
+        stats = await hass.async_add_executor_job(_compile_statistics, zero)
+        assert get_history_mock.call_count == 2
+
+    # The state of the sensor added after the end is not used for the period
+    assert accumulated_stats == stats == []
+
+
 async def async_record_states(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -0,0 +1,188 @@
+"""Test the rolling statistics of the statistics sensor."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.rolling import (
+    TRACK_AREA_LINEAR,
+    TRACK_AREA_STEP,
+    TRACK_CIRCULAR,
+    TRACK_COUNT_ON,
+    TRACK_DIFFERENCES,
+    TRACK_DIFFERENCES_NONNEGATIVE,
+    TRACK_MAX,
+    TRACK_MIN,
+    TRACK_ORDER,
+    TRACK_SQUARES,
+    TRACK_SUM,
+    RollingStatistics,
+)
+from homeassistant.util import dt as dt_util
+
+ALL_NUMERIC_TRACKERS = {
+    TRACK_AREA_LINEAR,
+    TRACK_AREA_STEP,
+    TRACK_CIRCULAR,
+    TRACK_DIFFERENCES,
+    TRACK_DIFFERENCES_NONNEGATIVE,
+    TRACK_MAX,
+    TRACK_MIN,
+    TRACK_ORDER,
+    TRACK_SQUARES,
+    TRACK_SUM,
+}
+
+
+class _Window:
+    """A sliding window of samples like the statistics sensor keeps."""
+
+    def __init__(self, trackers: set[str]) -> None:
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self.rolling = RollingStatistics(self.states, self.ages, trackers)
+        self.now = dt_util.utcnow()
+
+    def append(self, value: float | bool) -> None:
+        self.now += timedelta(seconds=random.randint(1, 120))
+        self.states.append(value)
+        self.ages.append(self.now)
+        self.rolling.add()
+
+    def popleft(self) -> None:
+        self.rolling.remove()
+        self.ages.popleft()
+        self.states.popleft()
+
+
+def _assert_numeric(window: _Window, percentile: int) -> None:
+    """Assert the rolling statistics match calculating them from scratch."""
+    states = list(window.states)
+    ages = list(window.ages)
+    rolling = window.rolling
+    assert rolling.sum() == pytest.approx(sum(states))
+    assert rolling.mean() == statistics.mean(states)
+    assert rolling.median() == statistics.median(states)
+    assert states[rolling.max_index()] == max(states)
+    assert rolling.max_index() == states.index(max(states))
+    assert rolling.min_index() == states.index(min(states))
+    sin_sum, cos_sum = rolling.circular_sums()
+    assert sin_sum == pytest.approx(sum(math.sin(math.radians(x)) for x in states))
+    assert cos_sum == pytest.approx(sum(math.cos(math.radians(x)) for x in states))
+    if len(states) < 2:
+        return
+    assert rolling.variance() == statistics.variance(states)
+    assert rolling.standard_deviation() == pytest.approx(statistics.stdev(states))
+    assert (
+        rolling.percentile(percentile)
+        == statistics.quantiles(states, n=100, method="exclusive")[percentile - 1]
+    )
+    pairs = list(zip(states, states[1:], strict=False))
+    seconds = [(j - i).total_seconds() for i, j in zip(ages, ages[1:], strict=False)]
+    assert rolling.sum_differences() == pytest.approx(sum(abs(j - i) for i, j in pairs))
+    assert rolling.sum_differences_nonnegative() == pytest.approx(
+        sum((j - i if j >= i else j) for i, j in pairs)
+    )
+    assert rolling.area_linear() == pytest.approx(
+        sum(0.5 * (i + j) * s for (i, j), s in zip(pairs, seconds, strict=True))
+    )
+    assert rolling.area_step() == pytest.approx(
+        sum(i * s for (i, _), s in zip(pairs, seconds, strict=True))
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rolling_numeric(seed: int) -> None:
+    """Test the rolling statistics of a sliding window of numeric samples."""
+    random.seed(seed)
+    window = _Window(ALL_NUMERIC_TRACKERS)
+    for _ in range(300):
+        if window.states and random.random() < 0.4:
+            window.popleft()
+        else:
+            window.append(
+                random.choice(
+                    (
+                        round(random.uniform(-1000, 1000), random.randint(0, 3)),
+                        random.randint(-5, 5),
+                        1e16,
+                        0.1,
+                    )
+                )
+            )
+        if window.states:
+            _assert_numeric(window, random.randint(1, 99))
+
+
+def test_rolling_nonfinite() -> None:
+    """Test samples which are not finite are calculated from scratch."""
+    window = _Window(ALL_NUMERIC_TRACKERS)
+    for value in (1.0, 5.0, math.inf, 3.0):
+        window.append(value)
+    rolling = window.rolling
+    assert rolling.sum() == math.inf
+    assert rolling.mean() == math.inf
+    assert rolling.max_index() == 2
+    assert rolling.min_index() == 0
+    assert rolling.median() == 4.0
+    assert rolling.sum_differences() == math.inf
+
+    window.append(math.nan)
+    assert math.isnan(rolling.sum())
+
+    window.popleft()
+    window.popleft()
+    window.popleft()
+    window.popleft()
+    window.append(2.0)
+    # Only the nan sample is left besides finite samples
+    assert math.isnan(rolling.mean())
+
+    window.popleft()
+    assert rolling.sum() == 2.0
+    assert rolling.mean() == 2.0
+    assert rolling.max_index() == 0
+    assert rolling.min_index() == 0
+    assert rolling.median() == 2.0
+    window.append(4.0)
+    _assert_numeric(window, 50)
+
+
+def test_rolling_binary() -> None:
+    """Test the rolling statistics of binary samples."""
+    random.seed(0)
+    window = _Window({TRACK_COUNT_ON, TRACK_AREA_STEP})
+    for _ in range(200):
+        if window.states and random.random() < 0.4:
+            window.popleft()
+        else:
+            window.append(random.choice((True, False)))
+        states = list(window.states)
+        ages = list(window.ages)
+        assert window.rolling.count_on() == states.count(True)
+        assert window.rolling.area_step() == pytest.approx(
+            sum(
+                (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(states))
+                if states[i - 1] is True
+            )
+        )
+
+
+def test_rolling_only_configured_trackers() -> None:
+    """Test only the configured trackers are updated."""
+    window = _Window({TRACK_MAX})
+    for value in (3.0, 1.0, 2.0):
+        window.append(value)
+    rolling = window.rolling
+    assert rolling.max_index() == 0
+    assert rolling._sorted == []
+    assert rolling._min == deque()
+    window.popleft()
+    assert rolling.max_index() == 1
@@ -0,0 +1,33 @@
+"""Test template system health."""
+
+from homeassistant.components.template.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_template_system_health(hass: HomeAssistant) -> None:
+    """Test template system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "sensor": {
+                    "name": "Power",
+                    "state": "{{ states('sensor.source') }}",
+                }
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.source", "1", {"unit": "W"})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.source", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info == {"renders_skipped": 1, "render_cache_hit_rate": "25.0 %"}
@@ -1,8 +1,10 @@
 """Tests for WebSocket API commands."""
 
 import asyncio
+from collections.abc import Callable
 from copy import deepcopy
 import logging
+import time
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -11,12 +13,14 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import COMPRESSED_STATES_CACHE
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -1029,6 +1033,111 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_shared_initial_states(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the initial states of subscribe entities are shared and kept up to date."""
+
+    class CannotSerializeMe:
+        """Cannot serialize this."""
+
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set(
+        "light.cannot_serialize", "off", {"cannot_serialize": CannotSerializeMe()}
+    )
+
+    async def _async_subscribe(msg_id: int) -> dict[str, Any]:
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        await websocket_client.send_json(
+            {"id": msg_id + 1, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        unsubscribe_msg = await websocket_client.receive_json()
+        assert unsubscribe_msg["id"] == msg_id + 1
+        assert unsubscribe_msg["success"]
+        return msg["event"]["a"]
+
+    assert await _async_subscribe(1) == {
+        "light.one": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"},
+        "light.two": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+    }
+    assert "Unable to serialize to JSON" in caplog.text
+
+    hass.states.async_remove("light.cannot_serialize")
+    hass.states.async_set("light.one", "on", {"color": "blue"})
+    hass.states.async_set("light.three", "off")
+    await hass.async_block_till_done()
+    for msg_id in (3, 5):
+        assert await _async_subscribe(msg_id) == {
+            "light.one": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.two": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.three": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        }
+    joined = hass.data[COMPRESSED_STATES_CACHE].async_get_joined()
+    assert joined is hass.data[COMPRESSED_STATES_CACHE].async_get_joined()
+
+    hass.states.async_remove("light.two")
+    assert await _async_subscribe(7) == {
+        "light.one": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"},
+        "light.three": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+    }
+
+
+async def test_benchmark_subscribe_entities_shared_initial_states(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark subscribe entities with and without shared initial states.
+
+    50 subscriptions are made with 5000 states and one state change between
+    them, the mean latency of a subscription is recorded as test properties.
+    """
+    for index in range(5000):
+        hass.states.async_set(f"sensor.test_{index}", str(index), {"unit": "W"})
+    sent: list[Any] = []
+    connection = ActiveConnection(
+        logging.getLogger(__name__), hass, sent.append, hass_admin_user, Mock()
+    )
+    handler, schema = connection.handlers["subscribe_entities"]
+    subscriptions = 50
+    msgs = [
+        schema({"id": msg_id, "type": "subscribe_entities"})
+        for msg_id in range(subscriptions)
+    ]
+
+    def _subscribe() -> float:
+        start = time.perf_counter()
+        for msg in msgs:
+            hass.states.async_set("sensor.test_0", str(msg["id"]))
+            handler(hass, connection, msg)
+            connection.subscriptions.pop(msg["id"])()
+        return (time.perf_counter() - start) / subscriptions * 1000
+
+    with patch.object(
+        commands._CompressedStatesCache, "async_get_joined", return_value=None
+    ):
+        per_connection_ms = _subscribe()
+    per_connection_states = json_loads(sent[-1])["event"]["a"]
+    shared_ms = _subscribe()
+    shared_states = json_loads(sent[-1])["event"]["a"]
+
+    # A result and the initial states are sent for each subscription of both runs
+    assert len(sent) == subscriptions * 2 * 2
+    assert shared_states.keys() == per_connection_states.keys()
+    assert len(shared_states) == 5000
+    record_property("per_connection_ms", round(per_connection_ms, 2))
+    record_property("shared_ms", round(shared_ms, 2))
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
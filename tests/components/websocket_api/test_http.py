@@ -1,9 +1,12 @@
 """Test Websocket API http module."""
 
 import asyncio
+from collections.abc import Callable
 from datetime import timedelta
+import time
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -17,6 +20,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -451,6 +455,143 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+@pytest.mark.parametrize(
+    ("window_bits", "expected_window_bits"), [(12, 12), (9, 9), (1, 15), (16, 15)]
+)
+async def test_enable_deflate(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    window_bits: int,
+    expected_window_bits: int,
+) -> None:
+    """Test enabling deflate."""
+
+    @callback
+    @websocket_command({"type": "get_large_message"})
+    def get_large_message(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(
+            msg["id"], {f"sensor.test_{idx}": {"state": "on"} for idx in range(100)}
+        )
+
+    async_register_command(hass, get_large_message)
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_DEFLATE_MESSAGES: window_bits},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    decompressor = zlib.decompressobj(-expected_window_bits)
+    for id_ in (2, 3):
+        await websocket_client.send_json({"id": id_, "type": "get_large_message"})
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        message = decompressor.decompress(msg.data + b"\x00\x00\xff\xff")
+        assert len(msg.data) < len(message) / 5
+        response = json_loads(message)
+        assert response["id"] == id_
+        assert response["result"]["sensor.test_99"] == {"state": "on"}
+
+    # Small messages are not compressed
+    await websocket_client.send_json({"id": 4, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 4, "type": "pong"}
+
+    # Disable deflate again
+    await websocket_client.send_json(
+        {"id": 5, "type": "supported_features", "features": {}}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    await websocket_client.send_json({"id": 6, "type": "get_large_message"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["result"]["sensor.test_99"] == {"state": "on"}
+
+
+@pytest.mark.parametrize("window_bits", [9, 12, 15])
+async def test_benchmark_deflate(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    record_property: Callable[[str, object], None],
+    window_bits: int,
+) -> None:
+    """Benchmark deflate with the state changes of subscribe entities.
+
+    The size of the messages before and after compression and the time to
+    send and receive a message are recorded as test properties.
+    """
+
+    def _set_state(idx: int) -> None:
+        device = idx % 100
+        hass.states.async_set(
+            f"sensor.power_meter_{device}_power",
+            str(idx),
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "friendly_name": f"Power meter {device} Power",
+                "voltage": 230 + idx % 7,
+                "current": round(idx / 230, 3),
+                "power_factor": round(0.9 + idx % 10 / 100, 2),
+                "frequency": 50 + idx % 3 / 10,
+                "energy": round(idx * 1.5, 1),
+                "apparent_power": idx + 20,
+                "last_reading": f"reading {idx}",
+            },
+        )
+
+    for idx in range(100):
+        _set_state(idx)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_DEFLATE_MESSAGES: window_bits},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    msg = await websocket_client.receive()
+    decompressor = zlib.decompressobj(-window_bits)
+    decompressor.decompress(msg.data + b"\x00\x00\xff\xff")
+
+    messages = 1000
+    raw_bytes = compressed_bytes = 0
+    start = time.perf_counter()
+    for idx in range(100, 100 + messages):
+        _set_state(idx)
+        msg = await websocket_client.receive()
+        if msg.type is WSMsgType.TEXT:
+            message = msg.data.encode()
+            compressed_bytes += len(message)
+        else:
+            compressed_bytes += len(msg.data)
+            message = decompressor.decompress(msg.data + b"\x00\x00\xff\xff")
+        raw_bytes += len(message)
+    elapsed = time.perf_counter() - start
+
+    assert json_loads(message)["event"]["c"]["sensor.power_meter_99_power"]["+"][
+        "s"
+    ] == str(99 + messages)
+    record_property("raw_bytes_per_message", raw_bytes // messages)
+    record_property("compressed_bytes_per_message", compressed_bytes // messages)
+    record_property("us_per_message", round(elapsed / messages * 1e6, 1))
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -293,6 +293,32 @@ async def test_load_area(hass: HomeAssistant, area_registry: ar.AreaRegistry) ->
     assert area2_registry2.id == area2.id
 
 
+async def test_save_reuses_storage_fragments(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test only changed areas are serialized again when saving."""
+    area1 = area_registry.async_create("mock1")
+    area2 = area_registry.async_create("mock2")
+    await flush_store(area_registry._store)
+    fragment1 = area1.as_storage_fragment
+    fragment2 = area2.as_storage_fragment
+
+    area2 = area_registry.async_update(area2.id, icon="mdi:garage")
+    assert area_registry._data_to_save()["areas"] == [
+        fragment1,
+        area2.as_storage_fragment,
+    ]
+    assert area2.as_storage_fragment is not fragment2
+
+    await flush_store(area_registry._store)
+    assert [
+        (area["id"], area["icon"])
+        for area in hass_storage[ar.STORAGE_KEY]["data"]["areas"]
+    ] == [(area1.id, None), (area2.id, "mdi:garage")]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_loading_area_from_storage(
     hass: HomeAssistant, hass_storage: dict[str, Any]
@@ -21,6 +21,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.registry import LazyRegistryEntries
 from homeassistant.util.dt import utcnow
 
 from tests.common import (
@@ -236,6 +237,12 @@ async def test_loading_from_storage(
     registry = dr.async_get(hass)
     assert len(registry.devices) == 1
     assert len(registry.deleted_devices) == 1
+    # Devices are created from the stored data on first access
+    devices = registry.devices.data
+    assert isinstance(devices, LazyRegistryEntries)
+    assert devices.pending == 1
+    assert registry.async_get_device(identifiers={("serial", "123456ABCDEF")})
+    assert devices.pending == 0
 
     assert registry.deleted_devices["bcdefghijklmn"] == dr.DeletedDeviceEntry(
         config_entries={mock_config_entry.entry_id},
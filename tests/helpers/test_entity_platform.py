@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import threading
+import time
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -29,6 +31,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
     issue_registry as ir,
+    polling,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
@@ -79,6 +82,103 @@ async def test_polling_only_updates_entities_it_should_poll(
     assert poll_ent.async_update.called
 
 
+async def test_polling_is_staggered(hass: HomeAssistant) -> None:
+    """Test platforms which are set up at the same time poll at different times."""
+    interval = timedelta(seconds=30)
+    platforms = [
+        MockEntityPlatform(
+            hass, platform_name=f"platform_{idx}", scan_interval=interval
+        )
+        for idx in range(10)
+    ]
+    start = hass.loop.time()
+    for platform in platforms:
+        await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    first_polls = sorted(
+        platform._async_polling_timer.when() - start for platform in platforms
+    )
+    assert len(set(first_polls)) == 10
+    assert first_polls[0] >= 0
+    assert first_polls[-1] <= 30 + 1
+    # The platforms are spread over the whole scan interval
+    assert all(
+        later - earlier >= 1
+        for earlier, later in zip(first_polls, first_polls[1:], strict=False)
+    )
+    assert first_polls[-1] - first_polls[0] > 30 * 0.8
+
+
+async def test_polling_stats(hass: HomeAssistant) -> None:
+    """Test the duration and overruns of polls are recorded."""
+    platform = MockEntityPlatform(hass)
+    release = asyncio.Event()
+    update_started = asyncio.Event()
+
+    class SlowEntity(MockEntity):
+        """Mock entity with a slow update."""
+
+        async def async_update(self) -> None:
+            update_started.set()
+            await release.wait()
+
+    await platform.async_add_entities([SlowEntity(should_poll=True)])
+    stats = polling.async_get_polling_scheduler(hass).stats
+
+    poll = hass.async_create_task(platform._async_update_entity_states())
+    await update_started.wait()
+    await platform._async_update_entity_states()
+    release.set()
+    await poll
+
+    platform_stats = stats[f"{platform.domain}.{platform.platform_name}"]
+    assert platform_stats.polls == 1
+    assert platform_stats.overruns == 1
+    assert platform_stats.max_duration == platform_stats.last_duration > 0
+    assert platform_stats.as_dict() == {
+        "polls": 1,
+        "overruns": 1,
+        "last_duration": platform_stats.last_duration,
+        "max_duration": platform_stats.max_duration,
+        "average_duration": platform_stats.last_duration,
+    }
+
+
+async def test_executor_updates_budget(hass: HomeAssistant) -> None:
+    """Test updates in the executor are limited system wide."""
+    scheduler = polling.async_get_polling_scheduler(hass)
+    scheduler.executor_updates = asyncio.Semaphore(2)
+    lock = threading.Lock()
+    updating = 0
+    peak_update_count = 0
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self) -> None:
+            nonlocal updating, peak_update_count
+            with lock:
+                updating += 1
+                peak_update_count = max(peak_update_count, updating)
+            time.sleep(0.01)
+            with lock:
+                updating -= 1
+
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities(
+        [SyncEntity(should_poll=True, unique_id=str(idx)) for idx in range(8)]
+    )
+    platform.parallel_updates = None
+    platform._update_in_sequence = False
+    await platform._async_update_entity_states()
+    assert peak_update_count == 2
+
+    # Updates which are not polls are not held up by the budget
+    scheduler.executor_updates = asyncio.Semaphore(0)
+    await next(iter(platform.entities.values())).async_device_update()
+    assert peak_update_count == 2
+
+
 async def test_polling_check_works_if_entity_add_fails(
     hass: HomeAssistant,
 ) -> None:
@@ -19,6 +19,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import MaxLengthExceeded
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.registry import LazyRegistryEntries
 from homeassistant.util.dt import utc_from_timestamp
 
 from tests.common import (
@@ -580,6 +581,85 @@ async def test_load_bad_data(
     )
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_creates_entries_on_first_access(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test entries are created from the stored data when they are accessed."""
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": [
+                {
+                    "aliases": [],
+                    "area_id": "kitchen" if idx == 1 else None,
+                    "capabilities": None,
+                    "categories": {},
+                    "config_entry_id": "mock-entry",
+                    "created_at": "2024-02-14T12:00:00.900075+00:00",
+                    "device_class": None,
+                    "device_id": f"mock-device-{idx % 2}",
+                    "disabled_by": None,
+                    "entity_category": None,
+                    "entity_id": f"light.test_{idx}",
+                    "has_entity_name": False,
+                    "hidden_by": None,
+                    "icon": None,
+                    "id": f"id-{idx}",
+                    "labels": ["label"] if idx == 2 else [],
+                    "modified_at": "2024-02-14T12:00:00.900075+00:00",
+                    "name": None,
+                    "options": None,
+                    "original_device_class": None,
+                    "original_icon": None,
+                    "original_name": None,
+                    "platform": "hue",
+                    "previous_unique_id": None,
+                    "supported_features": 0,
+                    "translation_key": None,
+                    "unique_id": f"unique-{idx}",
+                    "unit_of_measurement": None,
+                }
+                for idx in range(4)
+            ],
+            "deleted_entities": [],
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    entries = registry.entities.data
+    assert isinstance(entries, LazyRegistryEntries)
+    assert len(registry.entities) == 4
+    assert entries.pending == 4
+
+    assert registry.async_get_entity_id("light", "hue", "unique-3") == "light.test_3"
+    assert "light.test_3" in registry.entities
+    assert entries.pending == 4
+
+    entry = registry.async_get("id-1")
+    assert entry.entity_id == "light.test_1"
+    assert entry.area_id == "kitchen"
+    assert registry.async_get("light.test_1") is entry
+    assert entries.pending == 3
+    assert entries.created == 1
+
+    assert [
+        entry.entity_id for entry in registry.entities.get_entries_for_label("label")
+    ] == ["light.test_2"]
+    assert [
+        entry.entity_id
+        for entry in registry.entities.get_entries_for_device_id("mock-device-1")
+    ] == ["light.test_1", "light.test_3"]
+    assert entries.pending == 1
+
+    registry.async_update_entity("light.test_0", new_entity_id="light.renamed")
+    assert entries.pending == 0
+    assert registry.async_get("id-0").entity_id == "light.renamed"
+    assert len(er.async_entries_for_config_entry(registry, "mock-entry")) == 4
+
+
 def test_async_get_entity_id(entity_registry: er.EntityRegistry) -> None:
     """Test that entity_id is returned."""
     entry = entity_registry.async_get_or_create("light", "hue", "1234")
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_wheel,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -50,7 +51,11 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    Template,
+    async_get_render_info_cache,
+    result_as_boolean,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1067,6 +1072,57 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_skips_unchanged_renders(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not rendered again if the states they use did not change."""
+    render_info_cache = async_get_render_info_cache(hass)
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_attribute = Template("{{ state_attr('sensor.test', 'unit') }}", hass)
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None), TrackTemplate(template_attribute, None)],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    assert render_info_cache.misses == 2
+
+    hass.states.async_set("sensor.test", "1", {"unit": "W"})
+    await hass.async_block_till_done()
+    assert runs == [(template_state, 1), (template_attribute, "W")]
+    assert render_info_cache.hits == 0
+    assert render_info_cache.misses == 4
+
+    # Only the template using the attribute is rendered
+    hass.states.async_set("sensor.test", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs[2:] == [(template_attribute, "kW")]
+    assert render_info_cache.hits == 1
+    assert render_info_cache.misses == 5
+
+    hass.states.async_set("sensor.test", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs[3:] == [(template_state, 2)]
+    assert render_info_cache.hits == 1
+    assert render_info_cache.misses == 7
+
+    # A forced refresh always renders
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert runs[4:] == []
+    assert render_info_cache.hits == 1
+    assert render_info_cache.misses == 9
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -3589,6 +3645,44 @@ async def test_track_time_interval(hass: HomeAssistant) -> None:
     assert len(specific_runs) == 2
 
 
+async def test_track_time_interval_tolerance(hass: HomeAssistant) -> None:
+    """Test tracking time intervals with a tolerance share loop handles."""
+    runs: list[int] = []
+    wheel = async_get_timer_wheel(hass)
+
+    utc_now = dt_util.utcnow()
+    unsubs = [
+        async_track_time_interval(
+            hass,
+            callback(lambda _, idx=idx: runs.append(idx)),
+            timedelta(seconds=30),
+            tolerance=timedelta(seconds=5),
+        )
+        for idx in range(100)
+    ]
+    assert wheel.timers == 100
+    assert wheel.buckets <= 2
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=29))
+    await hass.async_block_till_done()
+    assert runs == []
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=36))
+    await hass.async_block_till_done()
+    assert sorted(runs) == list(range(100))
+    assert wheel.wakeups <= 2
+    assert wheel.timers_fired == 100
+
+    for unsub in unsubs:
+        unsub()
+    assert wheel.timers == 0
+    assert wheel.buckets == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=70))
+    await hass.async_block_till_done()
+    assert len(runs) == 100
+
+
 async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
@@ -4443,6 +4537,33 @@ async def test_async_call_later_timedelta(hass: HomeAssistant) -> None:
     remove()
 
 
+async def test_async_call_later_tolerance(hass: HomeAssistant) -> None:
+    """Test calling an action later with a tolerance."""
+    calls: list[datetime] = []
+    wheel = async_get_timer_wheel(hass)
+
+    @callback
+    def action(now: datetime) -> None:
+        calls.append(now)
+
+    utc_now = dt_util.utcnow()
+    remove = async_call_later(hass, 10, action, tolerance=timedelta(seconds=2))
+    async_call_later(hass, 10.5, action, tolerance=timedelta(seconds=2))
+    assert wheel.timers == 2
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=9))
+    await hass.async_block_till_done()
+    assert calls == []
+
+    remove()
+    assert wheel.timers == 1
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=13))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert wheel.timers == 0
+
+
 async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
     """Test canceling a call_later action."""
     future = asyncio.get_running_loop().create_future()
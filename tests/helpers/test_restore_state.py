@@ -18,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -358,6 +359,71 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_only_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the states which changed are serialized again."""
+    extra_data = {"native_value": 1}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return a copy of the extra data."""
+            return RestoredExtraData(dict(extra_data))
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.entity_id = "input_boolean.b0"
+    extra_entity = MockRestoreEntity()
+    extra_entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity, extra_entity])
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b2": StoredState(State("input_boolean.b2", "off"), None, now),
+    }
+    await data.async_dump_states()
+    assert data.dump_stats.dumps == 1
+    assert data.dump_stats.last_states == 3
+    assert data.dump_stats.last_serialized == 3
+    written = hass_storage[STORAGE_KEY]["data"]
+
+    await data.async_dump_states()
+    assert data.dump_stats.last_states == 3
+    assert data.dump_stats.last_serialized == 0
+    assert hass_storage[STORAGE_KEY]["data"] == written
+
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert data.dump_stats.last_serialized == 1
+    extra_data["native_value"] = 2
+    await data.async_dump_states()
+    assert data.dump_stats.last_serialized == 1
+    assert data.dump_stats.dumps == 4
+    written = hass_storage[STORAGE_KEY]["data"]
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"], item["extra_data"])
+        for item in written
+    ] == [
+        ("input_boolean.b0", "off", None),
+        ("input_boolean.b1", "on", {"native_value": 2}),
+        ("input_boolean.b2", "off", None),
+    ]
+
+    # The last seen time of unchanged states is refreshed eventually
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=now + timedelta(days=1, minutes=1),
+    ):
+        await data.async_dump_states()
+    assert data.dump_stats.last_serialized == 2
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -1,9 +1,10 @@
 """Test service helpers."""
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 import io
+import time
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -38,6 +39,8 @@ from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
     service,
 )
 import homeassistant.helpers.config_validation as cv
@@ -46,6 +49,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -741,6 +745,135 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+async def test_target_index_follows_registry_updates(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test the target index is cleared when the registries are updated."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floor = floor_registry.async_create("Ground floor")
+    kitchen = area_registry.async_create("Kitchen", floor_id=floor.floor_id)
+    hall = area_registry.async_create("Hall")
+    label = label_registry.async_create("Lights")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    entity_registry.async_get_or_create("light", "test", "ceiling", device_id=device.id)
+    entity_registry.async_get_or_create(
+        "light", "test", "hall", suggested_object_id="hall"
+    )
+    index = service.async_get_target_index(hass)
+
+    async def _extract(**target: str) -> set[str]:
+        return await service.async_extract_entity_ids(
+            hass, ServiceCall("light", "turn_on", target)
+        )
+
+    assert await _extract(area_id=kitchen.id) == {"light.test_ceiling"}
+    assert await _extract(floor_id=floor.floor_id) == {"light.test_ceiling"}
+    hits = index.hits
+    assert await _extract(area_id=kitchen.id) == {"light.test_ceiling"}
+    assert index.hits > hits
+    assert await _extract(area_id=hall.id) == set()
+    assert await _extract(label_id=label.label_id) == set()
+
+    # An entity with its own area is not targeted by the area of its device
+    entity_registry.async_update_entity("light.test_ceiling", area_id=hall.id)
+    assert await _extract(area_id=kitchen.id) == set()
+    assert await _extract(device_id=device.id) == {"light.test_ceiling"}
+    assert await _extract(area_id=hall.id) == {"light.test_ceiling"}
+
+    entity_registry.async_update_entity("light.hall", labels={label.label_id})
+    assert await _extract(label_id=label.label_id) == {"light.hall"}
+    device_registry.async_update_device(device.id, labels={label.label_id})
+    assert await _extract(label_id=label.label_id) == {"light.hall"}
+    entity_registry.async_update_entity("light.test_ceiling", area_id=None)
+    assert await _extract(label_id=label.label_id) == {
+        "light.hall",
+        "light.test_ceiling",
+    }
+
+    area_registry.async_update(hall.id, floor_id=floor.floor_id)
+    entity_registry.async_update_entity("light.hall", area_id=hall.id)
+    assert await _extract(floor_id=floor.floor_id) == {
+        "light.hall",
+        "light.test_ceiling",
+    }
+
+    entity_registry.async_update_entity(
+        "light.hall", hidden_by=er.RegistryEntryHider.USER
+    )
+    assert await _extract(floor_id=floor.floor_id) == {"light.test_ceiling"}
+
+
+async def test_benchmark_target_index(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark resolving service targets with the target index.
+
+    200 areas on 10 floors, 1000 devices with 2 lights each and 20 labels
+    are registered. The time per call with an empty index, which walks the
+    registries, and with a filled index is recorded as test properties.
+    """
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floors = [floor_registry.async_create(f"Floor {idx}") for idx in range(10)]
+    areas = [
+        area_registry.async_create(f"Area {idx}", floor_id=floors[idx % 10].floor_id)
+        for idx in range(200)
+    ]
+    labels = [label_registry.async_create(f"Label {idx}") for idx in range(20)]
+    for idx in range(1000):
+        device = device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={("test", str(idx))},
+        )
+        device_registry.async_update_device(device.id, area_id=areas[idx % 200].id)
+        for light in range(2):
+            entity = entity_registry.async_get_or_create(
+                "light", "test", f"{idx}_{light}", device_id=device.id
+            )
+            entity_registry.async_update_entity(
+                entity.entity_id, labels={labels[(idx + light) % 20].label_id}
+            )
+    index = service.async_get_target_index(hass)
+    calls = 200
+
+    def _time_calls(target: dict[str, Any], expected: int, cleared: bool) -> float:
+        service_call = ServiceCall("light", "turn_on", target)
+        start = time.perf_counter()
+        for _ in range(calls):
+            if cleared:
+                index._async_clear()
+            selected = service.async_extract_referenced_entity_ids(hass, service_call)
+        elapsed = time.perf_counter() - start
+        assert len(selected.referenced | selected.indirectly_referenced) == expected
+        return round(elapsed / calls * 1e6, 1)
+
+    targets: dict[str, tuple[dict[str, Any], int]] = {
+        "area": ({"area_id": areas[0].id}, 10),
+        "5_areas": ({"area_id": [area.id for area in areas[:5]]}, 50),
+        "label": ({"label_id": labels[0].label_id}, 100),
+        "floor": ({"floor_id": floors[0].floor_id}, 200),
+    }
+    for name, (target, expected) in targets.items():
+        record_property(f"{name}_cold_us", _time_calls(target, expected, True))
+        record_property(f"{name}_warm_us", _time_calls(target, expected, False))
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
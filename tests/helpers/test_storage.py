@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import random
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1181,238 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+def _read_journal(path: str) -> list[Any]:
+    """Read the lines of the journal of a store."""
+    with open(f"{path}{storage.JOURNAL_SUFFIX}", encoding="utf8") as journal_file:
+        return [json.loads(line) for line in journal_file]
+
+
+def _read_snapshot(path: str) -> dict[str, Any]:
+    """Read the snapshot of a store."""
+    with open(path, encoding="utf8") as snapshot_file:
+        return json.load(snapshot_file)
+
+
+def _snapshot_header(path: str) -> dict[str, int]:
+    """Return the journal header of the snapshot of a store."""
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+@pytest.mark.parametrize("encoder", [None, JSONEncoder])
+async def test_journal_append_and_replay(
+    tmpdir: py.path.local,
+    caplog: pytest.LogCaptureFixture,
+    encoder: type[JSONEncoder] | None,
+) -> None:
+    """Test changes are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass,
+            MOCK_VERSION,
+            MOCK_KEY,
+            atomic_writes=True,
+            encoder=encoder,
+            journal=True,
+        )
+        items = [{"id": idx} for idx in range(100)]
+        await store.async_save({"items": items, "name": "first"})
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        journal = await hass.async_add_executor_job(_read_journal, store.path)
+        assert snapshot == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            "data": {"items": items, "name": "first"},
+        }
+        assert journal == [
+            await hass.async_add_executor_job(_snapshot_header, store.path)
+        ]
+
+        changed = [*items[:10], {"id": "new"}, *items[11:50], *items[51:], {"id": 100}]
+        await store.async_save({"items": changed, "name": "second"})
+        assert await hass.async_add_executor_job(_read_snapshot, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read_journal, store.path)
+        assert journal[1:] == [
+            {"k": "items", "op": "set", "i": 10, "v": {"id": "new"}},
+            {"k": "items", "op": "del", "i": 50, "n": 1},
+            {"k": "items", "op": "ins", "i": 99, "v": {"id": 100}},
+            {"k": "name", "op": "put", "v": "second"},
+        ]
+
+        # Saving the same objects again does not append to the journal
+        await store.async_save({"items": changed, "name": "second"})
+        assert await hass.async_add_executor_job(_read_journal, store.path) == journal
+
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {
+            "items": changed,
+            "name": "second",
+        }
+
+        # A record which was only written partially is ignored
+        def _append_torn_record() -> None:
+            with open(f"{store.path}{storage.JOURNAL_SUFFIX}", "ab") as journal_file:
+                journal_file.write(b'{"k":"items","op":"del","i":0')
+
+        await hass.async_add_executor_job(_append_torn_record)
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {
+            "items": changed,
+            "name": "second",
+        }
+        assert "Ignoring invalid record in journal" in caplog.text
+
+        # The first write of a store compacts the journal
+        await restarted_store.async_save({"items": items, "name": "third"})
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        assert snapshot["data"] == {"items": items, "name": "third"}
+        assert await hass.async_add_executor_job(_read_journal, store.path) == [
+            await hass.async_add_executor_job(_snapshot_header, store.path)
+        ]
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_stale_snapshot(tmpdir: py.path.local) -> None:
+    """Test a journal of another snapshot is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": [1, 2, 3]})
+        await store.async_save({"items": [1, 2, 3, 4]})
+
+        def _replace_header() -> None:
+            journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+            with open(journal_path, "rb") as journal_file:
+                lines = journal_file.read().split(b"\n")
+            lines[0] = json_bytes({"size": 0, "mtime": 0})
+            with open(journal_path, "wb") as journal_file:
+                journal_file.write(b"\n".join(lines))
+
+        await hass.async_add_executor_job(_replace_header)
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {"items": [1, 2, 3]}
+
+        # A store without a journal, like an older version, replaces the snapshot
+        journal_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await journal_store.async_save({"items": [1]})
+        await journal_store.async_save({"items": [1, 2]})
+        plain_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        await plain_store.async_save({"items": [5, 6, 7, 8]})
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {"items": [5, 6, 7, 8]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted when it grows and on the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx, "name": f"item {idx}"} for idx in range(20)]
+        await store.async_save({"items": items})
+        header = await hass.async_add_executor_job(_snapshot_header, store.path)
+        for idx in range(50):
+            items = [*items[1:], {"id": 20 + idx, "name": f"item {20 + idx}"}]
+            await store.async_save({"items": items})
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        journal = await hass.async_add_executor_job(_read_journal, store.path)
+        # The journal never grows larger than the snapshot
+        assert journal[0] != header
+        assert len(journal) < 50
+        assert journal[0] == await hass.async_add_executor_job(
+            _snapshot_header, store.path
+        )
+        assert snapshot["data"] != {"items": items}
+
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {"items": items}
+
+        store.async_delay_save(lambda: {"items": items[:1]}, 10)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        assert snapshot["data"] == {"items": items[:1]}
+        assert await hass.async_add_executor_job(_read_journal, store.path) == [
+            await hass.async_add_executor_job(_snapshot_header, store.path)
+        ]
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(
+            os.path.exists, f"{store.path}{storage.JOURNAL_SUFFIX}"
+        )
+
+        hass.set_state(CoreState.running)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_folded_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the snapshot without a pending write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": idx} for idx in range(20)]
+        await store.async_save({"items": items})
+        await store.async_save({"items": [*items, {"id": 20}]})
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        assert snapshot["data"] == {"items": items}
+
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        assert snapshot["data"] == {"items": [*items, {"id": 20}]}
+        assert await hass.async_add_executor_job(_read_journal, store.path) == [
+            await hass.async_add_executor_job(_snapshot_header, store.path)
+        ]
+        hass.set_state(CoreState.running)
+
+        # A journal replayed on load is folded as well
+        await store.async_save({"items": items})
+        await store.async_save({"items": items[:10]})
+        restarted_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await restarted_store.async_load() == {"items": items[:10]}
+        store._async_cleanup_final_write_listener()
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        snapshot = await hass.async_add_executor_job(_read_snapshot, store.path)
+        assert snapshot["data"] == {"items": items[:10]}
+
+        hass.set_state(CoreState.running)
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_journal_list_diff(seed: int) -> None:
+    """Test the records of the journal change a list into another list."""
+    rng = random.Random(seed)
+    old = [{"id": idx} for idx in range(50)]
+    for _ in range(50):
+        new = list(old)
+        for _ in range(rng.randint(1, 5)):
+            operation = rng.choice(("insert", "delete", "replace", "copy"))
+            idx = rng.randrange(len(new)) if new else 0
+            if operation == "insert" or not new:
+                new.insert(idx, {"id": rng.random()})
+            elif operation == "delete":
+                del new[idx]
+            elif operation == "replace":
+                new[idx] = {"id": rng.random()}
+            else:
+                new[idx] = dict(new[idx])
+        result = list(old)
+        for record in storage._diff_journal_list("items", old, new):
+            storage._apply_journal_record({"items": result}, record)
+        assert result == new
+        old = new
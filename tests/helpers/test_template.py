@@ -4910,6 +4910,84 @@ async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+async def test_async_render_to_info_full_state_entities(hass: HomeAssistant) -> None:
+    """Test entities of which more than the state is accessed are collected."""
+    for entity_id in ("sensor.a", "sensor.b", "sensor.c", "sensor.d"):
+        hass.states.async_set(entity_id, "1", {"unit": "W"})
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') }} {{ states.sensor.b.state }}"
+        " {{ state_attr('sensor.c', 'unit') }} {{ states.sensor.d.last_changed }}"
+        " {{ states('sensor.missing') }}",
+    )
+    assert info.entities == {
+        "sensor.a",
+        "sensor.b",
+        "sensor.c",
+        "sensor.d",
+        "sensor.missing",
+    }
+    assert info.full_state_entities == {"sensor.c", "sensor.d", "sensor.missing"}
+
+
+async def test_render_info_cache(hass: HomeAssistant) -> None:
+    """Test renders are cached by the states they depend on."""
+    render_info_cache = template.async_get_render_info_cache(hass)
+    hass.states.async_set("sensor.a", "1", {"unit": "W"})
+    tmp = template.Template("{{ states('sensor.a') }}", hass)
+    variables = {"x": 1}
+
+    info = render_info_cache.async_render_to_info(tmp, variables)
+    assert info.result() == 1
+    assert render_info_cache.async_render_to_info(tmp, variables) is info
+    assert (render_info_cache.hits, render_info_cache.misses) == (1, 1)
+
+    # Renders are cached by the values of the variables
+    assert render_info_cache.async_render_to_info(tmp, {"x": 1}) is info
+    render_info_cache.async_render_to_info(tmp, {"x": 2})
+    assert (render_info_cache.hits, render_info_cache.misses) == (2, 2)
+
+    hass.states.async_set("sensor.a", "1", {"unit": "kW"})
+    assert render_info_cache.async_render_to_info(tmp, variables) is info
+    hass.states.async_set("sensor.a", "2", {"unit": "kW"})
+    info = render_info_cache.async_render_to_info(tmp, variables)
+    assert info.result() == 2
+    assert (render_info_cache.hits, render_info_cache.misses) == (3, 3)
+
+    assert (
+        render_info_cache.async_render_to_info(tmp, variables, force=True) is not info
+    )
+    assert (render_info_cache.hits, render_info_cache.misses) == (3, 4)
+
+    # Renders depending on the time are not cached
+    tmp = template.Template("{{ states('sensor.a') }} {{ now() }}", hass)
+    info = render_info_cache.async_render_to_info(tmp, variables)
+    assert render_info_cache.async_render_to_info(tmp, variables) is not info
+
+    tmp = template.Template("{{ states('sensor.a') }}", hass)
+    info = render_info_cache.async_render_to_info(tmp, variables)
+    await template.async_load_custom_templates(hass)
+    assert render_info_cache.async_render_to_info(tmp, variables) is not info
+
+
+async def test_render_info_cache_unhashable_variables(hass: HomeAssistant) -> None:
+    """Test renders with unhashable variables are cached by identity."""
+    render_info_cache = template.async_get_render_info_cache(hass)
+    hass.states.async_set("sensor.a", "1")
+    tmp = template.Template("{{ states('sensor.a') }} {{ x }}", hass)
+
+    info = render_info_cache.async_render_to_info(tmp, {"x": [1]})
+    assert info.result() == "1 [1]"
+    # An equal variable which is another object is not the same render
+    assert render_info_cache.async_render_to_info(tmp, {"x": [1]}) is not info
+    assert (render_info_cache.hits, render_info_cache.misses) == (0, 2)
+
+    variable = [3]
+    info = render_info_cache.async_render_to_info(tmp, {"x": variable})
+    assert render_info_cache.async_render_to_info(tmp, {"x": variable}) is info
+    assert (render_info_cache.hits, render_info_cache.misses) == (1, 3)
+
+
 def test_jinja_namespace(hass: HomeAssistant) -> None:
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
@@ -1354,6 +1354,40 @@ async def test_bootstrap_dependency_not_found(
     assert "Unable to resolve dependencies for bad_integration" in caplog.text
 
 
+async def test_import_installed_integrations(hass: HomeAssistant) -> None:
+    """Test only integrations with installed requirements are imported ahead."""
+    integrations = {
+        domain: mock_integration(
+            hass,
+            MockModule(domain, requirements=requirements, dependencies=dependencies),
+        )
+        for domain, requirements, dependencies in (
+            ("installed", ["installed_pkg==1.0"], []),
+            ("missing", ["missing_pkg==1.0"], []),
+            ("depends_on_installed", [], ["installed"]),
+            ("depends_on_missing", [], ["missing"]),
+        )
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+
+    with (
+        patch(
+            "homeassistant.util.package.get_installed_versions",
+            return_value={"installed_pkg==1.0"},
+        ),
+        patch.object(loader, "async_import_integrations") as mock_import,
+    ):
+        await bootstrap._async_import_installed_integrations(
+            hass, {"installed_pkg==1.0", "missing_pkg==1.0"}, integrations
+        )
+
+    assert mock_import.call_args[0][1] == {
+        "installed": integrations["installed"],
+        "depends_on_installed": integrations["depends_on_installed"],
+    }
+
+
 async def test_pre_import_no_requirements(hass: HomeAssistant) -> None:
     """Test pre-imported and do not have any requirements."""
     pre_imports = [
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -1169,6 +1170,150 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test listening for events by key."""
+    calls = []
+
+    @ha.callback
+    def key_func(event_data):
+        """Return the key of the event data."""
+        return event_data.get("key")
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("listener", event.data["key"]))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock listener for all keys."""
+        calls.append(("match_all", event.data["key"]))
+
+    @ha.callback
+    def bad_listener(event):
+        """Mock listener which raises."""
+        raise ValueError("boom")
+
+    listeners = hass.bus.async_listeners().get("test", 0)
+    unsub_listener = hass.bus.async_listen_keyed("test", key_func, ["a", "b"], listener)
+    unsub_bad = hass.bus.async_listen_keyed("test", key_func, "b", bad_listener)
+    # All listeners of a key function share a listener on the bus
+    assert hass.bus.async_listeners()["test"] == listeners + 1
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {})
+    await hass.async_block_till_done()
+    assert calls == [("listener", "a"), ("listener", "b")]
+    assert "Error while dispatching event for b" in caplog.text
+
+    unsub_match_all = hass.bus.async_listen_keyed(
+        "test", key_func, MATCH_ALL, match_all_listener
+    )
+    calls.clear()
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {})
+    await hass.async_block_till_done()
+    assert calls == [("listener", "a"), ("match_all", "a"), ("match_all", "c")]
+
+    unsub_listener()
+    unsub_bad()
+    unsub_match_all()
+    assert hass.bus.async_listeners().get("test", 0) == listeners
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed("test", lambda data: None, "a", listener)
+
+
+async def test_eventbus_keyed_listener_dispatch_soon(hass: HomeAssistant) -> None:
+    """Test keyed listeners which run in the next event loop iteration."""
+    calls = []
+
+    @ha.callback
+    def key_func(event_data):
+        """Return the key of the event data."""
+        return event_data["key"]
+
+    @ha.callback
+    def listener(event):
+        """Mock listener which removes itself."""
+        calls.append(event.data["key"])
+        unsub()
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", key_func, "a", listener, dispatch_soon=True
+    )
+    hass.bus.async_fire("test", {"key": "a"})
+    assert calls == []
+    await asyncio.sleep(0)
+    assert calls == ["a"]
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert calls == ["a"]
+
+
+@pytest.mark.parametrize("listener_count", [1000, 10000])
+async def test_benchmark_eventbus_keyed_listeners(
+    hass: HomeAssistant,
+    record_property: Callable[[str, object], None],
+    listener_count: int,
+) -> None:
+    """Benchmark firing events to listeners of a single key each.
+
+    The cost per event of keyed listeners and of listeners with an event
+    filter is recorded as test properties.
+    """
+    events = 200
+    calls = 0
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Count the events."""
+        nonlocal calls
+        calls += 1
+
+    @ha.callback
+    def key_func(event_data: dict[str, Any]) -> str:
+        """Return the key of the event data."""
+        return event_data["key"]
+
+    def _make_filter(key: str) -> Callable[[dict[str, Any]], bool]:
+        @ha.callback
+        def _filter(event_data: dict[str, Any]) -> bool:
+            return event_data["key"] == key
+
+        return _filter
+
+    def _fire() -> float:
+        start = time.perf_counter()
+        for index in range(events):
+            hass.bus.async_fire_internal("test", {"key": str(index % listener_count)})
+        return (time.perf_counter() - start) / events * 1e6
+
+    unsubs = [
+        hass.bus.async_listen("test", listener, _make_filter(str(key)))
+        for key in range(listener_count)
+    ]
+    filtered = _fire()
+    for unsub in unsubs:
+        unsub()
+    assert calls == events
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", key_func, [str(key) for key in range(listener_count)], listener
+    )
+    keyed = _fire()
+    unsub()
+    assert calls == 2 * events
+
+    record_property("event_filter_us_per_event", round(filtered, 1))
+    record_property("keyed_us_per_event", round(keyed, 1))
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1470,6 +1615,62 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test async_snapshot method."""
+    empty = hass.states.async_snapshot()
+    assert len(empty) == 0
+    assert empty.all() == []
+    assert hass.states.async_snapshot() is empty
+
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.ceiling", "off", {})
+    hass.states.async_set("switch.ac", "off", {})
+    snapshot = hass.states.async_snapshot()
+    assert snapshot.version > empty.version
+    assert len(snapshot) == 3
+    assert snapshot["light.bowl"] is hass.states.get("light.bowl")
+    assert snapshot.get("light.unknown") is None
+    assert snapshot.get("sensor.unknown") is None
+    assert sorted(snapshot) == ["light.bowl", "light.ceiling", "switch.ac"]
+    assert set(snapshot.domains()) == {"light", "switch"}
+    assert list(snapshot.domain_entity_ids("switch")) == ["switch.ac"]
+    assert snapshot.domain_states("other") == ()
+    assert snapshot.domain_entity_ids("other") == ()
+    assert sorted(state.entity_id for state in snapshot.all("LIGHT")) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert snapshot.all(("switch", "other")) == [hass.states.get("switch.ac")]
+    assert len(snapshot.all()) == 3
+
+    # Reporting the same state does not create a new snapshot
+    hass.states.async_set("light.bowl", "on", {})
+    assert hass.states.async_snapshot() is snapshot
+
+    # Domains which did not change are shared with the previous snapshot
+    hass.states.async_set("light.bowl", "off", {})
+    hass.states.async_remove("switch.ac")
+    new_snapshot = hass.states.async_snapshot()
+    assert new_snapshot.version > snapshot.version
+    assert len(new_snapshot) == 2
+    assert "switch.ac" not in new_snapshot
+    assert new_snapshot["light.bowl"].state == "off"
+    assert new_snapshot["light.ceiling"] is snapshot["light.ceiling"]
+    assert list(new_snapshot.domains()) == ["light"]
+
+    # The previous snapshot is not modified
+    assert len(snapshot) == 3
+    assert snapshot["light.bowl"].state == "on"
+    assert "switch.ac" in snapshot
+
+    hass.states.async_set("sensor.temperature", "20", {})
+    latest = hass.states.async_snapshot()
+    assert latest.domain_states("light") is not None
+    assert latest._domains["light"] is new_snapshot._domains["light"]
+
+    assert await hass.async_add_executor_job(hass.states.snapshot) is latest
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
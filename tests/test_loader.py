@@ -1,10 +1,13 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from collections.abc import Callable
+import logging
 import os
 import pathlib
 import sys
 import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -19,7 +22,12 @@ from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_get_persistent_notifications,
+    flush_store,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -1999,3 +2007,171 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test built-in integrations are resolved from the manifest cache."""
+    with patch.object(loader, "MANIFEST_CACHE_ENABLED", True):
+        await loader.async_load_manifest_cache(hass)
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    integration = await loader.async_get_integration(hass, "hue")
+    assert manifest_cache.misses == 1
+    assert manifest_cache.hits == 0
+
+    await flush_store(manifest_cache._store)
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == loader.__version__
+    assert data["integrations"]["hue"]["manifest"]["domain"] == "hue"
+    assert "light.py" in data["integrations"]["hue"]["files"]
+
+    # Resolve the integration again as on the next start
+    del hass.data[loader.DATA_MANIFEST_CACHE]
+    hass.data[loader.DATA_INTEGRATIONS].pop("hue")
+    with patch.object(loader, "MANIFEST_CACHE_ENABLED", True):
+        await loader.async_load_manifest_cache(hass)
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        cached = await loader.async_get_integration(hass, "hue")
+    assert manifest_cache.hits == 1
+    assert manifest_cache.misses == 0
+    assert cached.manifest == integration.manifest
+    assert cached.file_path == integration.file_path
+    assert cached.pkg_path == integration.pkg_path
+    assert cached.platforms_exists(("light", "sensor", "nope")) == (
+        integration.platforms_exists(("light", "sensor", "nope"))
+    )
+    assert await cached.async_get_component() == hue
+
+
+async def test_manifest_cache_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifest cache of another version is not used."""
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": "2020.1.0",
+            "integrations": {
+                "hue": {"manifest": {"domain": "hue", "name": "Old"}, "files": []}
+            },
+        },
+    }
+    with patch.object(loader, "MANIFEST_CACHE_ENABLED", True):
+        await loader.async_load_manifest_cache(hass)
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    assert manifest_cache.integrations == {}
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name != "Old"
+    assert manifest_cache.misses == 1
+
+
+async def test_manifest_cache_disabled(hass: HomeAssistant) -> None:
+    """Test the manifest cache is not used for development versions."""
+    await loader.async_load_manifest_cache(hass)
+    assert loader.DATA_MANIFEST_CACHE not in hass.data
+
+
+async def test_import_integrations_in_dependency_order(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test components are imported after the components they depend on."""
+    integrations = {
+        domain: mock_integration(
+            hass,
+            MockModule(
+                domain,
+                dependencies=dependencies,
+                partial_manifest={"after_dependencies": after_dependencies},
+            ),
+        )
+        for domain, dependencies, after_dependencies in (
+            ("d", ["b", "c"], []),
+            ("b", ["a"], ["not_set_up"]),
+            ("c", [], ["a"]),
+            ("a", [], []),
+            # Circular after dependencies
+            ("e", [], ["f"]),
+            ("f", [], ["e"]),
+        )
+    }
+    imported: list[str] = []
+    importing: set[str] = set()
+
+    async def _mock_get_component(self: loader.Integration) -> None:
+        importing.add(self.domain)
+        assert len(importing) <= loader.MAX_PENDING_IMPORTS
+        for dependency in (*self.dependencies, *self.after_dependencies):
+            if dependency in integrations and {dependency, self.domain} != {"e", "f"}:
+                assert dependency in imported
+        await asyncio.sleep(0)
+        imported.append(self.domain)
+        importing.remove(self.domain)
+        if self.domain == "c":
+            raise ImportError
+
+    with (
+        patch.object(loader.Integration, "async_get_component", _mock_get_component),
+        caplog.at_level(logging.DEBUG, logger=loader.__name__),
+    ):
+        await loader.async_import_integrations(hass, integrations)
+    assert sorted(imported) == ["a", "b", "c", "d", "e", "f"]
+    assert "Unable to import c ahead of setup" in caplog.text
+
+
+def _builtin_domains() -> list[str]:
+    """Return the domains of the built-in integrations."""
+    components_path = pathlib.Path(hue.__file__).parent.parent
+    return [path.parent.name for path in components_path.glob("*/manifest.json")]
+
+
+async def test_benchmark_manifest_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark resolving the built-in integrations at startup."""
+    # Do not measure the capture of the log message and the stack
+    # of the future of every integration
+    caplog.set_level(logging.WARNING, logger=loader.__name__)
+    debug = hass.loop.get_debug()
+    hass.loop.set_debug(False)
+    domains = await hass.async_add_executor_job(_builtin_domains)
+    with patch.object(loader, "MANIFEST_CACHE_ENABLED", True):
+        await loader.async_load_manifest_cache(hass)
+    for domain in domains:
+        hass.data[loader.DATA_INTEGRATIONS].pop(domain, None)
+    start = time.perf_counter()
+    from_disk = await loader.async_get_integrations(hass, domains)
+    disk_time = time.perf_counter() - start
+    await flush_store(hass.data[loader.DATA_MANIFEST_CACHE]._store)
+
+    # Resolve the integrations again as on the next start
+    del hass.data[loader.DATA_MANIFEST_CACHE]
+    for domain in domains:
+        hass.data[loader.DATA_INTEGRATIONS].pop(domain)
+    with patch.object(loader, "MANIFEST_CACHE_ENABLED", True):
+        await loader.async_load_manifest_cache(hass)
+    start = time.perf_counter()
+    from_cache = await loader.async_get_integrations(hass, domains)
+    cache_time = time.perf_counter() - start
+    hass.loop.set_debug(debug)
+
+    assert hass.data[loader.DATA_MANIFEST_CACHE].hits == len(domains)
+    assert {
+        domain: integration.manifest
+        for domain, integration in from_cache.items()
+        if isinstance(integration, loader.Integration)
+    } == {
+        domain: integration.manifest
+        for domain, integration in from_disk.items()
+        if isinstance(integration, loader.Integration)
+    }
+    record_property("integrations", len(domains))
+    record_property("resolve_from_disk_ms", round(disk_time * 1000, 3))
+    record_property("resolve_from_cache_ms", round(cache_time * 1000, 3))
@@ -0,0 +1,120 @@
+"""Test the timer wheel."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.util.timer_wheel import TimerWheel
+
+
+async def test_timers_share_buckets() -> None:
+    """Test timers in the same slot share a loop handle."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[int] = []
+    now = loop.time()
+    for idx in range(100):
+        wheel.call_at(now + 0.01 + idx * 0.0001, 0.05, calls.append, idx)
+    assert wheel.timers == 100
+    assert wheel.buckets <= 2
+    handle = wheel.call_at(now + 0.02, 0.05, calls.append, 100)
+    assert handle.when() >= now + 0.02
+    assert handle.when() - (now + 0.02) <= 0.05
+
+    await asyncio.sleep(0.12)
+    assert calls == list(range(101))
+    assert wheel.timers == 0
+    assert wheel.buckets == 0
+    assert wheel.timers_fired == 101
+    assert 1 <= wheel.wakeups <= 2
+    assert wheel.wakeups_per_second > 0
+
+
+async def test_timers_fire_in_order_of_buckets() -> None:
+    """Test timers never fire early."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    fired: list[tuple[str, float]] = []
+    now = loop.time()
+    for name, delay in (("late", 0.09), ("early", 0.01), ("exact", 0.05)):
+        wheel.call_at(
+            now + delay,
+            0.02 if name != "exact" else 0,
+            lambda name=name: fired.append((name, loop.time())),
+        )
+    await asyncio.sleep(0.15)
+    assert [name for name, _ in fired] == ["early", "exact", "late"]
+    assert fired[0][1] >= now + 0.01
+    assert fired[1][1] >= now + 0.05
+    assert fired[2][1] >= now + 0.09
+
+
+async def test_cancel_timer() -> None:
+    """Test cancelling timers."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    now = loop.time()
+    first = wheel.call_at(now + 0.01, 0.05, calls.append, "first")
+    second = wheel.call_at(now + 0.01, 0.05, calls.append, "second")
+    assert wheel.buckets == 1
+    first.cancel()
+    first.cancel()
+    assert first.cancelled()
+    assert "cancelled" in repr(first)
+    assert wheel.buckets == 1
+    second.cancel()
+    # The loop handle is cancelled with the last timer of a bucket
+    assert wheel.buckets == 0
+    await asyncio.sleep(0.07)
+    assert calls == []
+    assert wheel.wakeups == 0
+
+
+async def test_cancel_timer_while_firing() -> None:
+    """Test cancelling a timer of the same bucket from a callback."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    now = loop.time()
+
+    def _cancel_second() -> None:
+        calls.append("first")
+        second.cancel()
+        # Timers scheduled while firing do not run with the current bucket
+        wheel.call_at(now, 0.05, calls.append, "third")
+
+    wheel.call_at(now + 0.01, 0.05, _cancel_second)
+    second = wheel.call_at(now + 0.01, 0.05, calls.append, "second")
+    await asyncio.sleep(0.07)
+    assert calls == ["first", "third"]
+
+
+async def test_exception_in_timer() -> None:
+    """Test an exception in a timer does not prevent the others from running."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    exception_handler = Mock()
+    loop.set_exception_handler(exception_handler)
+    now = loop.time()
+    try:
+        wheel.call_at(now, 0.05, Mock(side_effect=ValueError("boom")))
+        wheel.call_at(now, 0.05, calls.append, "second")
+        await asyncio.sleep(0.07)
+    finally:
+        loop.set_exception_handler(None)
+    assert calls == ["second"]
+    assert isinstance(exception_handler.call_args[0][1]["exception"], ValueError)
+
+
+@pytest.mark.parametrize("exception", [SystemExit, KeyboardInterrupt])
+def test_exit_in_timer(exception: type[BaseException]) -> None:
+    """Test exiting from a timer is not caught."""
+    loop = Mock()
+    wheel = TimerWheel(loop)
+    wheel.call_at(1, 0, Mock(side_effect=exception))
+    bucket_handler = loop.call_at.call_args[0]
+    with pytest.raises(exception):
+        bucket_handler[1](bucket_handler[2])